@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from .models import UserInferenceSession, AISummary
 from recommendations.models import Place
+from recommendations.serializers import latest_summary, summary_of
 from recommendations.services.google_service import get_photo_url
 
 class PlaceSerializer(serializers.ModelSerializer):
@@ -23,10 +24,16 @@ class PlaceSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['shop_id', 'created_date', 'modified_date']
     
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Place 목록 prefetch plan (가게 수와 관계없이 쿼리 2번)"""
+        return queryset.select_related('location').prefetch_related('emotions').annotate(
+            latest_infer_ai_summary=latest_summary(AISummary, 'place'),
+        )
+
     def get_ai_summary(self, obj):
         """Place와 연결된 AISummary 중 최신 하나 가져오기"""
-        summary = obj.infer_ai_summary.order_by("-created_date").first()
-        return summary.summary if summary else None
+        return summary_of(obj, 'latest_infer_ai_summary', obj.infer_ai_summary)
     
     def get_image_url(self, obj):
         if obj.photo_reference:
@@ -77,6 +84,11 @@ class UserInferenceSessionSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['session_id', 'user', 'created_at']
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """세션 목록 prefetch plan (세션 수와 관계없이 쿼리 3번)"""
+        return queryset.prefetch_related('selected_location', 'selected_emotions')
+
 class UserInferenceSessionCreateSerializer(serializers.ModelSerializer):
     """사용자 추론 세션 생성용 시리얼라이저"""
     selected_location = serializers.SerializerMethodField()
@@ -96,11 +108,11 @@ class UserInferenceSessionCreateSerializer(serializers.ModelSerializer):
     
     def validate(self, data):
         """전체 데이터 검증"""
-        # request.data에서 직접 값을 가져오기
-        request = self.context.get('request')
-        if request:
-            selected_location = request.data.get('selected_location')
-            selected_emotions = request.data.get('selected_emotions')
+        # 입력 데이터(request.data 또는 비동기 뷰의 JSON 본문)에서 직접 값을 가져오기
+        initial_data = getattr(self, 'initial_data', None)
+        if initial_data is not None:
+            selected_location = initial_data.get('selected_location')
+            selected_emotions = initial_data.get('selected_emotions')
             
             # 단일 정수값을 리스트로 변환
             if isinstance(selected_location, int):
@@ -146,10 +158,16 @@ class RecommendationResultSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['shop_id', 'created_date', 'modified_date']
     
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Place 목록 prefetch plan (가게 수와 관계없이 쿼리 2번)"""
+        return queryset.select_related('location').prefetch_related('emotions').annotate(
+            latest_infer_ai_summary=latest_summary(AISummary, 'place'),
+        )
+
     def get_ai_summary(self, obj):
         """Place와 연결된 AISummary 중 최신 하나 가져오기"""
-        summary = obj.infer_ai_summary.order_by("-created_date").first()
-        return summary.summary if summary else None
+        return summary_of(obj, 'latest_infer_ai_summary', obj.infer_ai_summary)
     
     def get_rec(self, obj):
         return 2 
@@ -1,50 +1,47 @@
-from openai import OpenAI
+from asgiref.sync import sync_to_async
 from django.conf import settings
+import asyncio
 import logging
-import requests
 from search.models import SearchShop
 from community.models import Emotion, Location
-from search.service.address import normalize_korean_address
-from search.service.summary_card import generate_summary_card, generate_emotion_tags
-from search.service.search import get_place_details, get_place_id
+from search.service.address import normalize_korean_address, anormalize_korean_address
+from search.service.summary_card import generate_place_cards, agenerate_place_cards, agenerate_place_card
+from search.service.search import get_place_details, get_place_id, aget_place_details
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+from recommendations.services import candidate_pool
 from recommendations.services.cache_service import CacheService
+from recommendations.services.google_client import get_json, aget_json
+from recommendations.services.gpt_client import chat, achat
 
 logger = logging.getLogger(__name__)
 
 def call_gpt_api(prompt, model="gpt-4o-mini"):
-    """GPT API 호출 함수 (캐싱 적용)"""
+    """GPT API 호출 함수 (캐싱 + 동시 요청 합치기, 24시간)"""
     try:
-        # 캐시에서 먼저 조회
-        import hashlib
-        cache_key = f"gpt_api:{hashlib.md5(prompt.encode()).hexdigest()}"
-        cached_result = CacheService.get_cached_result(cache_key)
-        if cached_result:
-            logger.info("캐시에서 GPT 응답 조회")
-            return cached_result
-        
-        client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        
-        response = client.chat.completions.create(
-            model=model,
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=800,
-            temperature=0.7
-        )
-        
-        result = response.choices[0].message.content.strip()
-        
-        # 결과를 캐시에 저장 (24시간)
-        CacheService.set_cached_result(cache_key, result, 86400)
-        
-        return result
+        def ask():
+            return chat(prompt, model=model, kind="inference_overall", max_tokens=800, temperature=0.7)
+
+        return CacheService.get_or_compute('gpt_api', {'prompt': prompt, 'model': model}, ask)
         
     except Exception as e:
         logger.error(f"GPT API 호출 실패: {str(e)}")
         return None
 
+
+async def acall_gpt_api(prompt, model="gpt-4o-mini"):
+    """call_gpt_api의 비동기 버전"""
+    try:
+        async def ask():
+            return await achat(prompt, model=model, kind="inference_overall", max_tokens=800, temperature=0.7)
+
+        return await CacheService.aget_or_compute('gpt_api', {'prompt': prompt, 'model': model}, ask)
+
+    except Exception as e:
+        logger.error(f"GPT API 호출 실패: {str(e)}")
+        return None
+
 def get_place_photo_url(photo_reference, max_width=400):
     """Google Places API로 가게 사진 URL 생성"""
     try:
@@ -63,196 +60,246 @@ def get_place_photo_url(photo_reference, max_width=400):
         logger.error(f"사진 URL 생성 실패: {str(e)}")
         return None
 
+def _location_search_params(query):
+    return {
+        'query': query,
+        'key': settings.GOOGLE_API_KEY,
+        'language': 'ko',
+        'region': 'kr',
+        'type': 'restaurant',
+    }
+
+
+# 평점 4.0+ 가게만 필터링 (더 엄격한 기준으로 생성 시간 단축)
+MIN_RATING = 3.6
+
+
+def _high_rated_places(data):
+    """Text Search 응답에서 기준 평점 이상 가게만 골라 평점순으로 정렬"""
+    high_rated_places = []
+    for place in data['results']:
+        if 'rating' in place and place['rating'] >= MIN_RATING:
+            # 사진 URL 생성
+            image_url = ""
+            photo_ref = ""
+            if 'photos' in place and place['photos']:
+                photo_ref = place['photos'][0]['photo_reference']
+                image_url = get_place_photo_url(photo_ref)
+
+            high_rated_places.append({
+                'place_id': place['place_id'],
+                'name': place['name'],
+                'rating': place['rating'],
+                'address': place.get('formatted_address', ''),
+                'types': place.get('types', []),
+                'photos': place.get('photos', []),
+                'photo_reference': photo_ref,  
+                'image_url': image_url,  # 최종 url이고, 있어도 무방
+                'price_level': place.get('price_level', 0),
+                'geometry': place.get('geometry', {}),
+                'user_ratings_total': place.get('user_ratings_total', 0)
+            })
+
+    # 평점순 정렬
+    high_rated_places.sort(key=lambda x: x['rating'], reverse=True)
+    return high_rated_places
+
+
 def get_google_places_by_location(location_name, max_results=8):
-    """Google Maps API로 특정 지역의 고평점 가게들 조회 (캐싱 적용)"""
+    """특정 지역의 고평점 가게들 조회 (후보 풀 우선, 없으면 Google Maps API + 캐싱 + 동시 요청 합치기)"""
     try:
-        # 캐시에서 먼저 조회
+        pooled = candidate_pool.search_results(location_name, list(candidate_pool.CATEGORY_QUERIES))
+        if pooled is not None:
+            return _high_rated_places(pooled)[:max_results]
+
         query = f"{location_name} 음식점 카페"
-        cached_results = CacheService.cache_google_places_search(query, location_name, ["restaurant"])
-        if cached_results:
-            logger.info(f"캐시에서 {location_name} 가게 목록 조회")
-            return cached_results[:max_results]
-        
-        # Google Places API - Text Search
-        url = "https://maps.googleapis.com/maps/api/place/textsearch/json"
-        
-        params = {
-            'query': query,
-            'key': settings.GOOGLE_API_KEY,
-            'language': 'ko',
-            'region': 'kr',
-            'type': 'restaurant',
-        }
-        
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        if data['status'] != 'OK':
-            logger.error(f"Google Places API 오류: {data['status']}")
-            return []
-        
-        # 평점 4.0+ 가게만 필터링 (더 엄격한 기준으로 생성 시간 단축)
-        min_rating = 3.6
-        high_rated_places = []
-        for place in data['results']:
-            if 'rating' in place and place['rating'] >= min_rating:
-                # 사진 URL 생성
-                image_url = ""
-                photo_ref = ""
-                if 'photos' in place and place['photos']:
-                    photo_ref = place['photos'][0]['photo_reference']
-                    image_url = get_place_photo_url(photo_ref)
-                
-                high_rated_places.append({
-                    'place_id': place['place_id'],
-                    'name': place['name'],
-                    'rating': place['rating'],
-                    'address': place.get('formatted_address', ''),
-                    'types': place.get('types', []),
-                    'photos': place.get('photos', []),
-                    'photo_reference': photo_ref,  
-                    'image_url': image_url,  # 최종 url이고, 있어도 무방
-                    'price_level': place.get('price_level', 0),
-                    'geometry': place.get('geometry', {}),
-                    'user_ratings_total': place.get('user_ratings_total', 0)
-                })
-        
-        # 평점순 정렬
-        high_rated_places.sort(key=lambda x: x['rating'], reverse=True)
-        
-        # 결과를 캐시에 저장
-        CacheService.set_google_places_search(query, location_name, ["restaurant"], high_rated_places)
-        
-        logger.info(f"{location_name}에서 평점 {min_rating}+ 가게 {len(high_rated_places)}개 발견")
+
+        def fetch():
+            # Google Places API - Text Search (재시도 후에도 실패하면 예외)
+            data = get_json("place/textsearch", _location_search_params(query))
+
+            # 오류 응답은 빈 리스트 → 캐시에 저장되지 않음
+            if data['status'] != 'OK':
+                logger.error(f"Google Places API 오류: {data['status']}")
+                return []
+
+            high_rated_places = _high_rated_places(data)
+            logger.info(f"{location_name}에서 평점 {MIN_RATING}+ 가게 {len(high_rated_places)}개 발견")
+            return high_rated_places
+
+        high_rated_places = CacheService.get_or_compute(
+            'google_places_search',
+            {'query': query, 'location': location_name, 'allowed_types': ["restaurant"]},
+            fetch,
+        )
         return high_rated_places[:max_results]
         
     except Exception as e:
         logger.error(f"Google Maps API 호출 실패: {str(e)}")
         return []
 
+
+async def aget_google_places_by_location(location_name, max_results=8):
+    """get_google_places_by_location의 비동기 버전"""
+    try:
+        pooled = await sync_to_async(candidate_pool.search_results)(location_name, list(candidate_pool.CATEGORY_QUERIES))
+        if pooled is not None:
+            return _high_rated_places(pooled)[:max_results]
+
+        query = f"{location_name} 음식점 카페"
+
+        async def fetch():
+            data = await aget_json("place/textsearch", _location_search_params(query))
+
+            if data['status'] != 'OK':
+                logger.error(f"Google Places API 오류: {data['status']}")
+                return []
+
+            high_rated_places = _high_rated_places(data)
+            logger.info(f"{location_name}에서 평점 {MIN_RATING}+ 가게 {len(high_rated_places)}개 발견")
+            return high_rated_places
+
+        high_rated_places = await CacheService.aget_or_compute(
+            'google_places_search',
+            {'query': query, 'location': location_name, 'allowed_types': ["restaurant"]},
+            fetch,
+        )
+        return high_rated_places[:max_results]
+
+    except Exception as e:
+        logger.error(f"Google Maps API 호출 실패: {str(e)}")
+        return []
+
+
+def _map_infer_status(place_details):
+    """search 앱에서 반환하는 status를 infer 앱의 status로 매핑"""
+    search_status = place_details.get('business_status')
+    if search_status == '운영중':
+        place_details['status'] = 'operating'
+    elif search_status == '폐업함':
+        place_details['status'] = 'closed'
+    elif search_status == '이전함':
+        place_details['status'] = 'moved'
+    else:
+        place_details['status'] = 'operating'  # 기본값
+    return place_details
+
+
 def get_place_details_with_reviews(place_id, place_name=None):
-    """Google Places API로 가게 상세 정보와 리뷰 조회 - search 앱 서비스 활용 (캐싱 적용)"""
+    """Google Places API로 가게 상세 정보와 리뷰 조회 - search 앱 서비스 활용 (캐싱 + 동시 요청 합치기)"""
     try:
-        # 캐시에서 먼저 조회
-        cached_details = CacheService.cache_google_place_details(place_id)
-        if cached_details:
-            logger.info(f"캐시에서 {place_id} 상세 정보 조회")
-            # search 앱에서 반환하는 status를 infer 앱의 status로 매핑
-            search_status = cached_details.get('business_status')
-            if search_status == '운영중':
-                cached_details['status'] = 'operating'
-            elif search_status == '폐업함':
-                cached_details['status'] = 'closed'
-            elif search_status == '이전함':
-                cached_details['status'] = 'moved'
-            else:
-                cached_details['status'] = 'operating'  # 기본값
-            return cached_details
-        
-        # search 앱의 get_place_details 함수 사용 (이전함 상태 처리 포함)
-        place_details = get_place_details(place_id, place_name)
-        
+        def fetch():
+            # search 앱의 get_place_details 함수 사용 (이전함 상태 처리 포함)
+            place_details = get_place_details(place_id, place_name)
+            return _map_infer_status(place_details) if place_details else None
+
+        place_details = CacheService.get_or_compute('google_place_details', {'place_id': place_id}, fetch)
         if not place_details:
             return None
-        
-        # search 앱에서 반환하는 status를 infer 앱의 status로 매핑
-        search_status = place_details.get('business_status')
-        if search_status == '운영중':
-            place_details['status'] = 'operating'
-        elif search_status == '폐업함':
-            place_details['status'] = 'closed'
-        elif search_status == '이전함':
-            place_details['status'] = 'moved'
-        else:
-            place_details['status'] = 'operating'  # 기본값
-        
-        # 결과를 캐시에 저장
-        CacheService.set_google_place_details(place_id, place_details)
-        
-        return place_details
+
+        return _map_infer_status(place_details)
         
     except Exception as e:
         logger.error(f"Place Details API 호출 실패: {str(e)}")
         return None
 
+
+async def aget_place_details_with_reviews(place_id, place_name=None):
+    """get_place_details_with_reviews의 비동기 버전"""
+    try:
+        async def fetch():
+            place_details = await aget_place_details(place_id, place_name)
+            return _map_infer_status(place_details) if place_details else None
+
+        place_details = await CacheService.aget_or_compute('google_place_details', {'place_id': place_id}, fetch)
+        if not place_details:
+            return None
+
+        return _map_infer_status(place_details)
+
+    except Exception as e:
+        logger.error(f"Place Details API 호출 실패: {str(e)}")
+        return None
+
+
+def _build_enriched_place(place_basic, place_details, normalized_address):
+    # 리뷰 데이터 추출
+    reviews = []
+    if 'reviews' in place_details:
+        for review in place_details['reviews'][:5]:  # 상위 5개 리뷰만
+            reviews.append({
+                'text': review.get('text', ''),
+                'rating': review.get('rating', 0),
+                'time': review.get('time', 0)
+            })
+    
+    # 사진 URL 처리 (place_basic에서 가져오기)
+    image_url = place_basic.get('image_url', '')
+    photo_reference = place_basic.get('photo_reference', '')
+    
+    # 운영 상태는 place_details에서 가져오기 (search 앱에서 이미 매핑됨)
+    status = place_details.get('status', 'operating')
+    
+    # 가게 정보 단순화
+    return {
+        'name': place_basic.get('name', ''),
+        'address': normalized_address,
+        'status': status,  # place_details에서 가져온 상태값 사용
+        'summary': '',
+        'emotion_tags': [],  # search 앱에서 생성된 감정 태그 사용
+        'google_rating': place_basic.get('rating', 0),
+        'place_id': place_basic.get('place_id', ''),
+        'types': place_basic.get('types', []),
+        'reviews': reviews,  # 실제 리뷰 데이터
+        'user_ratings_total': place_details.get('user_ratings_total', 0),
+        'image_url': image_url,  # 사진 URL 추가
+        'photo_reference': photo_reference
+    }
+
+
 def enrich_place_with_details(place_basic, place_details):
     """기본 정보와 상세 정보를 결합하여 가게 정보를 풍부하게 만듦"""
     try:
         # 주소 정규화 (search 앱 서비스 활용)
         normalized_address = normalize_korean_address(place_details.get('formatted_address', ''))
-        
-        # 리뷰 데이터 추출
-        reviews = []
-        if 'reviews' in place_details:
-            for review in place_details['reviews'][:5]:  # 상위 5개 리뷰만
-                reviews.append({
-                    'text': review.get('text', ''),
-                    'rating': review.get('rating', 0),
-                    'time': review.get('time', 0)
-                })
-        
-        # 사진 URL 처리 (place_basic에서 가져오기)
-        image_url = place_basic.get('image_url', '')
-        photo_reference = place_basic.get('photo_reference', '')
-        
-        # 운영 상태는 place_details에서 가져오기 (search 앱에서 이미 매핑됨)
-        status = place_details.get('status', 'operating')
-        
-        # 가게 정보 단순화
-        enriched_place = {
-            'name': place_basic.get('name', ''),
-            'address': normalized_address,
-            'status': status,  # place_details에서 가져온 상태값 사용
-            'summary': '',
-            'emotion_tags': [],  # search 앱에서 생성된 감정 태그 사용
-            'google_rating': place_basic.get('rating', 0),
-            'place_id': place_basic.get('place_id', ''),
-            'types': place_basic.get('types', []),
-            'reviews': reviews,  # 실제 리뷰 데이터
-            'user_ratings_total': place_details.get('user_ratings_total', 0),
-            'image_url': image_url,  # 사진 URL 추가
-            'photo_reference': photo_reference
-        }
-        
-        return enriched_place
+        return _build_enriched_place(place_basic, place_details, normalized_address)
         
     except Exception as e:
         logger.error(f"가게 정보 풍부화 중 오류: {e}")
         return place_basic
 
-def generate_gpt_emotion_based_recommendations(places, emotions, location):
-    """감정 기반 가게 추천 생성 - search 앱 서비스 활용 + 다양성 확보"""
+
+async def aenrich_place_with_details(place_basic, place_details):
+    """enrich_place_with_details의 비동기 버전"""
     try:
-        enriched_places = []
-        
-        for place in places:
-            # search 앱의 summary_card 서비스 활용
-            place_details = {
-                'name': place['name'],
-                'address': place['address'],
-                'rating': place.get('google_rating', 0)
-            }
-            
-            # 실제 리뷰 데이터 사용 (더 이상 가짜 데이터 아님)
-            reviews = []
-            if 'reviews' in place and place['reviews']:
-                reviews = [review.get('text', '') for review in place['reviews']]
-            else:
-                reviews = [f"평점: {place.get('google_rating', 0)}점"]
-            
-            # search 앱 서비스로 요약과 감정 태그 생성
-            summary = generate_summary_card(place_details, reviews, place.get('types', []))
-            emotion_tags = generate_emotion_tags(place['name'], place.get('reviews', []), place.get('types', []))
-            
-            # 가게 정보에 요약과 감정 태그 추가
-            place['summary'] = summary
-            place['emotion_tags'] = emotion_tags
-            enriched_places.append(place)
-        
-        # 다양성 확보를 위한 개선된 프롬프트
-        overall_prompt = f"""
+        normalized_address = await anormalize_korean_address(place_details.get('formatted_address', ''))
+        return _build_enriched_place(place_basic, place_details, normalized_address)
+
+    except Exception as e:
+        logger.error(f"가게 정보 풍부화 중 오류: {e}")
+        return place_basic
+
+
+def _summary_inputs(place):
+    """search 앱 summary_card 서비스에 넘길 (place_details, reviews, types)"""
+    place_details = {
+        'name': place['name'],
+        'address': place['address'],
+        'rating': place.get('google_rating', 0)
+    }
+
+    # 실제 리뷰 데이터 사용 (더 이상 가짜 데이터 아님)
+    if 'reviews' in place and place['reviews']:
+        reviews = [review.get('text', '') for review in place['reviews']]
+    else:
+        reviews = [f"평점: {place.get('google_rating', 0)}점"]
+
+    return place_details, reviews, place.get('types', [])
+
+
+def _overall_prompt(enriched_places, emotions, location):
+    # 다양성 확보를 위한 개선된 프롬프트
+    return f"""
         {location}에서 {', '.join(emotions)} 감정을 느낄 수 있는 가게들을 추천해드립니다.
         
         **추억의 가게 찾기 목적:**
@@ -283,8 +330,23 @@ def generate_gpt_emotion_based_recommendations(places, emotions, location):
         사용자가 자신의 추억 속 가게를 찾을 수 있도록 
         각 가게의 고유한 매력과 의미를 구체적이고 상세하게 설명해주세요.
         """
+
+
+def generate_gpt_emotion_based_recommendations(places, emotions, location):
+    """감정 기반 가게 추천 생성 - search 앱 서비스 활용 + 다양성 확보"""
+    try:
+        enriched_places = []
+        
+        # search 앱 서비스로 요약과 감정 태그 일괄 생성 (가게들을 묶어 GPT 1회)
+        cards = generate_place_cards([_summary_inputs(place) for place in places])
+
+        for place, card in zip(places, cards):
+            # 가게 정보에 요약과 감정 태그 추가
+            place['summary'] = card['summary']
+            place['emotion_tags'] = card['emotion_tags']
+            enriched_places.append(place)
         
-        overall_recommendation = call_gpt_api(overall_prompt)
+        overall_recommendation = call_gpt_api(_overall_prompt(enriched_places, emotions, location))
         
         return {
             'places': enriched_places,
@@ -295,19 +357,60 @@ def generate_gpt_emotion_based_recommendations(places, emotions, location):
         logger.error(f"GPT 추천 생성 중 오류: {e}")
         return None
 
+
+async def agenerate_gpt_emotion_based_recommendations(places, emotions, location):
+    """generate_gpt_emotion_based_recommendations의 비동기 버전"""
+    try:
+        cards = await agenerate_place_cards([_summary_inputs(place) for place in places])
+
+        enriched_places = []
+        for place, card in zip(places, cards):
+            place['summary'] = card['summary']
+            place['emotion_tags'] = card['emotion_tags']
+            enriched_places.append(place)
+
+        overall_recommendation = await acall_gpt_api(_overall_prompt(enriched_places, emotions, location))
+
+        return {
+            'places': enriched_places,
+            'overall_recommendation': overall_recommendation or f"{location}의 {', '.join(emotions)} 가게 추천이 완료되었습니다."
+        }
+
+    except Exception as e:
+        logger.error(f"GPT 추천 생성 중 오류: {e}")
+        return None
+
+
+def _load_selection(location_ids, emotion_ids):
+    """선택한 동네/감정 이름 리스트 (없으면 None)"""
+    locations = Location.objects.filter(pk__in=location_ids)
+    emotions = Emotion.objects.filter(pk__in=emotion_ids)
+
+    if not locations.exists() or not emotions.exists():
+        return None, None
+
+    return [location.name for location in locations], [emotion.name for emotion in emotions]
+
+
+def _inference_result(location_names, emotion_names, all_places, gpt_recommendations):
+    # 최종 결과 반환 (추천 결과 구조화)
+    return {
+        'location': ', '.join(location_names),  # 여러 동네명을 쉼표로 구분
+        'emotions': emotion_names,
+        'total_places_found': len(all_places),
+        'gpt_recommendation': gpt_recommendations['overall_recommendation'],
+        'top_places': gpt_recommendations['places']
+    }
+
+
 def get_inference_recommendations(location_ids, emotion_ids, max_results=10):  # location_id → location_ids로 변경
     """사용자 선택 기반 추천 시스템 메인 함수 - 추천 로직에 집중"""
     try:
         # 1. 동네와 감정 정보 가져오기
-        locations = Location.objects.filter(pk__in=location_ids)
-        emotions = Emotion.objects.filter(pk__in=emotion_ids)
-        
-        if not locations.exists() or not emotions.exists():
+        location_names, emotion_names = _load_selection(location_ids, emotion_ids)
+        if not location_names:
             return None, "동네 또는 감정 정보를 찾을 수 없습니다."
         
-        location_names = [location.name for location in locations]
-        emotion_names = [emotion.name for emotion in emotions]
-        
         # 2. 여러 동네에서 Google Maps API로 가게 조회
         all_places = []
         for location_name in location_names:
@@ -335,18 +438,108 @@ def get_inference_recommendations(location_ids, emotion_ids, max_results=10):  #
             return None, "GPT 추천 생성에 실패했습니다."
         
         # 5. 최종 결과 반환 (추천 결과 구조화)
-        return {
-            'location': ', '.join(location_names),  # 여러 동네명을 쉼표로 구분
-            'emotions': emotion_names,
-            'total_places_found': len(all_places),
-            'gpt_recommendation': gpt_recommendations['overall_recommendation'],
-            'top_places': gpt_recommendations['places']
-        }, None
+        return _inference_result(location_names, emotion_names, all_places, gpt_recommendations), None
         
     except Exception as e:
         logger.error(f"추천 시스템 실행 실패: {str(e)}")
         return None, f"추천 시스템 오류: {str(e)}"
 
+
+async def _aload_inference_places(location_ids, emotion_ids, max_results):
+    """선택한 동네/감정 이름과 동네별 가게 목록 조회 → (location_names, emotion_names, all_places), 오류 메시지"""
+    location_names, emotion_names = await sync_to_async(_load_selection)(location_ids, emotion_ids)
+    if not location_names:
+        return None, "동네 또는 감정 정보를 찾을 수 없습니다."
+
+    per_location = await asyncio.gather(*(
+        aget_google_places_by_location(location_name, max_results // len(location_names))
+        for location_name in location_names
+    ))
+    all_places = [place for places in per_location if places for place in places]
+
+    if not all_places:
+        return None, f"{', '.join(location_names)} 지역에서 가게를 찾을 수 없습니다."
+
+    return (location_names, emotion_names, all_places), None
+
+
+async def _aenrich_inference_place(place):
+    place_details = await aget_place_details_with_reviews(place['place_id'], place['name'])
+    return await aenrich_place_with_details(place, place_details)
+
+
+async def aget_inference_recommendations(location_ids, emotion_ids, max_results=10):
+    """get_inference_recommendations의 비동기 버전 (동네 조회/상세 보강을 동시에 진행)"""
+    try:
+        loaded, error_message = await _aload_inference_places(location_ids, emotion_ids, max_results)
+        if error_message:
+            return None, error_message
+        location_names, emotion_names, all_places = loaded
+
+        enriched_places = list(await asyncio.gather(*(_aenrich_inference_place(place) for place in all_places[:3])))
+
+        gpt_recommendations = await agenerate_gpt_emotion_based_recommendations(
+            enriched_places, emotion_names, ', '.join(location_names)
+        )
+
+        if not gpt_recommendations:
+            return None, "GPT 추천 생성에 실패했습니다."
+
+        return _inference_result(location_names, emotion_names, all_places, gpt_recommendations), None
+
+    except Exception as e:
+        logger.error(f"추천 시스템 실행 실패: {str(e)}")
+        return None, f"추천 시스템 오류: {str(e)}"
+
+
+async def astream_inference_recommendations(location_ids, emotion_ids, max_results=10):
+    """
+    aget_inference_recommendations의 스트리밍 버전 → (event, data, index) 비동기 이터레이터
+    - place: 상위 3개 가게를 동시에 보강, 요약/감정태그까지 완성되는 순서대로 (index는 추천 순위)
+    - recommendation: 마지막에 GPT 종합 추천 (_inference_result에서 top_places만 뺀 구조)
+    - error: 실패 메시지 (이후 이벤트 없음)
+    """
+    try:
+        loaded, error_message = await _aload_inference_places(location_ids, emotion_ids, max_results)
+        if error_message:
+            yield 'error', error_message, None
+            return
+        location_names, emotion_names, all_places = loaded
+
+        async def complete(index, place):
+            enriched = await _aenrich_inference_place(place)
+            # 다른 가게를 기다리지 않도록 가게별 카드 1회 호출 (일괄 생성과 같은 캐시 사용)
+            card = await agenerate_place_card(*_summary_inputs(enriched))
+            enriched['summary'] = card['summary']
+            enriched['emotion_tags'] = card['emotion_tags']
+            return index, enriched
+
+        tasks = [asyncio.ensure_future(complete(index, place)) for index, place in enumerate(all_places[:3])]
+        enriched_places = {}
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, enriched = await next_done
+                enriched_places[index] = enriched
+                yield 'place', enriched, index
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        location = ', '.join(location_names)
+        ordered = [enriched_places[index] for index in sorted(enriched_places)]
+        overall_recommendation = await acall_gpt_api(_overall_prompt(ordered, emotion_names, location))
+        result = _inference_result(location_names, emotion_names, all_places, {
+            'overall_recommendation': overall_recommendation or f"{location}의 {', '.join(emotion_names)} 가게 추천이 완료되었습니다.",
+            'places': ordered,
+        })
+        result.pop('top_places')
+        yield 'recommendation', result, None
+
+    except Exception as e:
+        logger.error(f"추천 시스템 실행 실패: {str(e)}")
+        yield 'error', f"추천 시스템 오류: {str(e)}", None
+
+
 def get_inference_recommendations_with_custom_rating(location_ids, emotion_ids, max_results=6):
     """사용자가 결과 수를 조정할 수 있는 버전"""
     return get_inference_recommendations(location_ids, emotion_ids, max_results)
@@ -9,6 +9,8 @@ urlpatterns = [
     
     # 추론 세션 생성 및 GPT 추천
     path('create-session/', views.create_inference_session, name='create-inference-session'),
+    path('create-session/async/', views.create_inference_session_async, name='create-inference-session-async'),  # ASGI 비동기 버전
+    path('create-session/stream/', views.create_inference_session_stream, name='create-inference-session-stream'),  # 스트리밍 버전 (SSE/NDJSON)
     
     # 특정 추론 세션 조회
     path('session/<int:session_id>/', views.get_inference_session, name='get-inference-session'),
@@ -1,3 +1,6 @@
+import json
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
 from django.shortcuts import render
 from rest_framework import status, generics
 from rest_framework.decorators import api_view, permission_classes
@@ -9,10 +12,12 @@ from .serializers import (
     UserInferenceSessionCreateSerializer,
     RecommendationResultSerializer
 )
-from .services import get_inference_recommendations
+from .services import get_inference_recommendations, aget_inference_recommendations, astream_inference_recommendations
 from community.models import Emotion, Location
 from recommendations.models import SavedPlace, Place
 from recommendations.services.google_service import get_photo_url
+from recommendations.services import tracing
+from recommendations.services.streaming import streaming_response
 import time
 import logging
 
@@ -42,6 +47,124 @@ def get_inference_options(request):
             'error': f'옵션 조회에 실패했습니다: {str(e)}'
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+def _excluded_shop_ids(user_id):
+    """감정보관함 제외: user_id가 있으면 추천2로 저장한 가게 shop_id 목록"""
+    if not user_id:
+        return []
+    return list(SavedPlace.objects.filter(
+        user_id=user_id, rec=2
+    ).values_list("shop_id", flat=True))
+
+
+def _create_inference_session(request, location_id, emotion_ids):
+    logger.info("=== 세션 저장 시작 ===")
+    session = UserInferenceSession.objects.create(
+        user=request.user if request.user.is_authenticated else None
+    )
+    # ManyToManyField 설정
+    session.selected_location.set(location_id)
+    session.selected_emotions.set(emotion_ids)
+    logger.info(f"세션 저장 완료: {session.session_id}")
+    return session
+
+
+def _save_inference_place(place_data, user_id, location_id, saved_shop_ids):
+    """추천 가게 1개를 Place/AISummary로 저장 → 응답용 dict (감정보관함에 있거나 place_id가 없으면 None)"""
+    place_id = place_data.get("place_id")
+    if not place_id:
+        print(f"[DEBUG] place_id 없음, skip: {place_data}")
+        return None  # place 정의 안 된 상태로 내려가지 않도록 안전 처리
+
+    place, created = Place.objects.get_or_create(
+        google_place_id=place_id,
+        defaults={
+            "name": place_data.get("name", ""),
+            "address": place_data.get("address", ""),
+            "photo_reference": place_data.get("photo_reference", ""),
+            "location_id": location_id[0],
+            "status": place_data.get("status", "operating"),
+        }
+    )
+
+    # 감정 태그 설정
+    if 'emotion_tags' in place_data and place_data['emotion_tags']:
+        # 감정 태그가 문자열 리스트로 오는 경우를 처리
+        emotion_names = place_data['emotion_tags']
+        print(f"[DEBUG] 감정 태그 설정 시작: {emotion_names}")
+
+        if isinstance(emotion_names, list):
+            # 감정 이름으로 감정 객체 찾기
+            emotions = Emotion.objects.filter(name__in=emotion_names)
+            print(f"[DEBUG] DB에서 찾은 감정 객체: {emotions}")
+            print(f"[DEBUG] 감정 객체 수: {emotions.count()}")
+
+            if emotions.exists():
+                place.emotions.set(emotions)
+                print(f"[DEBUG] 감정 태그 설정 완료: {[e.name for e in emotions]}")
+            else:
+                print(f"[DEBUG] 감정 태그를 찾을 수 없음: {emotion_names}")
+                # DB에 없는 감정태그는 새로 생성하거나, 기본 감정태그 사용
+                # recommendations와 동일한 방식으로 처리
+                fallback_emotions = Emotion.objects.filter(name__in=['정겨움', '편안함', '조용함'])
+                if fallback_emotions.exists():
+                    place.emotions.set(fallback_emotions)
+                    print(f"[DEBUG] fallback 감정 태그 설정: {[e.name for e in fallback_emotions]}")
+                else:
+                    print(f"[DEBUG] fallback 감정 태그도 설정 실패")
+
+
+    ai_summary = None 
+    if created:
+        ai_summary = AISummary.objects.create(
+            place=place,
+            summary=place_data.get('summary', '')
+        )
+    else:
+        ai_summary = place.infer_ai_summary.order_by("-created_date").first()
+
+    ai_summary_text = ai_summary.summary if ai_summary else place_data.get('summary', '')
+
+    # 감정보관함에 이미 있으면 skip
+    if user_id and place.shop_id in saved_shop_ids:
+        return None
+
+    # recommendations와 동일한 구조로 데이터 구성
+    return {
+        'shop_id': place.shop_id,
+        'name': place.name,
+        'address': place.address,
+        'rec': 2,
+        'emotions': [emotion.name for emotion in place.emotions.all()],  # Place 모델의 emotions 필드 사용
+        'location': place.location.name,  # Place 모델의 location 필드 사용
+        'ai_summary': ai_summary.summary,
+        'image_url': get_photo_url(place.photo_reference) if place.photo_reference else None,
+        'status': place.get_status_display(),  # status 필드 추가 (한글 표시)
+        'created_date': place.created_date.isoformat(),
+        'modified_date': place.modified_date.isoformat()
+    }
+
+
+def _save_inference_results(request, user_id, location_id, emotion_ids, recommendations):
+    """추론 세션과 추천 가게(Place/AISummary) 저장 → 응답용 places 배열"""
+    with tracing.span("db:save_inference_results", places=len(recommendations['top_places'])):
+        saved_shop_ids = _excluded_shop_ids(user_id)
+        
+        # 4. 세션 저장
+        _create_inference_session(request, location_id, emotion_ids)
+        
+        # 5. 새로운 모델 구조로 데이터 저장
+        logger.info("=== 새로운 모델 구조로 데이터 저장 ===")
+        saved_places = []
+        
+        for place_data in recommendations['top_places']:
+            saved_place = _save_inference_place(place_data, user_id, location_id, saved_shop_ids)
+            if saved_place:
+                saved_places.append(saved_place)
+    
+    logger.info(f"데이터 저장 완료: {len(saved_places)}개 장소")
+    return saved_places
+
+
 @api_view(['POST'])
 @permission_classes([AllowAny])
 def create_inference_session(request):
@@ -84,102 +207,8 @@ def create_inference_session(request):
         
         logger.info(f"추천 시스템 성공: {len(recommendations.get('top_places', []))}개 가게")
 
-        # 감정보관함 제외: user_id가 있으면 SavedPlace 필터링
-        saved_shop_ids = []
-        if user_id:
-            saved_shop_ids = SavedPlace.objects.filter(
-                user_id=user_id, rec=2
-            ).values_list("shop_id", flat=True)
-        
-        # 4. 세션 저장
-        logger.info("=== 세션 저장 시작 ===")
-        session = UserInferenceSession.objects.create(
-            user=request.user if request.user.is_authenticated else None
-        )
-        # ManyToManyField 설정
-        session.selected_location.set(location_id)
-        session.selected_emotions.set(emotion_ids)
-        logger.info(f"세션 저장 완료: {session.session_id}")
-        
-        # 5. 새로운 모델 구조로 데이터 저장
-        logger.info("=== 새로운 모델 구조로 데이터 저장 ===")
-        saved_places = []
-        
-        for place_data in recommendations['top_places']:
-            place_id = place_data.get("place_id")
-            if not place_id:
-                print(f"[DEBUG] place_id 없음, skip: {place_data}")
-                continue  # place 정의 안 된 상태로 내려가지 않도록 안전 처리
-
-            place, created = Place.objects.get_or_create(
-                google_place_id=place_id,
-                defaults={
-                    "name": place_data.get("name", ""),
-                    "address": place_data.get("address", ""),
-                    "photo_reference": place_data.get("photo_reference", ""),
-                    "location_id": location_id[0],
-                    "status": place_data.get("status", "operating"),
-                }
-            )
-            
-            # 감정 태그 설정
-            if 'emotion_tags' in place_data and place_data['emotion_tags']:
-                # 감정 태그가 문자열 리스트로 오는 경우를 처리
-                emotion_names = place_data['emotion_tags']
-                print(f"[DEBUG] 감정 태그 설정 시작: {emotion_names}")
-                
-                if isinstance(emotion_names, list):
-                    # 감정 이름으로 감정 객체 찾기
-                    emotions = Emotion.objects.filter(name__in=emotion_names)
-                    print(f"[DEBUG] DB에서 찾은 감정 객체: {emotions}")
-                    print(f"[DEBUG] 감정 객체 수: {emotions.count()}")
-                    
-                    if emotions.exists():
-                        place.emotions.set(emotions)
-                        print(f"[DEBUG] 감정 태그 설정 완료: {[e.name for e in emotions]}")
-                    else:
-                        print(f"[DEBUG] 감정 태그를 찾을 수 없음: {emotion_names}")
-                        # DB에 없는 감정태그는 새로 생성하거나, 기본 감정태그 사용
-                        # recommendations와 동일한 방식으로 처리
-                        fallback_emotions = Emotion.objects.filter(name__in=['정겨움', '편안함', '조용함'])
-                        if fallback_emotions.exists():
-                            place.emotions.set(fallback_emotions)
-                            print(f"[DEBUG] fallback 감정 태그 설정: {[e.name for e in fallback_emotions]}")
-                        else:
-                            print(f"[DEBUG] fallback 감정 태그도 설정 실패")
-            
-
-            ai_summary = None 
-            if created:
-                ai_summary = AISummary.objects.create(
-                    place=place,
-                    summary=place_data.get('summary', '')
-                )
-            else:
-                ai_summary = place.infer_ai_summary.order_by("-created_date").first()
-
-            ai_summary_text = ai_summary.summary if ai_summary else place_data.get('summary', '')
-
-            # 감정보관함에 이미 있으면 skip
-            if user_id and place.shop_id in saved_shop_ids:
-                continue
-            
-            # recommendations와 동일한 구조로 데이터 구성
-            saved_places.append({
-                'shop_id': place.shop_id,
-                'name': place.name,
-                'address': place.address,
-                'rec': 2,
-                'emotions': [emotion.name for emotion in place.emotions.all()],  # Place 모델의 emotions 필드 사용
-                'location': place.location.name,  # Place 모델의 location 필드 사용
-                'ai_summary': ai_summary.summary,
-                'image_url': get_photo_url(place.photo_reference) if place.photo_reference else None,
-                'status': place.get_status_display(),  # status 필드 추가 (한글 표시)
-                'created_date': place.created_date.isoformat(),
-                'modified_date': place.modified_date.isoformat()
-            })
-        
-        logger.info(f"데이터 저장 완료: {len(saved_places)}개 장소")
+        # 4~5. 세션 + 추천 가게 저장
+        saved_places = _save_inference_results(request, user_id, location_id, emotion_ids, recommendations)
         
         # 6. 응답 데이터 구성 - 프론트가 기대하는 구조 (places 배열만)
         logger.info("=== 응답 데이터 구성 ===")
@@ -203,12 +232,107 @@ def create_inference_session(request):
             'error': f'추론 세션 생성에 실패했습니다: {str(e)}'
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+
+async def create_inference_session_async(request):
+    """create_inference_session의 비동기(ASGI) 버전 - 요청/응답 형식 동일"""
+    start_time = time.time()
+    if request.method != "POST":
+        return JsonResponse({'error': 'POST 요청만 지원합니다.'}, status=405, json_dumps_params={'ensure_ascii': False})
+
+    try:
+        data = json.loads(request.body or b"{}")
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'JSON 형식이 올바르지 않습니다.'}, status=400, json_dumps_params={'ensure_ascii': False})
+
+    try:
+        user_id = data.get("user_id", None)
+
+        serializer = UserInferenceSessionCreateSerializer(data=data)
+        if not serializer.is_valid():
+            return JsonResponse({
+                'error': '입력 데이터가 올바르지 않습니다.',
+                'details': serializer.errors
+            }, status=400, json_dumps_params={'ensure_ascii': False})
+
+        location_id = serializer.validated_data['selected_location']
+        emotion_ids = serializer.validated_data['selected_emotions']
+
+        recommendations, error_message = await aget_inference_recommendations(location_id, emotion_ids)
+        if error_message:
+            return JsonResponse({'error': error_message}, status=400, json_dumps_params={'ensure_ascii': False})
+
+        saved_places = await sync_to_async(_save_inference_results)(
+            request, user_id, location_id, emotion_ids, recommendations
+        )
+
+        execution_time = time.time() - start_time
+        logger.info(f"=== 추론 세션 생성 완료(async): {execution_time:.2f}초 ===")
+
+        return JsonResponse(saved_places, status=201, safe=False, json_dumps_params={'ensure_ascii': False})
+
+    except Exception as e:
+        logger.exception(f"추론 세션 생성 실패(async): {e}")
+        return JsonResponse({
+            'error': f'추론 세션 생성에 실패했습니다: {str(e)}'
+        }, status=500, json_dumps_params={'ensure_ascii': False})
+
+async def create_inference_session_stream(request):
+    """
+    create_inference_session의 스트리밍 버전 (SSE 기본, ?stream=ndjson 또는 Accept: application/x-ndjson 이면 NDJSON)
+    - 가게가 완성·저장되는 대로 place 이벤트 전송 (data는 create_inference_session 응답 배열의 원소, id는 추천 순위)
+    - 마지막에 recommendation 이벤트(GPT 종합 추천 gpt_recommendation 등), 실패 시 error 이벤트
+    """
+    if request.method != "POST":
+        return JsonResponse({'error': 'POST 요청만 지원합니다.'}, status=405, json_dumps_params={'ensure_ascii': False})
+
+    try:
+        data = json.loads(request.body or b"{}")
+    except json.JSONDecodeError:
+        return JsonResponse({'error': 'JSON 형식이 올바르지 않습니다.'}, status=400, json_dumps_params={'ensure_ascii': False})
+
+    user_id = data.get("user_id", None)
+    serializer = UserInferenceSessionCreateSerializer(data=data)
+    if not await sync_to_async(serializer.is_valid)():
+        return JsonResponse({
+            'error': '입력 데이터가 올바르지 않습니다.',
+            'details': serializer.errors
+        }, status=400, json_dumps_params={'ensure_ascii': False})
+
+    location_id = serializer.validated_data['selected_location']
+    emotion_ids = serializer.validated_data['selected_emotions']
+
+    async def events():
+        try:
+            saved_shop_ids = await sync_to_async(_excluded_shop_ids)(user_id)
+            session = None
+
+            async for event, payload, index in astream_inference_recommendations(location_id, emotion_ids):
+                if event == 'error':
+                    yield 'error', {'error': payload}, None
+                    return
+
+                if event == 'place':
+                    # 세션은 첫 가게가 나온 뒤에 저장 (추천 실패 시 세션을 남기지 않는 기존 동작 유지)
+                    if session is None:
+                        session = await sync_to_async(_create_inference_session)(request, location_id, emotion_ids)
+                    saved_place = await sync_to_async(_save_inference_place)(payload, user_id, location_id, saved_shop_ids)
+                    if saved_place:
+                        yield 'place', saved_place, index
+                else:
+                    yield event, payload, index
+
+        except Exception as e:
+            logger.exception(f"추론 세션 생성 실패(stream): {e}")
+            yield 'error', {'error': f'추론 세션 생성에 실패했습니다: {str(e)}'}, None
+
+    return streaming_response(request, events())
+
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def get_inference_session(request, session_id):
     """특정 추론 세션 조회"""
     try:
-        session = UserInferenceSession.objects.get(pk=session_id)
+        session = UserInferenceSessionSerializer.setup_eager_loading(UserInferenceSession.objects.all()).get(pk=session_id)
         serializer = UserInferenceSessionSerializer(session)
         
         return Response({
@@ -235,7 +359,9 @@ def get_user_inference_history(request):
                 'error': '로그인이 필요합니다.'
             }, status=status.HTTP_401_UNAUTHORIZED)
         
-        sessions = UserInferenceSession.objects.filter(user=request.user).order_by('-created_at')
+        sessions = UserInferenceSessionSerializer.setup_eager_loading(
+            UserInferenceSession.objects.filter(user=request.user)
+        ).order_by('-created_at')
         serializer = UserInferenceSessionSerializer(sessions, many=True)
         
         return Response({
@@ -25,6 +25,11 @@ class BookmarkSerializer(serializers.ModelSerializer):
         model = Bookmark
         fields = ["memory_id", "images"]
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """북마크 목록 prefetch plan (북마크 수와 관계없이 쿼리 2번)"""
+        return queryset.select_related("memory").prefetch_related("memory__images")
+
     def get_images(self, obj):
         return [image.image_url for image in obj.memory.images.all()]
     # 북마크된 커뮤니티 게시글(memory)에 연결된 이미지들의 url만 추출
@@ -54,6 +59,11 @@ class SavedPlaceSerializer(serializers.ModelSerializer):
             "status"
         ]
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """저장 가게 목록 prefetch plan (저장 수와 관계없이 쿼리 2번)"""
+        return queryset.select_related("shop").prefetch_related("shop__emotions")
+
     # 우선 추천 1은 운영중 뜨도록 함
     def get_status(self, obj):
         return "운영중"
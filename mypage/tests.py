@@ -1,3 +1,39 @@
 from django.test import TestCase
+from django.urls import reverse
 
-# Create your tests here.
+from community.models import Bookmark, Emotion, Image, Location, Memory
+from recommendations.models import Place, SavedPlace
+from users.models import User
+
+
+class MyPageQueryCountTests(TestCase):
+    """마이페이지 조회 쿼리 수가 북마크/저장 가게 수와 관계없이 일정한지 (prefetch plan)"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="mypage@test.com", password="pw", nickname="tester")
+        self.location = Location.objects.create(name="청파동")
+        self.emotions = [Emotion.objects.create(name=name) for name in ("행복", "설렘")]
+
+    def _add(self, count):
+        for i in range(count):
+            memory = Memory.objects.create(user=self.user, content="글", location=self.location)
+            Image.objects.bulk_create([Image(memory=memory, image_url=f"https://img.test/{i}-{j}.jpg") for j in range(2)])
+            Bookmark.objects.create(user=self.user, memory=memory)
+
+            place = Place.objects.create(name=f"가게{i}", address="주소", location=self.location, photo_reference="ref")
+            place.emotions.set(self.emotions)
+            SavedPlace.objects.create(user=self.user, shop=place, summary_snapshot="요약")
+
+    def test_query_count_does_not_grow_with_rows(self):
+        url = reverse("mypage:mypage", args=[self.user.id])
+        # 사용자 1 + 북마크 2 + 저장 가게 2
+        for count in (1, 3):
+            self._add(count)
+            with self.subTest(count=count), self.assertNumQueries(5):
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+
+        data = response.json()
+        self.assertEqual(len(data["saved_places"]), 4)
+        self.assertEqual(data["saved_places"][0]["emotions"], ["행복", "설렘"])
+        self.assertEqual(len(data["bookmarks"][0]["images"]), 2)
@@ -17,8 +17,8 @@ class MyPageView(APIView):
     def get(self, request, user_id):
         user = get_object_or_404(User, id=user_id)
 
-        bookmarks = Bookmark.objects.filter(user=user)
-        saved_places = SavedPlace.objects.filter(user=user)
+        bookmarks = BookmarkSerializer.setup_eager_loading(Bookmark.objects.filter(user=user))
+        saved_places = SavedPlaceSerializer.setup_eager_loading(SavedPlace.objects.filter(user=user))
 
         data = {
             "user": UserSerializer(user).data,
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Place, AISummary, SavedPlace
+from .models import Place, AISummary, SavedPlace, LLMResponse, LLMUsageDaily, CandidatePlace
 
 @admin.register(Place)
 class PlaceAdmin(admin.ModelAdmin):
@@ -18,3 +18,21 @@ class SavedPlaceAdmin(admin.ModelAdmin):
     list_display = ['saved_id', 'user', 'shop', 'created_date']
     list_filter = ['created_date', 'user']
     search_fields = ['user__email', 'shop__name']
+
+@admin.register(LLMResponse)
+class LLMResponseAdmin(admin.ModelAdmin):
+    list_display = ['response_id', 'model', 'prompt_hash', 'total_tokens', 'latency_ms', 'hit_count', 'created_date']
+    list_filter = ['model', 'created_date']
+    search_fields = ['prompt', 'response']
+
+@admin.register(LLMUsageDaily)
+class LLMUsageDailyAdmin(admin.ModelAdmin):
+    list_display = ['date', 'endpoint', 'kind', 'model', 'calls', 'reused', 'rejected', 'prompt_tokens', 'completion_tokens', 'cost']
+    list_filter = ['date', 'kind', 'model']
+    search_fields = ['endpoint']
+
+@admin.register(CandidatePlace)
+class CandidatePlaceAdmin(admin.ModelAdmin):
+    list_display = ['candidate_id', 'location', 'category', 'name', 'rating', 'rank', 'modified_date']
+    list_filter = ['location', 'category']
+    search_fields = ['name', 'address', 'google_place_id']
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from recommendations.services.emotion_similarity import SIMILARITY_PATH, build_similarity, save_similarity
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the emotion similarity matrix from emotion co-occurrence (and optional static embeddings)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--embedding-weight', type=float, default=0.3,
+                            help='data/emotion_embeddings.json이 있을 때 임베딩 유사도 비율 (0~1)')
+
+    def handle(self, *args, **options):
+        names, matrix, documents = build_similarity(embedding_weight=options['embedding_weight'])
+        save_similarity(names, matrix)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'감정 {len(names)}개 유사도 행렬 저장 (가게/글 {documents}개 사용): {SIMILARITY_PATH}'
+        ))
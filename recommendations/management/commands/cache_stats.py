@@ -0,0 +1,45 @@
+import json
+from django.core.management.base import BaseCommand
+from recommendations.services import cache_metrics
+
+# 표에 보여줄 카운터 순서
+COLUMNS = ['hit', 'l2_hit', 'stale', 'miss', 'set', 'error', 'eviction']
+
+
+class Command(BaseCommand):
+    help = 'Show CacheService hit/miss/set/error/eviction counters per cache family, merged across workers'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--per-worker', action='store_true', help='워커별로 나눠서 출력')
+        parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+        parser.add_argument('--prune', type=int, metavar='SECONDS',
+                            help='SECONDS초 넘게 갱신되지 않은 워커 기록(종료된 워커)을 먼저 삭제')
+
+    def handle(self, *args, **options):
+        if options['prune'] is not None:
+            removed = cache_metrics.prune(options['prune'])
+            self.stderr.write(f'오래된 워커 기록 {removed}개 삭제')
+
+        workers = cache_metrics.collect()
+        groups = [(w['worker'], cache_metrics.merge([w])) for w in workers] if options['per_worker'] else []
+        groups.append(('전체', cache_metrics.merge(workers)))
+
+        if options['json']:
+            self.stdout.write(json.dumps(dict(groups), ensure_ascii=False, indent=2))
+            return
+
+        if not workers:
+            self.stdout.write(f'기록된 캐시 통계가 없습니다 ({cache_metrics.metrics_dir()})')
+            return
+
+        for name, families in groups:
+            self.stdout.write(self.style.MIGRATE_HEADING(f'[{name}]'))
+            self.stdout.write(f"{'family':<24}" + ''.join(f'{c:>10}' for c in COLUMNS) + f"{'hit_ratio':>11}")
+            for family in sorted(families):
+                counts = families[family]
+                ratio = counts['hit_ratio']
+                self.stdout.write(
+                    f'{family:<24}' + ''.join(f'{counts.get(c, 0):>10}' for c in COLUMNS)
+                    + (f'{ratio * 100:>10.1f}%' if ratio is not None else f"{'-':>11}")
+                )
+        self.stdout.write(self.style.SUCCESS(f'워커 {len(workers)}개 합산'))
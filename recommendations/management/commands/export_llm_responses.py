@@ -0,0 +1,30 @@
+import json
+from django.core.management.base import BaseCommand
+from recommendations.models import LLMResponse
+
+# JSON Lines로 내보낼 필드 (response_id는 환경마다 다르므로 제외)
+EXPORT_FIELDS = [
+    'model', 'prompt_hash', 'params_hash', 'params', 'prompt', 'response',
+    'prompt_tokens', 'completion_tokens', 'total_tokens', 'latency_ms', 'hit_count',
+]
+
+
+class Command(BaseCommand):
+    help = 'Export stored GPT responses (LLMResponse) to a JSON Lines file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='저장할 .jsonl 파일 경로')
+        parser.add_argument('--model', help='특정 모델의 응답만 내보내기')
+
+    def handle(self, *args, **options):
+        qs = LLMResponse.objects.order_by('response_id')
+        if options['model']:
+            qs = qs.filter(model=options['model'])
+
+        count = 0
+        with open(options['path'], 'w', encoding='utf-8') as f:
+            for row in qs.values(*EXPORT_FIELDS).iterator(chunk_size=1000):
+                f.write(json.dumps(row, ensure_ascii=False) + '\n')
+                count += 1
+
+        self.stdout.write(self.style.SUCCESS(f'GPT 응답 {count}개 내보내기 완료'))
@@ -0,0 +1,33 @@
+import json
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from recommendations.models import LLMResponse
+from .export_llm_responses import EXPORT_FIELDS
+
+UNIQUE_FIELDS = ['model', 'prompt_hash', 'params_hash']
+
+
+class Command(BaseCommand):
+    help = 'Import GPT responses (LLMResponse) from a JSON Lines file created by export_llm_responses'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='불러올 .jsonl 파일 경로')
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        with open(options['path'], encoding='utf-8') as f:
+            rows = [json.loads(line) for line in f if line.strip()]
+
+        objs = [LLMResponse(**{field: row[field] for field in EXPORT_FIELDS if field in row}) for row in rows]
+
+        # 같은 지문이 이미 있으면 응답/사용량을 파일 내용으로 갱신
+        with transaction.atomic():
+            LLMResponse.objects.bulk_create(
+                objs,
+                batch_size=options['batch_size'],
+                update_conflicts=True,
+                unique_fields=UNIQUE_FIELDS,
+                update_fields=[f for f in EXPORT_FIELDS if f not in UNIQUE_FIELDS],
+            )
+
+        self.stdout.write(self.style.SUCCESS(f'GPT 응답 {len(objs)}개 불러오기 완료'))
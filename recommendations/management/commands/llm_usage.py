@@ -0,0 +1,54 @@
+import json
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from recommendations.services import llm_usage
+
+GROUP_FIELDS = ['date', 'endpoint', 'kind', 'model']
+COLUMNS = ['calls', 'reused', 'rejected', 'prompt_tokens', 'completion_tokens']
+
+
+class Command(BaseCommand):
+    help = 'Show OpenAI calls, tokens and cost per endpoint / prompt kind / model / day from the usage ledger'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=1, help='오늘 포함 최근 N일 (기본 1 = 오늘)')
+        parser.add_argument('--by', nargs='+', choices=GROUP_FIELDS, default=['endpoint', 'kind'],
+                            help='묶을 기준 (기본: endpoint kind)')
+        parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+
+    def handle(self, *args, **options):
+        since = llm_usage.today() - timedelta(days=max(options['days'], 1) - 1)
+        group_by = [field for field in GROUP_FIELDS if field in options['by']]
+        rows = llm_usage.totals(since, group_by)
+
+        if options['json']:
+            self.stdout.write(json.dumps(rows, ensure_ascii=False, indent=2, default=str))
+            return
+
+        if not rows:
+            self.stdout.write(f'{since} 이후 기록된 OpenAI 사용량이 없습니다')
+            return
+
+        total_cost = sum(row['cost'] for row in rows)
+        widths = {'date': 12, 'endpoint': 44, 'kind': 20, 'model': 24}
+        self.stdout.write(self.style.MIGRATE_HEADING(f'[{since} ~ {llm_usage.today()}]'))
+        self.stdout.write(
+            ''.join(f'{field:<{widths[field]}}' for field in group_by)
+            + ''.join(f'{c:>18}' for c in COLUMNS) + f"{'cost($)':>12}{'share':>8}"
+        )
+        for row in rows:
+            cost = row['cost']
+            share = cost / total_cost * 100 if total_cost else 0
+            self.stdout.write(
+                ''.join(f'{str(row[field]):<{widths[field]}}' for field in group_by)
+                + ''.join(f'{row[c]:>18}' for c in COLUMNS) + f'{cost:>12.4f}{share:>7.1f}%'
+            )
+        self.stdout.write(self.style.SUCCESS(f'합계 ${total_cost:.4f}'))
+
+        if llm_usage.budget_enabled():
+            spent = llm_usage.spent_today()
+            budget = llm_usage.daily_budget()
+            limit = f'${budget:.2f}' if budget > 0 else '없음'
+            self.stdout.write(f"오늘 사용액 ${spent['total']:.4f} / 하루 예산 {limit}")
+            for kind, kind_budget in sorted(llm_usage.kind_budgets().items()):
+                self.stdout.write(f"  {kind}: ${spent['by_kind'].get(kind, 0.0):.4f} / ${kind_budget:.2f}")
@@ -0,0 +1,99 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from community.models import Location
+from recommendations.models import CandidatePlace
+from recommendations.services.candidate_pool import CATEGORY_QUERIES
+from recommendations.services.google_client import get_json
+
+# next_page_token은 발급 직후 바로 쓰면 INVALID_REQUEST → 잠시 기다렸다가 요청
+PAGE_TOKEN_DELAY = 2
+PAGE_TOKEN_RETRIES = 3
+
+
+class Command(BaseCommand):
+    help = 'Fill the neighborhood x category candidate pool from Google Text Search (pages via next_page_token)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--location', action='append', help='갱신할 동네 이름 (여러 번 지정 가능, 기본: 전체)')
+        parser.add_argument('--category', choices=sorted(CATEGORY_QUERIES), action='append', help='갱신할 업종 (기본: 전체)')
+        parser.add_argument('--pages', type=int, default=3, help='검색어당 최대 페이지 수 (페이지당 20개, 최대 3)')
+
+    def handle(self, *args, **options):
+        locations = Location.objects.order_by('location_id')
+        if options['location']:
+            locations = locations.filter(name__in=options['location'])
+        categories = options['category'] or sorted(CATEGORY_QUERIES)
+
+        for location in locations:
+            for category in categories:
+                query = f"{location.name} {CATEGORY_QUERIES[category]}"
+                results = self._search(query, options['pages'])
+                if results is None:
+                    self.stdout.write(self.style.WARNING(f'{query}: 검색 실패, 기존 풀 유지'))
+                    continue
+                saved = self._replace_pool(location, category, results)
+                self.stdout.write(f'{query}: {saved}개')
+
+        self.stdout.write(self.style.SUCCESS('후보 가게 풀 갱신 완료'))
+
+    def _search(self, query, pages):
+        """Text Search 결과를 next_page_token으로 pages 페이지까지 모음 (첫 페이지 실패 시 None)"""
+        params = {"query": query, "key": settings.GOOGLE_API_KEY, "language": "ko"}
+        data = get_json("place/textsearch", params)
+        if data.get("status") not in ("OK", "ZERO_RESULTS"):
+            return None
+
+        results = list(data.get("results", []))
+        token = data.get("next_page_token")
+        page = 1
+        while token and page < pages:
+            for _ in range(PAGE_TOKEN_RETRIES):
+                time.sleep(PAGE_TOKEN_DELAY)
+                data = get_json("place/textsearch", {"pagetoken": token, "key": settings.GOOGLE_API_KEY})
+                if data.get("status") != "INVALID_REQUEST":
+                    break
+            if data.get("status") != "OK":
+                break
+            results.extend(data.get("results", []))
+            token = data.get("next_page_token")
+            page += 1
+        return results
+
+    def _replace_pool(self, location, category, results):
+        rows, seen = [], set()
+        for r in results:
+            place_id = r.get("place_id")
+            if not place_id or place_id in seen:
+                continue
+            seen.add(place_id)
+            loc = r.get("geometry", {}).get("location", {})
+            rows.append(CandidatePlace(
+                location=location,
+                category=category,
+                google_place_id=place_id,
+                name=r.get("name", ""),
+                address=r.get("formatted_address", ""),
+                place_types=r.get("types", []),
+                rating=r.get("rating", 0) or 0,
+                user_ratings_total=r.get("user_ratings_total", 0) or 0,
+                price_level=r.get("price_level", 0) or 0,
+                photo_reference=r["photos"][0].get("photo_reference", "") if r.get("photos") else "",
+                lat=loc.get("lat"),
+                lng=loc.get("lng"),
+                rank=len(rows),
+            ))
+
+        # 새 결과로 통째로 교체 (요청 처리 중에는 이전 풀 또는 새 풀만 보임)
+        with transaction.atomic():
+            CandidatePlace.objects.filter(location=location, category=category).exclude(google_place_id__in=seen).delete()
+            CandidatePlace.objects.bulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=["location", "category", "google_place_id"],
+                update_fields=["name", "address", "place_types", "rating", "user_ratings_total",
+                               "price_level", "photo_reference", "lat", "lng", "rank", "modified_date"],
+            )
+        return len(rows)
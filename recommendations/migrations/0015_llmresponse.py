@@ -0,0 +1,40 @@
+# Generated by Django 4.2.7 on 2026-10-18 11:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recommendations', '0014_remove_place_image_url_place_photo_reference'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LLMResponse',
+            fields=[
+                ('response_id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('model', models.CharField(max_length=64)),
+                ('prompt_hash', models.CharField(max_length=64)),
+                ('params_hash', models.CharField(max_length=64)),
+                ('params', models.JSONField(blank=True, default=dict)),
+                ('prompt', models.TextField()),
+                ('response', models.TextField()),
+                ('prompt_tokens', models.IntegerField(default=0)),
+                ('completion_tokens', models.IntegerField(default=0)),
+                ('total_tokens', models.IntegerField(default=0)),
+                ('latency_ms', models.IntegerField(default=0)),
+                ('hit_count', models.IntegerField(default=0)),
+                ('created_date', models.DateTimeField(auto_now_add=True)),
+                ('modified_date', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'llm_response',
+                'indexes': [models.Index(fields=['created_date'], name='llm_respons_created_544d90_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='llmresponse',
+            constraint=models.UniqueConstraint(fields=('model', 'prompt_hash', 'params_hash'), name='uniq_llm_response_fingerprint'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.7 on 2026-10-18 11:21
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0011_memory_board'),
+        ('recommendations', '0015_llmresponse'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CandidatePlace',
+            fields=[
+                ('candidate_id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('category', models.CharField(choices=[('restaurant', '맛집'), ('cafe', '카페')], max_length=20)),
+                ('google_place_id', models.CharField(max_length=255)),
+                ('name', models.CharField(max_length=255)),
+                ('address', models.CharField(blank=True, default='', max_length=255)),
+                ('place_types', models.JSONField(blank=True, default=list)),
+                ('rating', models.FloatField(default=0.0)),
+                ('user_ratings_total', models.IntegerField(default=0)),
+                ('price_level', models.IntegerField(default=0)),
+                ('photo_reference', models.CharField(blank=True, default='', max_length=512)),
+                ('lat', models.FloatField(blank=True, null=True)),
+                ('lng', models.FloatField(blank=True, null=True)),
+                ('rank', models.IntegerField(default=0)),
+                ('created_date', models.DateTimeField(auto_now_add=True)),
+                ('modified_date', models.DateTimeField(auto_now=True)),
+                ('location', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='candidate_places', to='community.location')),
+            ],
+            options={
+                'db_table': 'candidate_place',
+                'indexes': [models.Index(fields=['location', 'category', 'rank'], name='candidate_p_locatio_c0b847_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='candidateplace',
+            constraint=models.UniqueConstraint(fields=('location', 'category', 'google_place_id'), name='uniq_candidate_place'),
+        ),
+    ]
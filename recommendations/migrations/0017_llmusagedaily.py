@@ -0,0 +1,37 @@
+# Generated by Django 4.2.7 on 2026-10-18 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recommendations', '0016_candidateplace'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LLMUsageDaily',
+            fields=[
+                ('usage_id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('date', models.DateField()),
+                ('endpoint', models.CharField(max_length=128)),
+                ('kind', models.CharField(max_length=64)),
+                ('model', models.CharField(max_length=64)),
+                ('calls', models.IntegerField(default=0)),
+                ('reused', models.IntegerField(default=0)),
+                ('rejected', models.IntegerField(default=0)),
+                ('prompt_tokens', models.BigIntegerField(default=0)),
+                ('completion_tokens', models.BigIntegerField(default=0)),
+                ('cost', models.FloatField(default=0.0)),
+                ('modified_date', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'llm_usage_daily',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='llmusagedaily',
+            constraint=models.UniqueConstraint(fields=('date', 'endpoint', 'kind', 'model'), name='uniq_llm_usage_daily'),
+        ),
+    ]
@@ -93,3 +93,103 @@ class SavedPlace(models.Model):
 
     def __str__(self):
         return f"{self.user} saved {self.shop.name} (rec={self.rec})"
+
+
+# GPT 응답 저장소 (프롬프트 지문 기준, 재시작/배포 후에도 유지)
+class LLMResponse(models.Model):
+    response_id = models.BigAutoField(primary_key=True)
+    model = models.CharField(max_length=64)
+    prompt_hash = models.CharField(max_length=64)   # 공백 정규화한 프롬프트의 sha256
+    params_hash = models.CharField(max_length=64)   # temperature, max_tokens 등 호출 파라미터의 sha256
+    params = models.JSONField(default=dict, blank=True)
+    prompt = models.TextField()
+    response = models.TextField()
+
+    prompt_tokens = models.IntegerField(default=0)
+    completion_tokens = models.IntegerField(default=0)
+    total_tokens = models.IntegerField(default=0)
+    latency_ms = models.IntegerField(default=0)
+    hit_count = models.IntegerField(default=0)      # 저장된 응답을 재사용한 횟수
+
+    created_date = models.DateTimeField(auto_now_add=True)
+    modified_date = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "llm_response"
+        constraints = [
+            models.UniqueConstraint(fields=["model", "prompt_hash", "params_hash"], name="uniq_llm_response_fingerprint")
+        ]
+        indexes = [
+            models.Index(fields=["created_date"])
+        ]
+
+    def __str__(self):
+        return f"{self.model} {self.prompt_hash[:12]}"
+
+
+# OpenAI 사용량 장부 (날짜 × 호출한 view × 프롬프트 종류 × 모델별 누적)
+class LLMUsageDaily(models.Model):
+    usage_id = models.BigAutoField(primary_key=True)
+    date = models.DateField()
+    endpoint = models.CharField(max_length=128)     # 호출한 view 이름 (요청 밖의 호출은 "background")
+    kind = models.CharField(max_length=64)          # 프롬프트 종류 (summary, keywords, emotion_tags 등)
+    model = models.CharField(max_length=64)
+
+    calls = models.IntegerField(default=0)          # 실제 API 호출 수
+    reused = models.IntegerField(default=0)         # 저장된 응답 재사용으로 API 호출을 생략한 수
+    rejected = models.IntegerField(default=0)       # 하루 예산 초과로 호출하지 않은 수
+    prompt_tokens = models.BigIntegerField(default=0)
+    completion_tokens = models.BigIntegerField(default=0)
+    cost = models.FloatField(default=0.0)           # USD (기록 시점의 OPENAI_PRICES 기준)
+
+    modified_date = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "llm_usage_daily"
+        constraints = [
+            models.UniqueConstraint(fields=["date", "endpoint", "kind", "model"], name="uniq_llm_usage_daily")
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.endpoint} {self.kind} {self.model}"
+
+
+# 동네 × 업종별 후보 가게 풀 (refresh_candidate_pool 명령으로 주기적으로 채움)
+class CandidatePlace(models.Model):
+    CATEGORY_CHOICES = [
+        ('restaurant', '맛집'),
+        ('cafe', '카페'),
+    ]
+    candidate_id = models.BigAutoField(primary_key=True)
+    location = models.ForeignKey(
+        "community.Location",
+        on_delete=models.CASCADE,
+        related_name="candidate_places"
+    )
+    category = models.CharField(max_length=20, choices=CATEGORY_CHOICES)
+    google_place_id = models.CharField(max_length=255)
+    name = models.CharField(max_length=255)
+    address = models.CharField(max_length=255, blank=True, default="")
+    place_types = models.JSONField(default=list, blank=True)
+    rating = models.FloatField(default=0.0)
+    user_ratings_total = models.IntegerField(default=0)
+    price_level = models.IntegerField(default=0)
+    photo_reference = models.CharField(max_length=512, blank=True, default="")
+    lat = models.FloatField(null=True, blank=True)
+    lng = models.FloatField(null=True, blank=True)
+    rank = models.IntegerField(default=0)   # Text Search 결과 순서
+
+    created_date = models.DateTimeField(auto_now_add=True)
+    modified_date = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "candidate_place"
+        constraints = [
+            models.UniqueConstraint(fields=["location", "category", "google_place_id"], name="uniq_candidate_place")
+        ]
+        indexes = [
+            models.Index(fields=["location", "category", "rank"])
+        ]
+
+    def __str__(self):
+        return f"{self.location} {self.category} {self.name}"
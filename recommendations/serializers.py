@@ -1,9 +1,30 @@
+from django.db.models import OuterRef, Subquery
 from rest_framework import serializers
 from .models import *
 from community.models import *
+from infer.models import AISummary as InferAISummary
 from .services.google_service import get_photo_url
 
 
+# 목록 조회용 prefetch plan 공통 함수
+# - 각 시리얼라이저의 setup_eager_loading(queryset)이 필요한 select/prefetch/annotate를 선언
+# - 최신 요약은 subquery annotate로 목록 쿼리에 포함 (행마다 .order_by().first() 하지 않도록)
+
+def latest_summary(model, place_field, outer_ref="pk"):
+    """가게별 최신 요약 텍스트 subquery (annotate용)"""
+    return Subquery(
+        model.objects.filter(**{place_field: OuterRef(outer_ref)}).order_by("-created_date").values("summary")[:1]
+    )
+
+
+def summary_of(obj, annotation, manager):
+    """prefetch plan으로 annotate된 최신 요약이 있으면 사용, 없으면 직접 조회"""
+    if hasattr(obj, annotation):
+        return getattr(obj, annotation)
+    summary = manager.order_by("-created_date").first()
+    return summary.summary if summary else None
+
+
 # AI 요약 정보
 class AISummarySerializer(serializers.ModelSerializer):
 
@@ -42,6 +63,14 @@ class PlaceSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ("shop_id", "created_date", "modified_date")
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Place 목록 prefetch plan (가게 수와 관계없이 쿼리 2번)"""
+        return queryset.select_related("location").prefetch_related("emotions").annotate(
+            latest_ai_summary=latest_summary(AISummary, "shop"),
+            latest_infer_ai_summary=latest_summary(InferAISummary, "place"),
+        )
+
     def get_ai_summary(self, obj):
         request = self.context.get("request")
         rec = None
@@ -49,11 +78,8 @@ class PlaceSerializer(serializers.ModelSerializer):
             rec = request.query_params.get("rec") or request.data.get("rec")
 
         if str(rec) == "2":
-            summary_obj = obj.infer_ai_summary.order_by("-created_date").first()
-        else:
-            summary_obj = obj.ai_summary.order_by("-created_date").first()
-
-        return summary_obj.summary if summary_obj else None
+            return summary_of(obj, "latest_infer_ai_summary", obj.infer_ai_summary)
+        return summary_of(obj, "latest_ai_summary", obj.ai_summary)
     
     def get_status(self, obj):
         return obj.get_status_display() if obj.status else None
@@ -115,12 +141,18 @@ class SavedPlaceSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ("saved_id", "created_date")
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """SavedPlace 목록 prefetch plan (저장 수와 관계없이 쿼리 2번)"""
+        return queryset.select_related("shop__location").prefetch_related("shop__emotions").annotate(
+            latest_ai_summary=latest_summary(AISummary, "shop", "shop_id"),
+            latest_infer_ai_summary=latest_summary(InferAISummary, "place", "shop_id"),
+        )
+
     def get_summary(self, obj):
         if obj.rec == 2:
-            summary = obj.shop.infer_ai_summary.order_by("-created_date").first()
-        else:
-            summary = obj.shop.ai_summary.order_by("-created_date").first()
-        return summary.summary if summary else None
+            return summary_of(obj, "latest_infer_ai_summary", obj.shop.infer_ai_summary)
+        return summary_of(obj, "latest_ai_summary", obj.shop.ai_summary)
     
     def get_status(self, obj):
         return "운영중"  
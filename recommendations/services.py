@@ -1,16 +1,9 @@
-from django.conf import settings
-import openai
+from recommendations.services.gpt_client import chat
 
 def call_gpt_api(prompt: str) -> str | None:
     """공통 GPT API 호출"""
     try:
-        client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",   # 실제 사용하는 모델명에 맞게 수정
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=300,
-        )
-        return response.choices[0].message.content.strip()
+        return chat(prompt, kind="summary", max_tokens=300)
     except Exception as e:
         print(f"GPT 호출 오류: {e}")
         return None
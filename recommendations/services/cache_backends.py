@@ -0,0 +1,173 @@
+# 프로세스 간 공유 캐시 백엔드 (외부 서비스 없이 로컬 SQLite 파일 사용)
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+from django.core.cache.backends.base import BaseCache, DEFAULT_TIMEOUT
+
+from . import cache_metrics
+
+
+class SQLiteCache(BaseCache):
+    """
+    SQLite 파일 기반 Django 캐시 백엔드
+    - 같은 서버의 gunicorn/uvicorn 워커들이 하나의 파일을 공유 (WAL 모드)
+    - 만료 시간(TTL) + 최근 사용 시각 기준 LRU 정리
+    - settings.CACHES 예시:
+        'shared': {
+            'BACKEND': 'recommendations.services.cache_backends.SQLiteCache',
+            'LOCATION': '/path/to/shared_cache.sqlite3',
+            'OPTIONS': {'MAX_ENTRIES': 20000, 'CULL_FREQUENCY': 10},
+        }
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        self._path = str(location)
+        self._local = threading.local()
+
+    # --- 연결 관리 ---
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            directory = os.path.dirname(self._path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self._path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entry ("
+                " key TEXT PRIMARY KEY,"
+                " value BLOB NOT NULL,"
+                " expires REAL,"
+                " accessed REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS cache_entry_accessed ON cache_entry (accessed)")
+            self._local.conn = conn
+        return conn
+
+    def close(self, **kwargs):
+        # 요청마다 닫지 않고 스레드별 연결을 재사용
+        pass
+
+    # --- 내부 헬퍼 ---
+
+    @staticmethod
+    def _is_expired(expires, now):
+        return expires is not None and expires <= now
+
+    def _write(self, conn, key, value, timeout, now):
+        expires = self.get_backend_timeout(timeout)
+        conn.execute(
+            "INSERT OR REPLACE INTO cache_entry (key, value, expires, accessed) VALUES (?, ?, ?, ?)",
+            (key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), expires, now),
+        )
+
+    def _cull(self, conn, now):
+        """만료 항목 삭제 후에도 MAX_ENTRIES를 넘으면 오래 안 쓴 항목부터 1/CULL_FREQUENCY 삭제"""
+        count = conn.execute("SELECT COUNT(*) FROM cache_entry").fetchone()[0]
+        if count <= self._max_entries:
+            return
+        conn.execute("DELETE FROM cache_entry WHERE expires IS NOT NULL AND expires <= ?", (now,))
+        count = conn.execute("SELECT COUNT(*) FROM cache_entry").fetchone()[0]
+        if count <= self._max_entries:
+            return
+        if self._cull_frequency == 0:
+            keys = [row[0] for row in conn.execute("SELECT key FROM cache_entry")]
+            conn.execute("DELETE FROM cache_entry")
+        else:
+            keys = [row[0] for row in conn.execute(
+                "SELECT key FROM cache_entry ORDER BY accessed LIMIT ?",
+                (max(count // self._cull_frequency, count - self._max_entries),),
+            )]
+            conn.executemany("DELETE FROM cache_entry WHERE key = ?", [(key,) for key in keys])
+        self._record_evictions(keys)
+
+    @staticmethod
+    def _record_evictions(keys):
+        """정리된 항목 수를 캐시 family별로 기록 (키 형식: ":버전:family:hash")"""
+        evicted = {}
+        for key in keys:
+            family = cache_metrics.family_of(key.split(":", 2)[-1])
+            evicted[family] = evicted.get(family, 0) + 1
+        for family, count in evicted.items():
+            cache_metrics.record(family, "eviction", count)
+
+    # --- BaseCache API ---
+
+    def get(self, key, default=None, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        conn = self._connection()
+        now = time.time()
+        row = conn.execute("SELECT value, expires FROM cache_entry WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return default
+        value, expires = row
+        if self._is_expired(expires, now):
+            conn.execute("DELETE FROM cache_entry WHERE key = ? AND expires <= ?", (key, now))
+            return default
+        conn.execute("UPDATE cache_entry SET accessed = ? WHERE key = ?", (now, key))
+        return pickle.loads(value)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        conn = self._connection()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._cull(conn, now)
+            self._write(conn, key, value, timeout, now)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        """키가 없거나 만료된 경우에만 저장 (원자적) → 저장 여부 반환"""
+        key = self.make_and_validate_key(key, version=version)
+        conn = self._connection()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT expires FROM cache_entry WHERE key = ?", (key,)).fetchone()
+            if row is not None and not self._is_expired(row[0], now):
+                conn.execute("COMMIT")
+                return False
+            self._cull(conn, now)
+            self._write(conn, key, value, timeout, now)
+            conn.execute("COMMIT")
+            return True
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        now = time.time()
+        cursor = self._connection().execute(
+            "UPDATE cache_entry SET expires = ?, accessed = ? "
+            "WHERE key = ? AND (expires IS NULL OR expires > ?)",
+            (self.get_backend_timeout(timeout), now, key, now),
+        )
+        return cursor.rowcount > 0
+
+    def delete(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        cursor = self._connection().execute("DELETE FROM cache_entry WHERE key = ?", (key,))
+        return cursor.rowcount > 0
+
+    def has_key(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        row = self._connection().execute(
+            "SELECT 1 FROM cache_entry WHERE key = ? AND (expires IS NULL OR expires > ?)",
+            (key, time.time()),
+        ).fetchone()
+        return row is not None
+
+    def clear(self):
+        self._connection().execute("DELETE FROM cache_entry")
@@ -0,0 +1,102 @@
+# 캐시 family별 hit/miss/set/error/eviction 카운터
+# - 요청 경로에서는 스레드별 dict에 더하기만 함 (lock 없음)
+# - 백그라운드 스레드가 CACHE_METRICS_FLUSH_INTERVAL마다 프로세스 누적값을 공유 디렉터리의 <host>-<pid>.json으로 기록
+# - 집계는 디렉터리의 모든 워커 파일 합산 (cache_stats 명령, PerformanceMonitor.get_performance_stats)
+# - 워커 파일은 프로세스 시작 이후 누적값이라, 종료된 워커의 기록도 지우기 전까지 합산에 포함
+
+import os
+import threading
+
+from django.conf import settings
+
+from .worker_store import WorkerStore
+
+# hit: L1 히트 / l2_hit: L1 miss 후 공유 캐시 히트 / stale: 히트 중 soft TTL 지난 값 (hit/l2_hit에 포함)
+# miss: L1/L2 모두 없음 / set: 저장 / error: 조회·저장 실패 / eviction: 공유 캐시 LRU 정리로 삭제
+EVENTS = ("hit", "l2_hit", "stale", "miss", "set", "error", "eviction")
+
+_local = threading.local()
+_thread_counters = []   # 모든 스레드의 카운터 dict (스레드가 처음 기록할 때만 lock)
+_register_lock = threading.Lock()
+
+
+def _counters():
+    counters = getattr(_local, "counters", None)
+    if counters is None:
+        counters = _local.counters = {}
+        with _register_lock:
+            _thread_counters.append(counters)
+    return counters
+
+
+def family_of(cache_key):
+    """캐시 키(prefix:hash) → family 이름"""
+    return cache_key.split(":", 1)[0]
+
+
+def record(family, event, count=1):
+    """카운터 증가 (호출한 스레드의 dict만 수정하므로 lock 불필요)"""
+    counters = _counters()
+    key = (family, event)
+    counters[key] = counters.get(key, 0) + count
+    _store.ensure_flusher()
+
+
+def snapshot():
+    """이 프로세스의 누적 카운터 → {family: {event: n}}"""
+    with _register_lock:
+        thread_counters = list(_thread_counters)
+
+    totals = {}
+    for counters in thread_counters:
+        for (family, event), count in dict(counters).items():
+            family_totals = totals.setdefault(family, dict.fromkeys(EVENTS, 0))
+            family_totals[event] = family_totals.get(event, 0) + count
+    return totals
+
+
+# --- 공유 디렉터리 기록/집계 ---
+
+def metrics_dir():
+    return str(getattr(settings, "CACHE_METRICS_DIR", os.path.join(settings.BASE_DIR, "cache", "metrics")))
+
+
+_store = WorkerStore(
+    "cache-metrics",
+    directory_fn=metrics_dir,
+    interval_fn=lambda: getattr(settings, "CACHE_METRICS_FLUSH_INTERVAL", 10),
+    snapshot_fn=snapshot,
+)
+flush = _store.flush
+prune = _store.prune
+
+
+def collect():
+    """공유 디렉터리의 모든 워커 기록"""
+    return _store.collect()
+
+
+def merge(workers):
+    """워커별 기록 합산 → {family: {event: n, ..., "hit_ratio": 0~1 또는 None}}"""
+    merged = {}
+    for worker in workers:
+        for family, counts in worker.get("data", {}).items():
+            family_totals = merged.setdefault(family, dict.fromkeys(EVENTS, 0))
+            for event, count in counts.items():
+                family_totals[event] = family_totals.get(event, 0) + count
+
+    for counts in merged.values():
+        counts["hit_ratio"] = hit_ratio(counts)
+    return merged
+
+
+def hit_ratio(counts):
+    """(L1 + L2 히트) / 전체 조회, 조회가 없으면 None"""
+    hits = counts.get("hit", 0) + counts.get("l2_hit", 0)
+    lookups = hits + counts.get("miss", 0)
+    return hits / lookups if lookups else None
+
+
+def aggregate():
+    """모든 워커의 캐시 통계 합산 (현재 프로세스 값은 먼저 기록)"""
+    return merge(_store.collect(flush_first=True))
@@ -1,23 +1,96 @@
 # 캐싱 서비스 - API 호출 최적화
-from django.core.cache import cache
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db import close_old_connections
+import asyncio
 import hashlib
 import json
-from typing import Dict, List, Any, Optional
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Callable, Awaitable, NamedTuple, Set
 import logging
 
+from . import cache_metrics, tracing
+
 logger = logging.getLogger(__name__)
 
+
+class _Entry(NamedTuple):
+    """캐시에 실제로 저장되는 값 (fresh_until 이후엔 stale → 반환은 하되 백그라운드 갱신)"""
+    value: Any
+    fresh_until: float
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.fresh_until
+
+
+class _InFlight:
+    """같은 캐시 키를 계산 중인 리더의 결과를 기다리는 대기표"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.failed = False
+
+
+# 다른 워커가 이미 갱신 중이라 백그라운드 갱신을 건너뛴 경우의 결과 표시
+_SKIPPED = object()
+
+_inflight: Dict[str, _InFlight] = {}
+_inflight_lock = threading.Lock()
+# 이벤트 루프별 진행 중 계산 (asyncio.Future는 루프에 묶임)
+_async_inflight = weakref.WeakKeyDictionary()
+
+# 백그라운드 갱신 중인 키 (같은 키 갱신을 중복 예약하지 않도록)
+_refreshing: Set[str] = set()
+_refresh_executor = None
+_background_tasks = set()
+
+
+def _get_refresh_executor():
+    """stale 캐시 갱신 전용 스레드풀 (요청 처리 스레드와 분리)"""
+    global _refresh_executor
+    if _refresh_executor is None:
+        with _inflight_lock:
+            if _refresh_executor is None:
+                _refresh_executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, 'CACHE_SERVICE_REFRESH_WORKERS', 4),
+                    thread_name_prefix="cache-refresh",
+                )
+    return _refresh_executor
+
+
 class CacheService:
     """API 호출 결과를 캐싱하여 성능 최적화"""
     
-    # 캐시 만료 시간 (초)
+    # 캐시 신선도 유지 시간 (초, soft TTL) - 지나면 이전 값을 반환하면서 백그라운드에서 갱신
     CACHE_TIMEOUTS = {
         'google_places_search': 3600,  # 1시간
         'google_place_details': 7200,  # 2시간  
         'gpt_summary': 86400,          # 24시간
         'gpt_emotion_tags': 86400,     # 24시간
         'gpt_emotion_expansion': 86400, # 24시간
+        'gpt_api': 86400,              # 24시간
+        'gpt_place_card': 86400,       # 24시간 (요약 + 키워드 + 감정태그 묶음)
+    }
+
+    # 캐시 완전 만료 시간 (초, hard TTL) - 이 시간이 지나야 호출자가 upstream 응답을 기다림
+    CACHE_STALE_TIMEOUTS = {
+        'google_places_search': 86400,   # 24시간
+        'google_place_details': 86400,   # 24시간
+        'gpt_summary': 604800,           # 7일
+        'gpt_emotion_tags': 604800,      # 7일
+        'gpt_emotion_expansion': 604800, # 7일
+        'gpt_api': 604800,               # 7일
+        'gpt_place_card': 604800,        # 7일
     }
+
+    # 단일 계산(single-flight) 설정: 다른 호출자의 계산 결과를 기다리는 최대 시간 / 공유 캐시 폴링 간격
+    SINGLE_FLIGHT_TIMEOUT = 30
+    SINGLE_FLIGHT_POLL_INTERVAL = 0.1
     
     @staticmethod
     def _generate_cache_key(prefix: str, data: Dict[str, Any]) -> str:
@@ -28,27 +101,134 @@ class CacheService:
         return f"{prefix}:{hash_key}"
     
     @staticmethod
-    def get_cached_result(cache_key: str) -> Optional[Any]:
-        """캐시에서 결과 조회"""
+    def _l1():
+        """프로세스 내부 캐시 (LocMem)"""
+        return caches['default']
+
+    @staticmethod
+    def _l2():
+        """워커 간 공유 캐시 (settings.CACHE_SERVICE_L2_ALIAS, 미설정 시 None)"""
+        alias = getattr(settings, 'CACHE_SERVICE_L2_ALIAS', None)
+        return caches[alias] if alias else None
+
+    @staticmethod
+    def _l1_timeout(timeout: int) -> int:
+        # L1은 짧게 유지해서 워커별 값이 오래 어긋나지 않도록 함
+        return min(timeout, getattr(settings, 'CACHE_SERVICE_L1_TIMEOUT', 300))
+
+    @staticmethod
+    def _as_entry(stored: Any) -> Optional[_Entry]:
+        """저장된 값 → _Entry (빈 값은 miss, 이전 형식의 값은 stale로 취급)"""
+        if isinstance(stored, _Entry):
+            return stored if stored.value else None
+        return _Entry(stored, 0) if stored else None
+
+    @classmethod
+    def _lookup(cls, cache_key: str, count: bool = True) -> Optional[_Entry]:
+        """
+        캐시에서 항목 조회 (L1 → L2 순서, L2 히트는 L1에 채워 넣음)
+        - count=False: 대기 중 폴링처럼 통계에 넣지 않을 조회
+        """
+        family = cache_metrics.family_of(cache_key)
+        with tracing.span(f"cache:{family}") as span:
+            entry = cls._lookup_entry(cache_key, family, count)
+            span.tag("hit", entry is not None)
+            return entry
+
+    @classmethod
+    async def _alookup(cls, cache_key: str, count: bool = True) -> Optional[_Entry]:
+        """_lookup의 비동기 버전 (L1은 이벤트 루프에서 바로, L2는 _in_l2_thread로 조회)"""
+        family = cache_metrics.family_of(cache_key)
+        with tracing.span(f"cache:{family}") as span:
+            try:
+                entry = cls._lookup_l1(cache_key, family, count)
+                if not entry:
+                    entry = await cls._in_l2_thread(cls._lookup_l2, cache_key, family, count)
+            except Exception as e:
+                entry = cls._lookup_failed(e, family, count)
+            span.tag("hit", entry is not None)
+            return entry
+
+    @classmethod
+    def _lookup_entry(cls, cache_key: str, family: str, count: bool) -> Optional[_Entry]:
         try:
-            result = cache.get(cache_key)
-            if result:
-                logger.info(f"캐시 히트: {cache_key}")
-            return result
+            return cls._lookup_l1(cache_key, family, count) or cls._lookup_l2(cache_key, family, count)
         except Exception as e:
-            logger.error(f"캐시 조회 실패: {e}")
-            return None
-    
+            return cls._lookup_failed(e, family, count)
+
+    @classmethod
+    def _lookup_l1(cls, cache_key: str, family: str, count: bool) -> Optional[_Entry]:
+        entry = cls._as_entry(cls._l1().get(cache_key))
+        if entry:
+            logger.info(f"캐시 히트(L1): {cache_key}")
+            if count:
+                cache_metrics.record(family, 'hit')
+        return entry
+
+    @classmethod
+    def _lookup_l2(cls, cache_key: str, family: str, count: bool) -> Optional[_Entry]:
+        l2 = cls._l2()
+        entry = cls._as_entry(l2.get(cache_key)) if l2 is not None else None
+        if entry:
+            logger.info(f"캐시 히트(L2): {cache_key}")
+            cls._l1().set(cache_key, entry, cls._l1_timeout(cls._stale_timeout_for(cache_key)))
+        if count:
+            cache_metrics.record(family, 'l2_hit' if entry else 'miss')
+        return entry
+
     @staticmethod
-    def set_cached_result(cache_key: str, data: Any, timeout: int) -> bool:
-        """캐시에 결과 저장"""
+    def _lookup_failed(error: Exception, family: str, count: bool) -> None:
+        logger.error(f"캐시 조회 실패: {error}")
+        if count:
+            cache_metrics.record(family, 'error')
+        return None
+
+    @classmethod
+    async def _in_l2_thread(cls, func: Callable[..., Any], *args) -> Any:
+        """
+        L2를 건드리는 동기 함수를 이벤트 루프 밖 스레드에서 실행 (L2가 없으면 바로 실행)
+        - SQLiteCache는 조회마다 accessed UPDATE, 저장마다 COUNT(*)를 실행하고 다른 워커의 쓰기 lock을 기다릴 수 있음
+        - 연결은 스레드별로 재사용되므로 thread_sensitive=False (요청 스레드 하나에 몰리지 않도록)
+        """
+        if cls._l2() is None:
+            return func(*args)
+        return await sync_to_async(func, thread_sensitive=False)(*args)
+
+    @classmethod
+    def get_cached_result(cls, cache_key: str) -> Optional[Any]:
+        """캐시에서 결과 조회 (hard TTL 전까지는 stale 값도 반환)"""
+        entry = cls._lookup(cache_key)
+        return entry.value if entry else None
+    
+    @classmethod
+    def set_cached_result(cls, cache_key: str, data: Any, timeout: int) -> bool:
+        """캐시에 결과 저장 (L1 + L2) - timeout은 soft TTL, 보관은 hard TTL까지"""
         try:
-            cache.set(cache_key, data, timeout)
+            entry = _Entry(data, time.time() + timeout)
+            hard_timeout = max(timeout, cls._stale_timeout_for(cache_key))
+            cls._l1().set(cache_key, entry, cls._l1_timeout(hard_timeout))
+            l2 = cls._l2()
+            if l2 is not None:
+                l2.set(cache_key, entry, hard_timeout)
             logger.info(f"캐시 저장: {cache_key}")
+            cache_metrics.record(cache_metrics.family_of(cache_key), 'set')
             return True
         except Exception as e:
             logger.error(f"캐시 저장 실패: {e}")
+            cache_metrics.record(cache_metrics.family_of(cache_key), 'error')
             return False
+
+    @classmethod
+    def _timeout_for(cls, cache_key: str) -> int:
+        """캐시 키 prefix로 soft TTL 조회 (알 수 없는 prefix는 L1 기본값)"""
+        prefix = cache_key.split(':', 1)[0]
+        return cls.CACHE_TIMEOUTS.get(prefix, getattr(settings, 'CACHE_SERVICE_L1_TIMEOUT', 300))
+
+    @classmethod
+    def _stale_timeout_for(cls, cache_key: str) -> int:
+        """캐시 키 prefix로 hard TTL 조회 (미설정 family는 soft TTL과 동일 → stale 구간 없음)"""
+        prefix = cache_key.split(':', 1)[0]
+        return cls.CACHE_STALE_TIMEOUTS.get(prefix, cls._timeout_for(cache_key))
     
     @classmethod
     def cache_google_places_search(cls, query: str, location: str, allowed_types: List[str]) -> Optional[List[Dict]]:
@@ -158,3 +338,297 @@ class CacheService:
         cache_key = cls._generate_cache_key('gpt_emotion_expansion', cache_data)
         
         return cls.set_cached_result(cache_key, expanded_emotions, cls.CACHE_TIMEOUTS['gpt_emotion_expansion'])
+
+    @classmethod
+    def cache_gpt_place_card(cls, place_name: str, reviews: List[str], types: List[str]) -> Optional[Dict]:
+        """GPT 가게 카드(요약/키워드/감정태그) 캐싱"""
+        cache_data = {
+            'place_name': place_name,
+            'reviews': reviews,
+            'types': types
+        }
+        cache_key = cls._generate_cache_key('gpt_place_card', cache_data)
+
+        return cls.get_cached_result(cache_key)
+
+    @classmethod
+    def set_gpt_place_card(cls, place_name: str, reviews: List[str], types: List[str], card: Dict) -> bool:
+        """GPT 가게 카드(요약/키워드/감정태그) 캐싱"""
+        cache_data = {
+            'place_name': place_name,
+            'reviews': reviews,
+            'types': types
+        }
+        cache_key = cls._generate_cache_key('gpt_place_card', cache_data)
+
+        return cls.set_cached_result(cache_key, card, cls.CACHE_TIMEOUTS['gpt_place_card'])
+
+    @classmethod
+    async def acache_gpt_place_card(cls, place_name: str, reviews: List[str], types: List[str]) -> Optional[Dict]:
+        """cache_gpt_place_card의 비동기 버전"""
+        cache_data = {
+            'place_name': place_name,
+            'reviews': reviews,
+            'types': types
+        }
+        entry = await cls._alookup(cls._generate_cache_key('gpt_place_card', cache_data))
+        return entry.value if entry else None
+
+    @classmethod
+    async def aset_gpt_place_card(cls, place_name: str, reviews: List[str], types: List[str], card: Dict) -> bool:
+        """set_gpt_place_card의 비동기 버전"""
+        return await cls._in_l2_thread(cls.set_gpt_place_card, place_name, reviews, types, card)
+
+    # --- single-flight: 같은 키에 대한 동시 miss를 한 번의 upstream 호출로 합침 ---
+    # --- stale-while-revalidate: soft TTL이 지난 값은 바로 반환하고 백그라운드에서 갱신 ---
+
+    @classmethod
+    def get_or_compute(cls, prefix: str, cache_data: Dict[str, Any], compute: Callable[[], Any],
+                       timeout: Optional[int] = None) -> Any:
+        """
+        캐시 조회 후 miss면 compute()로 계산해서 저장
+        - soft TTL이 지난 값은 그대로 반환하고 갱신은 백그라운드 스레드에서 진행
+        - 같은 프로세스의 동시 호출자는 첫 호출자(리더)의 결과를 기다림
+        - 공유 캐시(L2)가 있으면 lock 항목으로 다른 워커 프로세스와도 조율
+        """
+        cache_key = cls._generate_cache_key(prefix, cache_data)
+        timeout = timeout or cls.CACHE_TIMEOUTS[prefix]
+
+        entry = cls._lookup(cache_key)
+        if entry:
+            if not entry.is_fresh():
+                cache_metrics.record(prefix, 'stale')
+                cls._schedule_refresh(cache_key, compute, timeout)
+            return entry.value
+
+        return cls._coalesced_compute(cache_key, compute, timeout)
+
+    @classmethod
+    async def aget_or_compute(cls, prefix: str, cache_data: Dict[str, Any],
+                              compute: Callable[[], Awaitable[Any]], timeout: Optional[int] = None) -> Any:
+        """
+        get_or_compute의 비동기 버전 (compute는 코루틴 함수, 갱신은 같은 이벤트 루프의 task로 진행)
+        - L2 조회/저장/lock은 _in_l2_thread로 이벤트 루프 밖에서 실행
+        """
+        cache_key = cls._generate_cache_key(prefix, cache_data)
+        timeout = timeout or cls.CACHE_TIMEOUTS[prefix]
+
+        entry = await cls._alookup(cache_key)
+        if entry:
+            if not entry.is_fresh():
+                cache_metrics.record(prefix, 'stale')
+                cls._schedule_arefresh(cache_key, compute, timeout)
+            return entry.value
+
+        return await cls._acoalesced_compute(cache_key, compute, timeout)
+
+    @classmethod
+    def _coalesced_compute(cls, cache_key: str, compute: Callable[[], Any], timeout: int,
+                           wait_for_other: bool = True) -> Any:
+        with _inflight_lock:
+            call = _inflight.get(cache_key)
+            is_leader = call is None
+            if is_leader:
+                call = _inflight[cache_key] = _InFlight()
+
+        if not is_leader:
+            if call.event.wait(cls.SINGLE_FLIGHT_TIMEOUT) and not call.failed and call.result is not _SKIPPED:
+                logger.info(f"동시 요청 결과 공유: {cache_key}")
+                return call.result
+            # 리더가 실패했거나 너무 오래 걸리면 직접 계산
+            return cls._compute_and_store(cache_key, compute, timeout)
+
+        try:
+            call.result = cls._compute_with_lock(cache_key, compute, timeout, wait_for_other)
+            return call.result
+        except Exception:
+            call.failed = True
+            raise
+        finally:
+            with _inflight_lock:
+                _inflight.pop(cache_key, None)
+            call.event.set()
+
+    @classmethod
+    async def _acoalesced_compute(cls, cache_key: str, compute: Callable[[], Awaitable[Any]], timeout: int,
+                                  wait_for_other: bool = True) -> Any:
+        loop = asyncio.get_running_loop()
+        inflight = _async_inflight.setdefault(loop, {})
+        future = inflight.get(cache_key)
+        if future is not None:
+            try:
+                result = await asyncio.wait_for(asyncio.shield(future), cls.SINGLE_FLIGHT_TIMEOUT)
+                if result is not _SKIPPED:
+                    logger.info(f"동시 요청 결과 공유: {cache_key}")
+                    return result
+            except Exception:
+                pass
+            # 리더가 실패/지연/갱신 생략한 경우 직접 계산
+            return await cls._acompute_and_store(cache_key, compute, timeout)
+
+        future = inflight[cache_key] = loop.create_future()
+        try:
+            result = await cls._acompute_with_lock(cache_key, compute, timeout, wait_for_other)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            # 리더가 취소되면 기다리던 쪽은 각자 계산
+            future.set_result(_SKIPPED)
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # 기다리는 쪽이 없어도 경고가 남지 않도록 소비
+            raise
+        finally:
+            inflight.pop(cache_key, None)
+
+    @classmethod
+    def _claim_refresh(cls, cache_key: str) -> bool:
+        """이 프로세스에서 해당 키 갱신을 아직 아무도 맡지 않았으면 True"""
+        with _inflight_lock:
+            if cache_key in _refreshing or cache_key in _inflight:
+                return False
+            _refreshing.add(cache_key)
+            return True
+
+    @classmethod
+    def _schedule_refresh(cls, cache_key: str, compute: Callable[[], Any], timeout: int):
+        if not cls._claim_refresh(cache_key):
+            return
+
+        def refresh():
+            try:
+                # 다른 워커가 이미 갱신 중이면 기다리지 않고 넘어감
+                cls._coalesced_compute(cache_key, compute, timeout, wait_for_other=False)
+                logger.info(f"캐시 백그라운드 갱신: {cache_key}")
+            except Exception as e:
+                logger.error(f"캐시 백그라운드 갱신 실패: {cache_key} - {e}")
+            finally:
+                with _inflight_lock:
+                    _refreshing.discard(cache_key)
+                # 갱신 스레드에서 연 DB 연결 정리
+                close_old_connections()
+
+        try:
+            _get_refresh_executor().submit(refresh)
+        except RuntimeError:
+            # 인터프리터 종료 중에는 갱신 생략
+            with _inflight_lock:
+                _refreshing.discard(cache_key)
+
+    @classmethod
+    def _schedule_arefresh(cls, cache_key: str, compute: Callable[[], Awaitable[Any]], timeout: int):
+        if not cls._claim_refresh(cache_key):
+            return
+
+        async def refresh():
+            try:
+                await cls._acoalesced_compute(cache_key, compute, timeout, wait_for_other=False)
+                logger.info(f"캐시 백그라운드 갱신: {cache_key}")
+            except Exception as e:
+                logger.error(f"캐시 백그라운드 갱신 실패: {cache_key} - {e}")
+            finally:
+                with _inflight_lock:
+                    _refreshing.discard(cache_key)
+
+        # 응답을 막지 않도록 task로 띄우고, 끝날 때까지 참조 유지
+        task = asyncio.get_running_loop().create_task(refresh())
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+    @classmethod
+    def _compute_and_store(cls, cache_key: str, compute: Callable[[], Any], timeout: int) -> Any:
+        result = compute()
+        # 빈 결과는 조회 시에도 miss로 취급하므로 저장하지 않음
+        if result:
+            cls.set_cached_result(cache_key, result, timeout)
+        return result
+
+    @classmethod
+    async def _acompute_and_store(cls, cache_key: str, compute: Callable[[], Awaitable[Any]], timeout: int) -> Any:
+        result = await compute()
+        if result:
+            await cls._in_l2_thread(cls.set_cached_result, cache_key, result, timeout)
+        return result
+
+    @classmethod
+    def _try_lock(cls, lock_key: str) -> bool:
+        """공유 캐시에 lock 항목 생성 (L2가 없거나 실패하면 lock 없이 진행)"""
+        l2 = cls._l2()
+        if l2 is None:
+            return True
+        try:
+            return l2.add(lock_key, 1, cls.SINGLE_FLIGHT_TIMEOUT)
+        except Exception as e:
+            logger.error(f"캐시 lock 생성 실패: {e}")
+            return True
+
+    @classmethod
+    def _release_lock(cls, lock_key: str):
+        l2 = cls._l2()
+        if l2 is not None:
+            try:
+                l2.delete(lock_key)
+            except Exception as e:
+                logger.error(f"캐시 lock 해제 실패: {e}")
+
+    @classmethod
+    def _lock_released(cls, lock_key: str) -> bool:
+        l2 = cls._l2()
+        return l2 is None or not l2.has_key(lock_key)
+
+    @classmethod
+    def _fresh_result(cls, cache_key: str) -> Optional[Any]:
+        entry = cls._lookup(cache_key, count=False)
+        return entry.value if entry and entry.is_fresh() else None
+
+    @classmethod
+    async def _afresh_result(cls, cache_key: str) -> Optional[Any]:
+        entry = await cls._alookup(cache_key, count=False)
+        return entry.value if entry and entry.is_fresh() else None
+
+    @classmethod
+    def _compute_with_lock(cls, cache_key: str, compute: Callable[[], Any], timeout: int,
+                           wait_for_other: bool = True) -> Any:
+        lock_key = f"lock:{cache_key}"
+        if not cls._try_lock(lock_key):
+            if not wait_for_other:
+                return _SKIPPED
+            # 다른 워커가 계산 중 → 새 결과가 저장되거나 lock이 풀릴 때까지 대기
+            deadline = time.monotonic() + cls.SINGLE_FLIGHT_TIMEOUT
+            while time.monotonic() < deadline:
+                time.sleep(cls.SINGLE_FLIGHT_POLL_INTERVAL)
+                result = cls._fresh_result(cache_key)
+                if result:
+                    return result
+                if cls._lock_released(lock_key):
+                    break
+            return cls._compute_and_store(cache_key, compute, timeout)
+
+        try:
+            return cls._compute_and_store(cache_key, compute, timeout)
+        finally:
+            cls._release_lock(lock_key)
+
+    @classmethod
+    async def _acompute_with_lock(cls, cache_key: str, compute: Callable[[], Awaitable[Any]], timeout: int,
+                                  wait_for_other: bool = True) -> Any:
+        lock_key = f"lock:{cache_key}"
+        acquired = await cls._in_l2_thread(cls._try_lock, lock_key)
+        if not acquired:
+            if not wait_for_other:
+                return _SKIPPED
+            deadline = time.monotonic() + cls.SINGLE_FLIGHT_TIMEOUT
+            while time.monotonic() < deadline:
+                await asyncio.sleep(cls.SINGLE_FLIGHT_POLL_INTERVAL)
+                result = await cls._afresh_result(cache_key)
+                if result:
+                    return result
+                if await cls._in_l2_thread(cls._lock_released, lock_key):
+                    break
+
+        try:
+            return await cls._acompute_and_store(cache_key, compute, timeout)
+        finally:
+            if acquired:
+                await cls._in_l2_thread(cls._release_lock, lock_key)
@@ -0,0 +1,67 @@
+# 동네 × 업종 후보 가게 풀 조회 (요청 시 Google Text Search 대신 로컬 DB 사용)
+# - refresh_candidate_pool 명령이 data/location.csv의 동네별로 미리 채워 둠
+# - 풀에 없는 주소(알려진 동네가 아니거나 아직 채우지 않은 동네)는 None → 호출한 쪽에서 실시간 검색
+
+from community.models import Location
+from ..models import CandidatePlace
+
+# 업종 → Text Search 검색어 접미사
+CATEGORY_QUERIES = {
+    "restaurant": "맛집",
+    "cafe": "카페",
+}
+
+
+def category_for(allowed_types):
+    return "cafe" if "cafe" in (allowed_types or []) else "restaurant"
+
+
+def match_location(address):
+    """주소/동네명에 포함된 Location (여러 개면 이름이 가장 긴 것, 없으면 None)"""
+    if not address:
+        return None
+    matches = [location for location in Location.objects.all() if location.name and location.name in address]
+    return max(matches, key=lambda location: len(location.name)) if matches else None
+
+
+def _as_search_result(candidate):
+    """CandidatePlace → Text Search 결과 항목 형식 (기존 파서를 그대로 쓰기 위해)"""
+    result = {
+        "place_id": candidate.google_place_id,
+        "name": candidate.name,
+        "formatted_address": candidate.address,
+        "types": candidate.place_types or [],
+        "rating": candidate.rating,
+        "user_ratings_total": candidate.user_ratings_total,
+        "price_level": candidate.price_level,
+        "photos": [{"photo_reference": candidate.photo_reference}] if candidate.photo_reference else [],
+    }
+    if candidate.lat is not None and candidate.lng is not None:
+        result["geometry"] = {"location": {"lat": candidate.lat, "lng": candidate.lng}}
+    return result
+
+
+def search_results(address, categories):
+    """
+    주소가 속한 동네의 후보 풀을 Text Search 응답 형식({"status", "results"})으로 반환
+    - categories: 합칠 업종 목록 (같은 가게는 한 번만)
+    - 동네를 모르거나 풀이 비어 있으면 None
+    """
+    location = match_location(address)
+    if location is None:
+        return None
+
+    candidates = (
+        CandidatePlace.objects
+        .filter(location=location, category__in=categories)
+        .order_by("rank", "candidate_id")
+    )
+
+    results, seen = [], set()
+    for candidate in candidates:
+        if candidate.google_place_id in seen:
+            continue
+        seen.add(candidate.google_place_id)
+        results.append(_as_search_result(candidate))
+
+    return {"status": "OK", "results": results} if results else None
@@ -1,26 +1,15 @@
 # services/emotion_service.py
-from openai import OpenAI
-from django.conf import settings
+from asgiref.sync import sync_to_async
 from community.models import Emotion
 from .cache_service import CacheService
+from .emotion_similarity import related_emotions
+from .gpt_client import chat, achat, GPTBudgetExceededError
 import json
 
-client = OpenAI(api_key=settings.OPENAI_API_KEY)
 
-def expand_emotions_with_gpt(emotion_tags):
-    """
-    입력된 emotion_tags와 비슷한 감정을 GPT를 통해 확장 (캐싱 적용)
-    DB에 실제 존재하는 Emotion 객체 리스트 반환
-    """
-    # 캐시에서 먼저 조회
-    cached_expanded = CacheService.cache_gpt_emotion_expansion(emotion_tags)
-    if cached_expanded:
-        return Emotion.objects.filter(name__in=cached_expanded)
-
-    all_emotions = list(Emotion.objects.values_list("name", flat=True))
-
-    prompt = f"""
-    당신은 감정 분류 전문가입니다. 
+def _expansion_prompt(all_emotions, emotion_tags):
+    return f"""
+    당신은 감정 분류 전문가입니다.
     아래는 사용할 수 있는 감정 태그 목록입니다 (이 목록 외 단어는 절대 사용하지 마세요):
 
     {", ".join(all_emotions)}
@@ -34,23 +23,81 @@ def expand_emotions_with_gpt(emotion_tags):
     - 설명, 불필요한 텍스트, 주석 없이 결과만 출력하세요.
     """
 
-    completion = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0.2,   # 낮춰서 안정성 ↑
-        max_tokens=150
-    )
-
-    result_text = completion.choices[0].message.content.strip()
 
+def _parse_expanded_names(result_text):
     try:
-        expanded_names = json.loads(result_text)  # JSON 파싱
+        return json.loads(result_text)  # JSON 파싱
     except json.JSONDecodeError:
         # 혹시라도 JSON 실패하면 fallback으로 콤마 split
-        expanded_names = [name.strip() for name in result_text.split(",")]
+        return [name.strip() for name in result_text.split(",")]
+
+
+def expand_emotions_with_gpt(emotion_tags):
+    """
+    입력된 emotion_tags와 비슷한 감정을 GPT를 통해 확장 (캐싱 적용)
+    DB에 실제 존재하는 Emotion 객체 리스트 반환
+    """
+    def expand():
+        all_emotions = list(Emotion.objects.values_list("name", flat=True))
+
+        result_text = chat(
+            _expansion_prompt(all_emotions, emotion_tags),
+            kind="emotion_expansion",
+            temperature=0.2,   # 낮춰서 안정성 ↑
+            max_tokens=150
+        )
+        return _parse_expanded_names(result_text)
 
-    # 결과를 캐시에 저장
-    CacheService.set_gpt_emotion_expansion(emotion_tags, expanded_names)
+    # 캐시 조회 → 없으면 GPT 확장 (같은 감정 조합 동시 요청은 1회 호출로 합침)
+    # 하루 예산 초과면 확장 없이 입력 감정만 사용
+    try:
+        expanded_names = CacheService.get_or_compute(
+            'gpt_emotion_expansion', {'emotion_tags': emotion_tags}, expand
+        )
+    except GPTBudgetExceededError:
+        expanded_names = emotion_tags
 
     # DB에 실제 존재하는 감정만 필터링
     return Emotion.objects.filter(name__in=expanded_names)
+
+
+async def aexpand_emotions_with_gpt(emotion_tags):
+    """expand_emotions_with_gpt의 비동기 버전 → Emotion 객체 리스트"""
+    async def expand():
+        all_emotions = await sync_to_async(list)(Emotion.objects.values_list("name", flat=True))
+        result_text = await achat(
+            _expansion_prompt(all_emotions, emotion_tags),
+            kind="emotion_expansion",
+            temperature=0.2,
+            max_tokens=150
+        )
+        return _parse_expanded_names(result_text)
+
+    try:
+        expanded_names = await CacheService.aget_or_compute(
+            'gpt_emotion_expansion', {'emotion_tags': emotion_tags}, expand
+        )
+    except GPTBudgetExceededError:
+        expanded_names = emotion_tags
+
+    return await sync_to_async(list)(Emotion.objects.filter(name__in=expanded_names))
+
+
+def expand_emotions(emotion_tags):
+    """
+    입력 감정 확장 → Emotion 객체 리스트
+    - 미리 계산한 감정 유사도 행렬로 먼저 처리 (GPT 호출 없음)
+    - 행렬이 없거나 모르는 감정뿐이면 expand_emotions_with_gpt
+    """
+    names = related_emotions(emotion_tags)
+    if names is None:
+        return expand_emotions_with_gpt(emotion_tags)
+    return Emotion.objects.filter(name__in=names)
+
+
+async def aexpand_emotions(emotion_tags):
+    """expand_emotions의 비동기 버전"""
+    names = related_emotions(emotion_tags)
+    if names is None:
+        return await aexpand_emotions_with_gpt(emotion_tags)
+    return await sync_to_async(list)(Emotion.objects.filter(name__in=names))
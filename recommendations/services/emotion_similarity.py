@@ -0,0 +1,161 @@
+# 감정 태그 유사도 (GPT 없이 감정 확장)
+# - build_emotion_similarity 명령으로 Place/Memory/SearchShop의 감정 동시 등장(co-occurrence)에서 유사도 행렬을 미리 계산
+# - data/emotion_embeddings.json ({감정: [벡터]})이 있으면 임베딩 코사인 유사도를 섞어서 데이터가 적은 감정도 보완
+# - 요청 시에는 행렬 행 합산 + 정렬만 수행
+
+import json
+import os
+import threading
+import time
+
+import numpy as np
+from django.conf import settings
+
+from community.models import Emotion, Memory
+from search.models import SearchShop
+from ..models import Place
+
+SIMILARITY_PATH = os.path.join(settings.BASE_DIR, "data", "emotion_similarity.json")
+EMBEDDING_PATH = os.path.join(settings.BASE_DIR, "data", "emotion_embeddings.json")
+
+DEFAULT_TOP_K = 4           # 입력 감정 외에 추가할 감정 수
+MIN_SIMILARITY = 0.05       # 입력 감정 1개당 평균 유사도가 이보다 낮으면 관련 없는 감정으로 봄
+MTIME_CHECK_INTERVAL = 5    # 행렬 파일 변경 여부 확인 간격 (초)
+
+# 감정 태그가 달린 모델 → 감정 ManyToMany 필드
+EMOTION_SOURCES = ((Place, "emotions"), (Memory, "emotion_id"), (SearchShop, "emotion_id"))
+
+
+def _cosine(vectors):
+    """행 벡터끼리 코사인 유사도 (영벡터 행은 0)"""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    unit = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+    return unit @ unit.T
+
+
+def _emotion_documents(index):
+    """가게/글마다 달린 감정 index 묶음 (ManyToMany through 테이블 직접 조회)"""
+    for model, field in EMOTION_SOURCES:
+        through = getattr(model, field).through
+        owner = f"{model._meta.model_name}_id"
+        groups = {}
+        for owner_id, emotion_id in through.objects.values_list(owner, "emotion_id").iterator():
+            if emotion_id in index:
+                groups.setdefault(owner_id, []).append(index[emotion_id])
+        yield from groups.values()
+
+
+def _embedding_similarity(names, path=EMBEDDING_PATH):
+    """정적 임베딩 테이블 기반 유사도와 임베딩이 있는 감정 mask (파일이 없으면 None)"""
+    if not os.path.exists(path):
+        return None, None
+    with open(path, encoding="utf-8") as f:
+        table = json.load(f)
+
+    dim = len(next(iter(table.values()), []))
+    vectors = np.zeros((len(names), dim), dtype=np.float64)
+    known = np.zeros(len(names), dtype=bool)
+    for i, name in enumerate(names):
+        if name in table:
+            vectors[i] = table[name]
+            known[i] = True
+    return _cosine(vectors), known
+
+
+def build_similarity(embedding_weight=0.3):
+    """
+    Emotion 테이블 전체에 대한 유사도 행렬 계산 → (감정 이름 리스트, 행렬, 사용한 문서 수)
+    - 동시 등장 유사도: 감정별 등장 벡터의 코사인 (C_ij / sqrt(C_ii * C_jj))
+    - 임베딩이 있는 감정 쌍은 embedding_weight 비율로 임베딩 유사도를 섞음
+    """
+    emotions = list(Emotion.objects.order_by("emotion_id").values_list("emotion_id", "name"))
+    names = [name for _, name in emotions]
+    index = {emotion_id: i for i, (emotion_id, _) in enumerate(emotions)}
+
+    counts = np.zeros((len(names), len(names)), dtype=np.float64)
+    documents = 0
+    for ids in _emotion_documents(index):
+        ids = np.unique(ids)
+        counts[np.ix_(ids, ids)] += 1
+        documents += 1
+
+    diag = np.sqrt(np.diag(counts))
+    denom = np.outer(diag, diag)
+    matrix = np.divide(counts, denom, out=np.zeros_like(counts), where=denom > 0)
+
+    embedding, known = _embedding_similarity(names)
+    if embedding is not None:
+        pair_known = np.outer(known, known)
+        matrix = np.where(pair_known, (1 - embedding_weight) * matrix + embedding_weight * embedding, matrix)
+
+    np.fill_diagonal(matrix, 1.0)
+    return names, matrix, documents
+
+
+def save_similarity(names, matrix, path=SIMILARITY_PATH):
+    # 임시 파일에 쓴 뒤 교체 → 서버가 읽는 도중 깨진 파일을 보지 않도록
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"emotions": names, "matrix": np.round(matrix, 4).tolist()}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+class EmotionSimilarity:
+    """미리 계산한 감정 유사도 행렬 (생성 후 읽기 전용)"""
+
+    def __init__(self, names, matrix):
+        self.names = list(names)
+        self.matrix = np.asarray(matrix, dtype=np.float32)
+        self._index = {name: i for i, name in enumerate(self.names)}
+
+    @classmethod
+    def from_file(cls, path=SIMILARITY_PATH):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["emotions"], data["matrix"])
+
+    def related(self, emotion_tags, k=DEFAULT_TOP_K):
+        """
+        입력 감정 + 가장 가까운 감정 최대 k개 (입력 감정 이름 순서 유지)
+        - 아는 감정이 없거나 관련 감정을 하나도 못 찾으면 None → 호출한 쪽에서 GPT로 처리
+        """
+        ids = list(dict.fromkeys(self._index[tag] for tag in emotion_tags if tag in self._index))
+        if not ids:
+            return None
+
+        scores = self.matrix[ids].sum(axis=0)
+        scores[ids] = -np.inf
+        order = np.argsort(-scores, kind="stable")[:k]
+        related = [self.names[i] for i in order if scores[i] >= MIN_SIMILARITY * len(ids)]
+        if not related:
+            return None
+        return [self.names[i] for i in ids] + related
+
+
+_model = None
+_model_mtime = None
+_model_checked = None
+_model_lock = threading.Lock()
+
+
+def get_model():
+    """현재 유사도 모델 (행렬 파일이 없으면 None, 파일이 바뀌었으면 다시 읽음)"""
+    global _model, _model_mtime, _model_checked
+
+    now = time.monotonic()
+    if _model_checked is not None and now - _model_checked < MTIME_CHECK_INTERVAL:
+        return _model
+
+    with _model_lock:
+        mtime = os.stat(SIMILARITY_PATH).st_mtime_ns if os.path.exists(SIMILARITY_PATH) else None
+        if mtime != _model_mtime:
+            _model = EmotionSimilarity.from_file(SIMILARITY_PATH) if mtime else None
+            _model_mtime = mtime
+        _model_checked = now
+    return _model
+
+
+def related_emotions(emotion_tags, k=DEFAULT_TOP_K):
+    """입력 감정과 비슷한 감정 이름 리스트 (로컬 모델로 못 구하면 None)"""
+    model = get_model()
+    return model.related(emotion_tags, k) if model else None
@@ -0,0 +1,264 @@
+# 후보 가게 병렬 보강 (Google 상세정보 + GPT 요약/감정태그)
+
+import asyncio
+import logging
+import time
+from concurrent.futures import wait, FIRST_COMPLETED
+
+from django.conf import settings
+from search.service.summary_card import (
+    generate_summary_card, generate_emotion_tags,
+    agenerate_summary_card, agenerate_emotion_tags,
+    generate_place_cards, agenerate_place_cards, agenerate_place_card, get_default_emotion_tags_by_types,
+)
+from search.service.address import translate_to_korean, atranslate_to_korean
+from .google_service import get_place_details, aget_place_details
+from .utils import extract_neighborhood
+from .workers import submit
+
+logger = logging.getLogger(__name__)
+
+
+def _deadline(deadline):
+    """후보 보강 전체 시간 상한 (초, 기본 RECOMMENDATION_ENRICH_DEADLINE)"""
+    return getattr(settings, "RECOMMENDATION_ENRICH_DEADLINE", 20) if deadline is None else deadline
+
+
+def enrich_candidate(candidate):
+    """
+    후보 가게 1개에 대한 네트워크 작업만 수행 (DB 저장은 호출한 쪽에서)
+    - Google 상세정보, 이름/주소 한국어 정규화, GPT 요약, 감정태그
+    """
+    place_id = candidate.get("place_id")
+    place_name = candidate.get("name")
+
+    details = get_place_details(place_id, place_name)
+    reviews = [r["text"] for r in details.get("reviews", [])]
+    uptaenms = details.get("types", [])
+
+    # 주소/이름 한국어 정규화
+    name_ko = translate_to_korean(details.get("name")) if details.get("name") else None
+    address_ko = translate_to_korean(details.get("formatted_address")) if details.get("formatted_address") else None
+
+    # GPT 요약 + 감정태그 생성
+    summary = generate_summary_card(details, reviews, uptaenms) if reviews else None
+    tags = generate_emotion_tags(details, reviews, uptaenms)
+
+    return _build_enriched(candidate, details, name_ko, address_ko, summary, tags)
+
+
+async def aenrich_candidate(candidate):
+    """enrich_candidate의 비동기 버전 - 상세조회 후 GPT 호출 4개를 동시에 진행"""
+    details = await aget_place_details(candidate.get("place_id"), candidate.get("name"))
+    reviews = [r["text"] for r in details.get("reviews", [])]
+    uptaenms = details.get("types", [])
+
+    async def summarize():
+        if not reviews:
+            return None
+        return await agenerate_summary_card(details, reviews, uptaenms)
+
+    name_ko, address_ko, summary, tags = await asyncio.gather(
+        atranslate_to_korean(details.get("name")),
+        atranslate_to_korean(details.get("formatted_address")),
+        summarize(),
+        agenerate_emotion_tags(details, reviews, uptaenms),
+    )
+
+    return _build_enriched(candidate, details, name_ko, address_ko, summary, tags)
+
+
+def prepare_candidate(candidate):
+    """enrich_candidate에서 GPT 요약/감정태그를 뺀 단계 (일괄 생성용)"""
+    details = get_place_details(candidate.get("place_id"), candidate.get("name"))
+    name_ko = translate_to_korean(details.get("name")) if details.get("name") else None
+    address_ko = translate_to_korean(details.get("formatted_address")) if details.get("formatted_address") else None
+    return candidate, details, name_ko, address_ko
+
+
+async def aprepare_candidate(candidate):
+    """prepare_candidate의 비동기 버전"""
+    details = await aget_place_details(candidate.get("place_id"), candidate.get("name"))
+    name_ko, address_ko = await asyncio.gather(
+        atranslate_to_korean(details.get("name")),
+        atranslate_to_korean(details.get("formatted_address")),
+    )
+    return candidate, details, name_ko, address_ko
+
+
+def _card_inputs(prepared):
+    """리뷰가 있는 후보만 가게 카드 입력으로 (리뷰 없는 후보는 요약을 동네 안내문으로 대체하므로 GPT 불필요)"""
+    return [
+        (details, [r["text"] for r in details["reviews"]], details.get("types", []))
+        for _, details, _, _ in prepared if details.get("reviews")
+    ]
+
+
+def _build_from_cards(prepared, cards):
+    cards = iter(cards)
+    enriched = []
+    for candidate, details, name_ko, address_ko in prepared:
+        if details.get("reviews"):
+            card = next(cards)
+            summary, tags = card["summary"], card["emotion_tags"]
+        else:
+            summary, tags = None, get_default_emotion_tags_by_types(details.get("types", []))
+        enriched.append(_build_enriched(candidate, details, name_ko, address_ko, summary, tags))
+    return enriched
+
+
+def enrich_candidates_batched(candidates, limit=5, deadline=None):
+    """
+    enrich_candidates와 같은 결과를 GPT 일괄 호출로 생성
+    - 상세조회/이름·주소 정규화는 후보별로 병렬 진행
+    - 요약/키워드/감정태그는 완료된 후보들을 묶어 generate_place_cards 1~2회로 처리
+    - deadline은 두 단계 합계 기준 (카드 생성은 남은 시간만큼만 기다리고, 못 끝낸 가게는 기본값 카드)
+    """
+    deadline = _deadline(deadline)
+    end_time = time.monotonic() + deadline
+    prepared = enrich_candidates(candidates, enrich_fn=prepare_candidate, limit=limit, deadline=deadline)
+    cards = generate_place_cards(_card_inputs(prepared), deadline=max(0.0, end_time - time.monotonic()))
+    return _build_from_cards(prepared, cards)
+
+
+async def aenrich_candidates_batched(candidates, limit=5, deadline=None):
+    """enrich_candidates_batched의 비동기 버전"""
+    deadline = _deadline(deadline)
+    end_time = time.monotonic() + deadline
+    prepared = await aenrich_candidates(candidates, enrich_fn=aprepare_candidate, limit=limit, deadline=deadline)
+    cards = await agenerate_place_cards(_card_inputs(prepared), deadline=max(0.0, end_time - time.monotonic()))
+    return _build_from_cards(prepared, cards)
+
+
+async def aenrich_candidate_carded(candidate):
+    """
+    aprepare_candidate + 가게 카드 1회 호출 (스트리밍 응답용)
+    - 다른 후보를 기다리지 않고 후보마다 바로 완성 (카드는 일괄 생성과 같은 캐시 사용)
+    """
+    prepared = await aprepare_candidate(candidate)
+    cards = [await agenerate_place_card(*inputs) for inputs in _card_inputs([prepared])]
+    return _build_from_cards([prepared], cards)[0]
+
+
+def _build_enriched(candidate, details, name_ko, address_ko, summary, tags):
+    place_name = candidate.get("name")
+
+    photo_ref = ""
+    if details.get("photos"):
+        photo_ref = details["photos"][0].get("photo_reference", "")
+
+    if details.get("reviews"):
+        summary = summary or "요약 준비중입니다"
+    else:
+        neighborhood = extract_neighborhood(address_ko or candidate.get("address"))
+        summary = f"{place_name}은 {neighborhood}에 위치한 가게입니다"
+
+    return {
+        "place_id": candidate.get("place_id"),
+        "name": name_ko or place_name,
+        "address": address_ko or candidate.get("address"),
+        "address_ko": address_ko,
+        "photo_reference": photo_ref,
+        "summary": summary,
+        "tags": tags or [],
+        "types": details.get("types") or candidate.get("types") or [],
+    }
+
+
+def enrich_candidates(candidates, enrich_fn=enrich_candidate, limit=5, deadline=None):
+    """
+    후보 가게들을 스레드풀에서 병렬로 보강
+    - 동시에 최대 limit개만 진행, 실패(None/예외)한 후보는 다음 후보로 대체
+    - 결과는 입력 순서대로 상위 limit개 반환
+    - deadline(초)을 넘기면 그때까지 완료된 결과만 반환
+    """
+    deadline = _deadline(deadline)
+    end_time = time.monotonic() + deadline
+    results = {}   # 후보 index -> 보강 결과
+    pending = {}   # future -> 후보 index
+    next_idx = 0
+
+    def fill():
+        nonlocal next_idx
+        while next_idx < len(candidates) and len(results) + len(pending) < limit:
+            pending[submit(enrich_fn, candidates[next_idx])] = next_idx
+            next_idx += 1
+
+    fill()
+    while pending:
+        remaining = end_time - time.monotonic()
+        if remaining <= 0:
+            logger.warning(f"후보 보강 deadline 초과({deadline}초): {len(pending)}개 미완료")
+            break
+
+        done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        for future in done:
+            idx = pending.pop(future)
+            try:
+                value = future.result()
+            except Exception as e:
+                logger.error(f"후보 보강 실패 ({candidates[idx].get('name')}): {e}")
+                value = None
+            if value is not None:
+                results[idx] = value
+        fill()
+
+    # 아직 시작하지 않은 작업은 취소 (진행 중인 작업은 백그라운드에서 마무리됨)
+    for future in pending:
+        future.cancel()
+
+    return [results[idx] for idx in sorted(results)][:limit]
+
+
+async def aiter_enriched(candidates, enrich_fn=aenrich_candidate, limit=5, deadline=None):
+    """
+    aenrich_candidates와 같은 대체/deadline 규칙으로 보강하되, 완료되는 순서대로 (후보 index, 결과) 반환
+    - 이터레이터를 중간에 닫으면(클라이언트 연결 종료 등) 진행 중인 작업 취소
+    """
+    deadline = _deadline(deadline)
+
+    loop = asyncio.get_running_loop()
+    end_time = loop.time() + deadline
+    finished = 0
+    pending = {}
+    next_idx = 0
+
+    def fill():
+        nonlocal next_idx
+        while next_idx < len(candidates) and finished + len(pending) < limit:
+            pending[asyncio.ensure_future(enrich_fn(candidates[next_idx]))] = next_idx
+            next_idx += 1
+
+    try:
+        fill()
+        while pending:
+            remaining = end_time - loop.time()
+            if remaining <= 0:
+                logger.warning(f"후보 보강 deadline 초과({deadline}초): {len(pending)}개 미완료")
+                break
+
+            done, _ = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                idx = pending.pop(task)
+                try:
+                    value = task.result()
+                except Exception as e:
+                    logger.error(f"후보 보강 실패 ({candidates[idx].get('name')}): {e}")
+                    value = None
+                if value is not None:
+                    finished += 1
+                    yield idx, value
+            fill()
+    finally:
+        # 비동기 경로는 미완료 작업을 바로 취소할 수 있음
+        for task in pending:
+            task.cancel()
+
+
+async def aenrich_candidates(candidates, enrich_fn=aenrich_candidate, limit=5, deadline=None):
+    """enrich_candidates의 비동기 버전 (동일한 순서/대체/deadline 규칙)"""
+    results = {
+        idx: value
+        async for idx, value in aiter_enriched(candidates, enrich_fn=enrich_fn, limit=limit, deadline=deadline)
+    }
+    return [results[idx] for idx in sorted(results)][:limit]
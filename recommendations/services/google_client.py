@@ -0,0 +1,176 @@
+# Google Maps API 공통 클라이언트
+# - keep-alive 커넥션 풀 (동기: requests.Session, 비동기: 루프별 httpx.AsyncClient)
+# - 엔드포인트별 타임아웃, 5xx/OVER_QUERY_LIMIT 지터 재시도
+# - 프로세스 단위 token bucket으로 초당 호출량 제한
+# - 엔드포인트별 지연 시간 히스토그램 기록 (latency, 작업 이름 "google:<endpoint>")
+
+import asyncio
+import logging
+import random
+import threading
+import time
+import weakref
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+from . import latency, tracing
+from .rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_MAPS_BASE_URL = "https://maps.googleapis.com/maps/api"
+
+# (connect, read) 타임아웃 (초)
+ENDPOINT_TIMEOUTS = {
+    "place/textsearch": (3.05, 10),
+    "place/details": (3.05, 8),
+    "geocode": (3.05, 5),
+}
+DEFAULT_TIMEOUT = (3.05, 10)
+
+MAX_RETRIES = 2
+BACKOFF_BASE = 0.2   # 재시도 대기: 0 ~ BACKOFF_BASE * 2^attempt 사이 랜덤 (full jitter)
+RETRY_STATUSES = {"OVER_QUERY_LIMIT", "UNKNOWN_ERROR"}
+SUCCESS_STATUSES = {"OK", "ZERO_RESULTS"}
+
+
+_bucket = TokenBucket(
+    rate=getattr(settings, "GOOGLE_MAPS_RATE_LIMIT", 50),
+    capacity=getattr(settings, "GOOGLE_MAPS_RATE_BURST", 50),
+)
+
+_session = None
+_session_lock = threading.Lock()
+
+# httpx.AsyncClient는 이벤트 루프에 묶이므로 루프별로 하나씩 생성
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def get_session():
+    """프로세스 전역 requests.Session (스레드풀 워커 수만큼 커넥션 유지)"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                pool_size = getattr(settings, "GOOGLE_MAPS_POOL_SIZE", 32)
+                session = requests.Session()
+                session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=pool_size))
+                _session = session
+    return _session
+
+
+def get_async_client():
+    """현재 이벤트 루프에서 재사용할 httpx.AsyncClient (keep-alive)"""
+    import httpx  # ASGI 경로에서만 필요
+
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=getattr(settings, "GOOGLE_MAPS_POOL_SIZE", 32)),
+        )
+        _async_clients[loop] = client
+    return client
+
+
+def _url(endpoint):
+    return f"{GOOGLE_MAPS_BASE_URL}/{endpoint}/json"
+
+
+def _backoff(attempt):
+    return random.uniform(0, BACKOFF_BASE * (2 ** attempt))
+
+
+def _should_retry(status_code, data):
+    if status_code >= 500 or status_code == 429:
+        return True
+    return isinstance(data, dict) and data.get("status") in RETRY_STATUSES
+
+
+def _parse(response):
+    """성공 응답 본문 → JSON (4xx/5xx는 HTML 오류 페이지일 수 있으므로 파싱하지 않고 None - 상태 코드로 재시도/raise_for_status)"""
+    return response.json() if response.status_code < 400 else None
+
+
+def _succeeded(data):
+    return isinstance(data, dict) and data.get("status") in SUCCESS_STATUSES
+
+
+def get_json(endpoint, params):
+    """
+    Google Maps API 동기 GET → JSON
+    - endpoint: 'place/textsearch', 'place/details', 'geocode' 등
+    - 네트워크 오류/5xx는 재시도 후에도 실패하면 예외, OVER_QUERY_LIMIT는 마지막 응답 반환
+    - 재시도를 포함한 전체 시간을 기록 (예외나 OK/ZERO_RESULTS 외 상태는 오류)
+    """
+    started = time.perf_counter()
+    data = None
+    try:
+        with tracing.span(f"google:{endpoint}"):
+            data = _fetch_json(endpoint, params)
+        return data
+    finally:
+        latency.record(f"google:{endpoint}", time.perf_counter() - started, error=not _succeeded(data))
+
+
+async def aget_json(endpoint, params):
+    """get_json의 비동기 버전 (같은 타임아웃/재시도/호출량 제한/기록)"""
+    started = time.perf_counter()
+    data = None
+    try:
+        with tracing.span(f"google:{endpoint}"):
+            data = await _afetch_json(endpoint, params)
+        return data
+    finally:
+        latency.record(f"google:{endpoint}", time.perf_counter() - started, error=not _succeeded(data))
+
+
+def _fetch_json(endpoint, params):
+    timeout = ENDPOINT_TIMEOUTS.get(endpoint, DEFAULT_TIMEOUT)
+    for attempt in range(MAX_RETRIES + 1):
+        _bucket.acquire()
+        last_attempt = attempt == MAX_RETRIES
+        try:
+            response = get_session().get(_url(endpoint), params=params, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if last_attempt:
+                raise
+            logger.warning(f"Google Maps {endpoint} 요청 실패, 재시도 {attempt + 1}/{MAX_RETRIES}: {e}")
+            time.sleep(_backoff(attempt))
+            continue
+
+        data = _parse(response)
+        if last_attempt or not _should_retry(response.status_code, data):
+            response.raise_for_status()
+            return data
+
+        logger.warning(f"Google Maps {endpoint} 응답 {response.status_code}/{(data or {}).get('status')}, 재시도 {attempt + 1}/{MAX_RETRIES}")
+        time.sleep(_backoff(attempt))
+
+
+async def _afetch_json(endpoint, params):
+    import httpx
+
+    connect, read = ENDPOINT_TIMEOUTS.get(endpoint, DEFAULT_TIMEOUT)
+    timeout = httpx.Timeout(read, connect=connect)
+    for attempt in range(MAX_RETRIES + 1):
+        await _bucket.aacquire()
+        last_attempt = attempt == MAX_RETRIES
+        try:
+            response = await get_async_client().get(_url(endpoint), params=params, timeout=timeout)
+        except httpx.TransportError as e:
+            if last_attempt:
+                raise
+            logger.warning(f"Google Maps {endpoint} 요청 실패, 재시도 {attempt + 1}/{MAX_RETRIES}: {e}")
+            await asyncio.sleep(_backoff(attempt))
+            continue
+
+        data = _parse(response)
+        if last_attempt or not _should_retry(response.status_code, data):
+            response.raise_for_status()
+            return data
+
+        logger.warning(f"Google Maps {endpoint} 응답 {response.status_code}/{(data or {}).get('status')}, 재시도 {attempt + 1}/{MAX_RETRIES}")
+        await asyncio.sleep(_backoff(attempt))
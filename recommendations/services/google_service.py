@@ -1,56 +1,48 @@
 # 구글맵 API 연동
 
-import requests
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from . import candidate_pool, ranking
 from .cache_service import CacheService
+from .google_client import get_json, aget_json
 
 API_KEY = settings.GOOGLE_API_KEY
 
 
-def get_place_details(place_id, place_name=None):
-    """
-    Google Places Details API로 특정 place_id의 상세 정보 가져오기 (캐싱 적용)
-    """
-    # 캐시에서 먼저 조회
-    cached_result = CacheService.cache_google_place_details(place_id)
-    if cached_result:
-        return cached_result
-    
-    params = {
+def _place_details_params(place_id):
+    return {
         "place_id": place_id,
         "key": API_KEY,
         "language": "ko",
         "fields": "name,formatted_address,geometry,types,rating,photos,reviews"
     }
-    response = requests.get(
-        "https://maps.googleapis.com/maps/api/place/details/json", 
-        params=params
-    )
-    data = response.json()
-    result = data.get("result", {})
-    
-    # 결과를 캐시에 저장
-    CacheService.set_google_place_details(place_id, result)
-    
-    return result
-
-
-def get_similar_places(address, emotion_names, allowed_types=None, max_results=8):
-    query = f"{address} 맛집" if "cafe" not in (allowed_types or []) else f"{address} 카페"
-    
-    # 캐시에서 먼저 조회
-    cached_results = CacheService.cache_google_places_search(query, address, allowed_types or [])
-    if cached_results:
-        return cached_results[:max_results]
-
-    params = {
-        "query": query,
-        "key": API_KEY,
-        "language": "ko"
-    }
-    response = requests.get("https://maps.googleapis.com/maps/api/place/textsearch/json", params=params)
-    data = response.json()
 
+
+def get_place_details(place_id, place_name=None):
+    """
+    Google Places Details API로 특정 place_id의 상세 정보 가져오기 (캐싱 + 동시 요청 합치기)
+    """
+    def fetch():
+        return get_json("place/details", _place_details_params(place_id)).get("result", {})
+
+    return CacheService.get_or_compute('google_place_details', {'place_id': place_id}, fetch)
+
+
+async def aget_place_details(place_id, place_name=None):
+    """get_place_details의 비동기 버전 (ASGI 경로용)"""
+    async def fetch():
+        data = await aget_json("place/details", _place_details_params(place_id))
+        return data.get("result", {})
+
+    return await CacheService.aget_or_compute('google_place_details', {'place_id': place_id}, fetch)
+
+
+def _similar_places_query(address, allowed_types):
+    return f"{address} 맛집" if "cafe" not in (allowed_types or []) else f"{address} 카페"
+
+
+def _filter_similar_places(data, allowed_types):
+    """Text Search 응답에서 업태가 맞는 후보만 골라 점수 계산에 필요한 필드로 정리"""
     results = []
     for r in data.get("results", []):
         types = r.get("types", [])
@@ -63,30 +55,74 @@ def get_similar_places(address, emotion_names, allowed_types=None, max_results=8
             if "cafe" in types:
                 continue
 
-        # 점수 계산
-        score = 0
-        if any(keyword in r.get("name", "") for keyword in emotion_names):
-            score += 2
-        if "cafe" in types:
-            score += 3
-        score += r.get("rating", 0)
-        score += len(r.get("reviews", [])) * 0.5
-
         results.append({
             "place_id": r.get("place_id"),
             "name": r.get("name"),
             "address": r.get("formatted_address"),
             "photo_reference": r["photos"][0]["photo_reference"] if r.get("photos") else "",
-            "_score": score,
+            "types": types,
+            "rating": r.get("rating", 0),
+            "user_ratings_total": r.get("user_ratings_total", 0),
+            "geometry": r.get("geometry", {}),
         })
+    return results
+
+
+def _rank(candidates, emotion_names, user_id, origin, max_results):
+    if origin is None:
+        origin = ranking.candidates_origin(candidates)
+    context = ranking.load_context([c["place_id"] for c in candidates], user_id)
+    return ranking.rank_candidates(candidates, emotion_names, context, origin)[:max_results]
+
+
+def _similar_places_cache_data(query, address, allowed_types):
+    return {'query': query, 'location': address, 'allowed_types': allowed_types or [], 'format': 'candidates'}
+
+
+def get_similar_places(address, emotion_names, allowed_types=None, max_results=8, user_id=None, origin=None):
+    """
+    주소 주변 후보 가게 (ranking 모듈 점수순)
+    - 알려진 동네면 후보 풀(CandidatePlace)에서 조회, 아니면 Text Search (캐싱 + 동시 요청 합치기)
+    - 점수는 요청마다 계산 (요청 감정, 사용자 저장 이력, 기준 위치 origin=(lat, lng) 반영)
+    - origin을 주지 않으면 후보 좌표의 중앙값을 기준 위치로 사용 (ranking.candidates_origin)
+    """
+    pooled = candidate_pool.search_results(address, [candidate_pool.category_for(allowed_types)])
+    if pooled is not None:
+        return _rank(_filter_similar_places(pooled, allowed_types), emotion_names, user_id, origin, max_results)
+
+    query = _similar_places_query(address, allowed_types)
+
+    def fetch():
+        params = {
+            "query": query,
+            "key": API_KEY,
+            "language": "ko"
+        }
+        return _filter_similar_places(get_json("place/textsearch", params), allowed_types)
+
+    candidates = CacheService.get_or_compute(
+        'google_places_search', _similar_places_cache_data(query, address, allowed_types), fetch,
+    )
+    return _rank(candidates, emotion_names, user_id, origin, max_results)
+
+
+async def aget_similar_places(address, emotion_names, allowed_types=None, max_results=8, user_id=None, origin=None):
+    """get_similar_places의 비동기 버전 (ASGI 경로용)"""
+    pooled = await sync_to_async(candidate_pool.search_results)(address, [candidate_pool.category_for(allowed_types)])
+    if pooled is not None:
+        candidates = _filter_similar_places(pooled, allowed_types)
+    else:
+        query = _similar_places_query(address, allowed_types)
 
-    # 점수 순 정렬
-    results = sorted(results, key=lambda x: x["_score"], reverse=True)
+        async def fetch():
+            data = await aget_json("place/textsearch", {"query": query, "key": API_KEY, "language": "ko"})
+            return _filter_similar_places(data, allowed_types)
 
-    # 결과를 캐시에 저장
-    CacheService.set_google_places_search(query, address, allowed_types or [], results)
+        candidates = await CacheService.aget_or_compute(
+            'google_places_search', _similar_places_cache_data(query, address, allowed_types), fetch,
+        )
 
-    return results[:max_results]
+    return await sync_to_async(_rank)(candidates, emotion_names, user_id, origin, max_results)
 
 
 
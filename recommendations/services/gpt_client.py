@@ -1,4 +1,200 @@
-from openai import OpenAI
+# OpenAI 공통 게이트웨이 (프로젝트의 모든 GPT 호출은 chat/achat을 통해서만)
+# - 프로세스당 클라이언트 하나 (keep-alive 커넥션 재사용), 요청 타임아웃
+# - 동시 호출 수 제한 (semaphore) + 분당 토큰(TPM) 예산 → 429 대신 대기, 너무 오래 기다리면 GPTBackpressureError
+# - temperature 0 응답 재사용/기록 (llm_store)
+# - 프롬프트 종류(kind)별 API 호출 지연 시간 히스토그램 기록 (latency, 작업 이름 "gpt:<kind>"), 토큰 사용량 기록 (metrics)
+# - 호출한 view × kind × 모델별 토큰/비용 장부 + 하루 예산 초과 시 GPTBudgetExceededError (llm_usage)
+
+import asyncio
+import threading
+import time
+import weakref
+
+from asgiref.sync import sync_to_async
+from openai import OpenAI, AsyncOpenAI
 from django.conf import settings
 
-client = OpenAI(api_key=settings.OPENAI_API_KEY)
\ No newline at end of file
+from . import latency, llm_store, llm_usage, metrics, tracing
+from .rate_limit import TokenBucket
+
+TIMEOUT = getattr(settings, "OPENAI_TIMEOUT", 30)
+MAX_RETRIES = getattr(settings, "OPENAI_MAX_RETRIES", 2)
+MAX_CONCURRENCY = getattr(settings, "OPENAI_MAX_CONCURRENCY", 8)
+QUEUE_TIMEOUT = getattr(settings, "OPENAI_QUEUE_TIMEOUT", 30)    # 슬롯/토큰 예산을 기다리는 최대 시간 (초)
+TPM_LIMIT = getattr(settings, "OPENAI_TPM_LIMIT", 200000)
+
+DEFAULT_MAX_TOKENS = 500    # max_tokens 없는 호출의 응답 토큰 추정치
+
+
+class GPTBackpressureError(RuntimeError):
+    """동시 호출/토큰 예산이 QUEUE_TIMEOUT 안에 확보되지 않음"""
+
+
+class GPTBudgetExceededError(GPTBackpressureError):
+    """OpenAI 하루 비용 예산(OPENAI_DAILY_BUDGET, OPENAI_DAILY_BUDGET_BY_KIND) 초과 - 호출부는 캐시/기본값으로 대체"""
+
+
+client = OpenAI(api_key=settings.OPENAI_API_KEY, timeout=TIMEOUT, max_retries=MAX_RETRIES)
+
+_semaphore = threading.BoundedSemaphore(MAX_CONCURRENCY)
+_tpm_bucket = TokenBucket(rate=TPM_LIMIT / 60, capacity=TPM_LIMIT)
+
+SLOT_POLL_INTERVAL = 0.05    # 비동기 호출이 빈 슬롯을 다시 확인하는 간격 (초)
+
+# 비동기 클라이언트는 이벤트 루프에 묶이므로 루프별로 하나씩 생성
+# (동시 호출 슬롯은 _semaphore 하나를 sync/async, 모든 루프가 함께 사용)
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def get_async_client():
+    """현재 이벤트 루프에서 재사용할 AsyncOpenAI 클라이언트"""
+    loop = asyncio.get_running_loop()
+    aclient = _async_clients.get(loop)
+    if aclient is None:
+        aclient = AsyncOpenAI(api_key=settings.OPENAI_API_KEY, timeout=TIMEOUT, max_retries=MAX_RETRIES)
+        _async_clients[loop] = aclient
+    return aclient
+
+
+async def _aacquire_slot():
+    """
+    프로세스 전역 동시 호출 슬롯(_semaphore)을 이벤트 루프를 막지 않고 획득
+    - 블로킹 acquire를 executor 스레드에서 기다리면 취소 시 슬롯이 새므로, 논블로킹 시도 + 짧은 간격 재확인
+    - QUEUE_TIMEOUT 안에 못 얻으면 False
+    """
+    end_time = time.monotonic() + QUEUE_TIMEOUT
+    while not _semaphore.acquire(blocking=False):
+        remaining = end_time - time.monotonic()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(SLOT_POLL_INTERVAL, remaining))
+    return True
+
+
+def _estimate_tokens(prompt, params):
+    """요청 전 토큰 예약량 (한글은 대략 2글자당 1토큰 이상 → 넉넉하게 잡고 응답 후 보정)"""
+    return len(prompt) // 2 + params.get("max_tokens", DEFAULT_MAX_TOKENS)
+
+
+def _reserve_budget(estimate):
+    """TPM 예산 예약 후 기다려야 할 시간, 예산이 QUEUE_TIMEOUT 안에 안 차면 예약 취소 후 예외"""
+    wait = _tpm_bucket.reserve(estimate)
+    if wait > QUEUE_TIMEOUT:
+        _tpm_bucket.adjust(-estimate)
+        raise GPTBackpressureError(f"OpenAI 분당 토큰 한도 초과 (예상 대기 {wait:.1f}초)")
+    return wait
+
+
+def _settle_budget(estimate, usage):
+    """실제 사용 토큰과 예약량 차이 보정"""
+    total = getattr(usage, "total_tokens", None)
+    if total is not None:
+        _tpm_bucket.adjust(total - estimate)
+
+
+def _check_budget(model, kind):
+    reason = llm_usage.exceeded(kind)
+    if reason is not None:
+        llm_usage.record_rejected(kind, model)
+        raise GPTBudgetExceededError(reason)
+
+
+def _record_response(model, kind, prompt, params, text, usage, elapsed):
+    llm_usage.record(kind, model, usage)
+    if llm_store.is_deterministic(params):
+        llm_store.record(model, prompt, params, text, usage, elapsed)
+
+
+def chat(prompt, model="gpt-4o-mini", kind="other", **params):
+    """
+    GPT 호출 (단일 user 메시지) → 응답 텍스트
+    - kind: 프롬프트 종류 (summary, keywords, emotion_tags 등, 통계 구분용)
+    - temperature 0 호출은 LLMResponse에 기록 (토큰 사용량, 지연 시간)하고, 저장된 응답이 있으면 API를 호출하지 않음
+    - 동시 호출 슬롯/토큰 예산을 QUEUE_TIMEOUT 안에 못 얻으면 GPTBackpressureError
+    - 오늘 사용액이 하루 예산을 넘었으면 API를 호출하지 않고 GPTBudgetExceededError (저장된 응답은 계속 반환)
+    """
+    with tracing.span(f"gpt:{kind}", model=model):
+        return _chat(prompt, model, kind, params)
+
+
+def _chat(prompt, model, kind, params):
+    if llm_store.is_deterministic(params):
+        stored = llm_store.lookup(model, prompt, params)
+        if stored is not None:
+            llm_usage.record_reused(kind, model)
+            return stored
+
+    _check_budget(model, kind)
+    estimate = _estimate_tokens(prompt, params)
+    wait = _reserve_budget(estimate)
+    if wait > 0:
+        time.sleep(wait)
+
+    if not _semaphore.acquire(timeout=QUEUE_TIMEOUT):
+        _tpm_bucket.adjust(-estimate)
+        raise GPTBackpressureError(f"OpenAI 동시 호출 대기 시간 초과 (최대 {MAX_CONCURRENCY}개)")
+    try:
+        started = time.monotonic()
+        with latency.timed(f"gpt:{kind}"):
+            response = client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                **params
+            )
+    except Exception:
+        _tpm_bucket.adjust(-estimate)
+        raise
+    finally:
+        _semaphore.release()
+
+    _settle_budget(estimate, response.usage)
+    metrics.record_openai_usage(kind, model, response.usage)
+    text = response.choices[0].message.content.strip()
+
+    _record_response(model, kind, prompt, params, text, response.usage, time.monotonic() - started)
+    return text
+
+
+async def achat(prompt, model="gpt-4o-mini", kind="other", **params):
+    """chat의 비동기 버전 (저장소 조회/기록은 sync_to_async로 처리)"""
+    with tracing.span(f"gpt:{kind}", model=model):
+        return await _achat(prompt, model, kind, params)
+
+
+async def _achat(prompt, model, kind, params):
+    if llm_store.is_deterministic(params):
+        stored = await sync_to_async(llm_store.lookup)(model, prompt, params)
+        if stored is not None:
+            await sync_to_async(llm_usage.record_reused)(kind, model)
+            return stored
+
+    if llm_usage.budget_enabled():
+        await sync_to_async(_check_budget)(model, kind)
+    estimate = _estimate_tokens(prompt, params)
+    wait = _reserve_budget(estimate)
+    if wait > 0:
+        await asyncio.sleep(wait)
+
+    if not await _aacquire_slot():
+        _tpm_bucket.adjust(-estimate)
+        raise GPTBackpressureError(f"OpenAI 동시 호출 대기 시간 초과 (최대 {MAX_CONCURRENCY}개)")
+    try:
+        started = time.monotonic()
+        with latency.timed(f"gpt:{kind}"):
+            response = await get_async_client().chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                **params
+            )
+    except BaseException:
+        _tpm_bucket.adjust(-estimate)
+        raise
+    finally:
+        _semaphore.release()
+
+    _settle_budget(estimate, response.usage)
+    metrics.record_openai_usage(kind, model, response.usage)
+    text = response.choices[0].message.content.strip()
+
+    await sync_to_async(_record_response)(model, kind, prompt, params, text, response.usage, time.monotonic() - started)
+    return text
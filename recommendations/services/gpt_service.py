@@ -1,6 +1,6 @@
 # GPT 요약
 
-from .gpt_client import client
+from .gpt_client import chat
 
 def generate_summary(place):
     """
@@ -20,11 +20,4 @@ def generate_summary(place):
 결과는 한글로만 작성해 주세요.
     """
 
-    completion = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0.2,
-        max_tokens=50
-    )
-
-    return completion.choices[0].message.content.strip()
+    return chat(prompt, kind="summary", temperature=0.2, max_tokens=50)
@@ -0,0 +1,140 @@
+# upstream 호출 지연 시간 히스토그램 (Google Maps 엔드포인트별, GPT 프롬프트 종류별)
+# - 1ms ~ 10분 구간을 10%씩 커지는 고정 버킷으로 나눠 횟수만 셈 → 백분위 오차 10% 이내, 기록 비용은 버킷 계산 1번
+# - 요청 경로에서는 스레드별 히스토그램에만 기록 (lock 없음), 조회할 때 합산
+# - 프로세스 메모리에만 보관 (워커별 값)
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+MIN_MS = 1.0
+MAX_MS = 600000.0
+GROWTH = 1.1
+_LOG_GROWTH = math.log(GROWTH)
+BUCKET_COUNT = int(math.log(MAX_MS / MIN_MS) / _LOG_GROWTH) + 2   # 0번: MIN_MS 미만, 마지막: MAX_MS 이상
+
+PERCENTILES = (50, 95, 99)
+
+
+def bucket_index(ms):
+    if ms < MIN_MS:
+        return 0
+    return min(int(math.log(ms / MIN_MS) / _LOG_GROWTH) + 1, BUCKET_COUNT - 1)
+
+
+def bucket_upper_ms(index):
+    """버킷 상한 (ms) - 백분위는 해당 버킷의 상한으로 보고 (실제 값보다 최대 10% 크게)"""
+    if index == 0:
+        return MIN_MS
+    return MIN_MS * GROWTH ** index
+
+
+class LatencyHistogram:
+    """작업 1개의 지연 시간 분포 (고정 버킷)"""
+
+    __slots__ = ("counts", "count", "errors", "total_ms", "max_ms")
+
+    def __init__(self):
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, ms, error=False):
+        self.counts[bucket_index(ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+        if error:
+            self.errors += 1
+
+    def merge(self, other):
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.errors += other.errors
+        self.total_ms += other.total_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+
+    def percentile(self, q):
+        """q(0~100) 백분위 지연 시간 (ms), 기록이 없으면 None"""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * q / 100))
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= rank:
+                return min(bucket_upper_ms(index), self.max_ms)
+        return self.max_ms
+
+    def summary(self):
+        """호출 수, 오류율, 평균/p50/p95/p99/최대 (ms)"""
+        result = {
+            "count": self.count,
+            "errors": self.errors,
+            "error_rate": self.errors / self.count if self.count else None,
+            "avg_ms": round(self.total_ms / self.count, 1) if self.count else None,
+            "max_ms": round(self.max_ms, 1),
+        }
+        for q in PERCENTILES:
+            value = self.percentile(q)
+            result[f"p{q}_ms"] = round(value, 1) if value is not None else None
+        return result
+
+
+_local = threading.local()
+_thread_histograms = []   # 모든 스레드의 {작업: LatencyHistogram} (스레드가 처음 기록할 때만 lock)
+_register_lock = threading.Lock()
+
+
+def _histograms():
+    histograms = getattr(_local, "histograms", None)
+    if histograms is None:
+        histograms = _local.histograms = {}
+        with _register_lock:
+            _thread_histograms.append(histograms)
+    return histograms
+
+
+def record(operation, seconds, error=False):
+    """작업 1회 지연 시간 기록 (호출한 스레드의 히스토그램만 수정)"""
+    histograms = _histograms()
+    histogram = histograms.get(operation)
+    if histogram is None:
+        histogram = histograms[operation] = LatencyHistogram()
+    histogram.record(seconds * 1000, error)
+
+
+@contextmanager
+def timed(operation):
+    """with 블록 실행 시간 기록 (예외로 끝나면 오류로 기록), 동기/비동기 코드 모두 사용 가능"""
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        record(operation, time.perf_counter() - started, error=True)
+        raise
+    record(operation, time.perf_counter() - started)
+
+
+def merged():
+    """이 프로세스의 작업별 히스토그램 합산 → {작업: LatencyHistogram}"""
+    with _register_lock:
+        thread_histograms = list(_thread_histograms)
+
+    result = {}
+    for histograms in thread_histograms:
+        for operation, histogram in list(histograms.items()):
+            total = result.get(operation)
+            if total is None:
+                total = result[operation] = LatencyHistogram()
+            total.merge(histogram)
+    return result
+
+
+def summary():
+    """작업별 호출 수/오류율/평균/p50/p95/p99/최대 (ms)"""
+    return {operation: histogram.summary() for operation, histogram in sorted(merged().items())}
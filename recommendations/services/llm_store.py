@@ -0,0 +1,116 @@
+# GPT 응답 영구 저장소 (DB) - 같은 프롬프트/모델/파라미터면 저장된 응답 재사용
+# - 재사용할 수 있는 temperature 0 응답만 저장 (gpt_client가 is_deterministic으로 걸러서 record 호출)
+# - 재사용 횟수(hit_count)는 프로세스 안에 모았다가 LLM_STORE_HIT_FLUSH_INTERVAL초마다 한 번에 반영
+
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+
+from ..models import LLMResponse
+
+logger = logging.getLogger(__name__)
+
+_hits_lock = threading.Lock()
+_pending_hits = Counter()    # response_id → 아직 DB에 반영하지 않은 재사용 횟수
+_hits_flushed = {"at": time.monotonic()}
+
+
+def normalize_prompt(prompt):
+    """f-string 들여쓰기/공백 차이로 지문이 달라지지 않도록 줄 단위 공백 정리"""
+    lines = [re.sub(r"[ \t]+", " ", line).strip() for line in prompt.strip().splitlines()]
+    return "\n".join(line for line in lines if line)
+
+
+def _sha256(text):
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def fingerprint(model, prompt, params):
+    """(model, prompt_hash, params_hash) 조회 키"""
+    params_json = json.dumps(params or {}, sort_keys=True)
+    return model, _sha256(normalize_prompt(prompt)), _sha256(params_json)
+
+
+def is_deterministic(params):
+    """temperature 0 호출만 저장된 응답을 그대로 재사용"""
+    return params.get("temperature", 1) == 0
+
+
+def lookup(model, prompt, params):
+    """저장된 응답 텍스트 (없거나 조회 실패 시 None)"""
+    model, prompt_hash, params_hash = fingerprint(model, prompt, params)
+    try:
+        row = (
+            LLMResponse.objects
+            .filter(model=model, prompt_hash=prompt_hash, params_hash=params_hash)
+            .values_list("response_id", "response")
+            .first()
+        )
+    except Exception as e:
+        logger.error(f"GPT 응답 저장소 조회 실패: {e}")
+        return None
+    if row is None:
+        return None
+
+    response_id, text = row
+    logger.info(f"저장된 GPT 응답 재사용: {model} {prompt_hash[:12]}")
+    _add_hit(response_id)
+    return text
+
+
+def _add_hit(response_id):
+    """재사용 횟수 누적, 마지막 반영 후 LLM_STORE_HIT_FLUSH_INTERVAL초가 지났으면 DB에 반영"""
+    interval = getattr(settings, "LLM_STORE_HIT_FLUSH_INTERVAL", 30)
+    with _hits_lock:
+        _pending_hits[response_id] += 1
+        due = time.monotonic() - _hits_flushed["at"] >= interval
+    if due:
+        flush_hits()
+
+
+def flush_hits():
+    """모아둔 재사용 횟수를 DB에 반영 (응답별 UPDATE 한 번씩) - 실패하면 다음 반영 때 다시 시도"""
+    with _hits_lock:
+        pending = dict(_pending_hits)
+        _pending_hits.clear()
+        _hits_flushed["at"] = time.monotonic()
+    if not pending:
+        return
+    try:
+        with transaction.atomic():
+            for response_id, count in pending.items():
+                LLMResponse.objects.filter(response_id=response_id).update(hit_count=F("hit_count") + count)
+    except Exception as e:
+        logger.error(f"GPT 응답 재사용 횟수 반영 실패: {e}")
+        with _hits_lock:
+            _pending_hits.update(pending)
+
+
+def record(model, prompt, params, text, usage=None, latency=0.0):
+    """GPT 응답 저장 (같은 지문이면 최신 응답으로 갱신) - 저장 실패는 호출 흐름에 영향 없음"""
+    model, prompt_hash, params_hash = fingerprint(model, prompt, params)
+    try:
+        LLMResponse.objects.update_or_create(
+            model=model,
+            prompt_hash=prompt_hash,
+            params_hash=params_hash,
+            defaults={
+                "params": params or {},
+                "prompt": prompt,
+                "response": text,
+                "prompt_tokens": getattr(usage, "prompt_tokens", 0) or 0,
+                "completion_tokens": getattr(usage, "completion_tokens", 0) or 0,
+                "total_tokens": getattr(usage, "total_tokens", 0) or 0,
+                "latency_ms": int(latency * 1000),
+            },
+        )
+    except Exception as e:
+        logger.error(f"GPT 응답 저장 실패: {e}")
@@ -0,0 +1,214 @@
+# OpenAI 토큰/비용 장부 (LLMUsageDaily) + 하루 예산 한도
+# - 날짜 × 호출한 view(endpoint) × 프롬프트 종류(kind) × 모델별로 호출 수, prompt/completion 토큰, 비용(USD) 누적
+# - endpoint는 LLMUsageMiddleware가 요청 동안 contextvar에 넣어둔 request의 view 이름 (요청 밖의 호출은 "background")
+# - OPENAI_DAILY_BUDGET(전체), OPENAI_DAILY_BUDGET_BY_KIND(프롬프트 종류별)를 넘으면 gpt_client가 API 호출 전에 GPTBudgetExceededError
+#   → 저장된 응답(llm_store)과 캐시는 계속 쓰이고, 호출부는 기본값으로 대체
+# - 예산 확인용 오늘 사용액은 DB 합계를 OPENAI_BUDGET_REFRESH_INTERVAL초마다 다시 읽고, 그 사이에는 이 프로세스 기록분만 더함
+
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from datetime import date
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from ..models import LLMUsageDaily
+
+logger = logging.getLogger(__name__)
+
+BACKGROUND_ENDPOINT = "background"
+
+# 모델별 (입력, 출력) 100만 토큰당 가격 (USD), OPENAI_PRICES로 덮어씀
+DEFAULT_PRICES = {
+    "gpt-4o-mini": [0.15, 0.60],
+    "gpt-4o": [2.50, 10.00],
+    "gpt-3.5-turbo": [0.50, 1.50],
+}
+
+_request = ContextVar("llm_usage_request", default=None)
+
+_budget_lock = threading.Lock()
+_spent = {"date": None, "refreshed": 0.0, "total": 0.0, "by_kind": {}}
+
+
+# --- 호출한 endpoint ---
+
+def set_request(request):
+    """요청 시작 (LLMUsageMiddleware) → reset_request에 넘길 토큰"""
+    return _request.set(request)
+
+
+def reset_request(token):
+    try:
+        _request.reset(token)
+    except ValueError:
+        # 스트리밍 본문처럼 다른 context에서 닫히는 경우
+        _request.set(None)
+
+
+def current_endpoint():
+    request = _request.get()
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return BACKGROUND_ENDPOINT
+    return match.view_name[:128]
+
+
+def today():
+    """장부 날짜 (TIME_ZONE 기준 - USE_TZ=False면 Django가 프로세스 시간대를 TIME_ZONE으로 맞춤)"""
+    return timezone.localdate() if settings.USE_TZ else date.today()
+
+
+# --- 비용 계산 ---
+
+def _prices():
+    return {**DEFAULT_PRICES, **getattr(settings, "OPENAI_PRICES", {})}
+
+
+def price_of(model):
+    """모델의 (입력, 출력) 100만 토큰당 가격 - 날짜가 붙은 스냅샷 이름(gpt-4o-mini-2024-07-18)은 가장 긴 접두어로 찾음"""
+    prices = _prices()
+    if model in prices:
+        return prices[model]
+    for name in sorted(prices, key=len, reverse=True):
+        if model.startswith(name):
+            return prices[name]
+    logger.warning(f"OpenAI 가격 정보 없음: {model} (비용 0으로 기록)")
+    return [0.0, 0.0]
+
+
+def cost_of(model, prompt_tokens, completion_tokens):
+    input_price, output_price = price_of(model)
+    return (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+
+
+# --- 장부 기록 ---
+
+def _add(kind, model, **values):
+    """오늘 (endpoint, kind, model) 행에 값 더하기 (행이 없으면 생성, 동시 생성은 UPDATE로 재시도)"""
+    key = {"date": today(), "endpoint": current_endpoint(), "kind": kind, "model": model}
+    updates = {field: F(field) + value for field, value in values.items()}
+    if LLMUsageDaily.objects.filter(**key).update(**updates):
+        return
+    try:
+        with transaction.atomic():
+            LLMUsageDaily.objects.create(**key, **values)
+    except IntegrityError:
+        LLMUsageDaily.objects.filter(**key).update(**updates)
+
+
+def record(kind, model, usage):
+    """API 호출 1회의 토큰/비용 기록 - 기록 실패는 호출 흐름에 영향 없음"""
+    prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+    completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+    cost = cost_of(model, prompt_tokens, completion_tokens)
+    _add_spent(kind, cost)
+    try:
+        _add(kind, model, calls=1, prompt_tokens=prompt_tokens, completion_tokens=completion_tokens, cost=cost)
+    except Exception as e:
+        logger.error(f"OpenAI 사용량 기록 실패: {e}")
+
+
+def record_reused(kind, model):
+    """저장된 응답 재사용 (API 호출 생략) 기록"""
+    try:
+        _add(kind, model, reused=1)
+    except Exception as e:
+        logger.error(f"OpenAI 사용량 기록 실패: {e}")
+
+
+def record_rejected(kind, model):
+    """예산 초과로 호출하지 않음 기록"""
+    try:
+        _add(kind, model, rejected=1)
+    except Exception as e:
+        logger.error(f"OpenAI 사용량 기록 실패: {e}")
+
+
+# --- 하루 예산 ---
+
+def daily_budget():
+    return getattr(settings, "OPENAI_DAILY_BUDGET", 0.0)
+
+
+def kind_budgets():
+    return getattr(settings, "OPENAI_DAILY_BUDGET_BY_KIND", {})
+
+
+def budget_enabled():
+    return daily_budget() > 0 or bool(kind_budgets())
+
+
+def _refresh_spent(current):
+    """오늘 사용액을 DB 합계(모든 워커)로 갱신 - _budget_lock 안에서 호출"""
+    rows = LLMUsageDaily.objects.filter(date=current).values("kind").annotate(cost=Sum("cost"))
+    by_kind = {row["kind"]: row["cost"] or 0.0 for row in rows}
+    _spent.update(date=current, refreshed=time.monotonic(), total=sum(by_kind.values()), by_kind=by_kind)
+
+
+def _add_spent(kind, cost):
+    with _budget_lock:
+        if _spent["date"] == today():
+            _spent["total"] += cost
+            _spent["by_kind"][kind] = _spent["by_kind"].get(kind, 0.0) + cost
+
+
+def spent_today():
+    """
+    오늘 사용액 {"total": USD, "by_kind": {kind: USD}} (최대 OPENAI_BUDGET_REFRESH_INTERVAL초 전 DB 합계 + 이 프로세스 기록분)
+    - DB 합계 갱신이 실패하면(동시 기록 중 database is locked 등) 오늘 마지막으로 읽은 값 사용, 오늘 값이 없으면 예외
+    """
+    current = today()
+    interval = getattr(settings, "OPENAI_BUDGET_REFRESH_INTERVAL", 10)
+    with _budget_lock:
+        if _spent["date"] != current or time.monotonic() - _spent["refreshed"] >= interval:
+            try:
+                _refresh_spent(current)
+            except Exception as e:
+                if _spent["date"] != current:
+                    raise
+                logger.warning(f"OpenAI 사용액 갱신 실패, 마지막 값 사용: {e}")
+        return {"total": _spent["total"], "by_kind": dict(_spent["by_kind"])}
+
+
+def exceeded(kind):
+    """kind 호출이 하루 예산을 넘었으면 사유 문자열, 아니면 None (DB 조회 실패 시 호출 허용)"""
+    if not budget_enabled():
+        return None
+    try:
+        spent = spent_today()
+    except Exception as e:
+        logger.error(f"OpenAI 사용액 조회 실패: {e}")
+        return None
+
+    total_budget = daily_budget()
+    if total_budget > 0 and spent["total"] >= total_budget:
+        return f"OpenAI 하루 예산 초과 (${spent['total']:.4f} / ${total_budget:g})"
+    kind_budget = kind_budgets().get(kind)
+    kind_spent = spent["by_kind"].get(kind, 0.0)
+    if kind_budget is not None and kind_spent >= kind_budget:
+        return f"OpenAI 하루 예산 초과 - {kind} (${kind_spent:.4f} / ${kind_budget:g})"
+    return None
+
+
+# --- 조회 (llm_usage 관리 명령) ---
+
+SUM_FIELDS = ("calls", "reused", "rejected", "prompt_tokens", "completion_tokens", "cost")
+
+
+def totals(since, group_by=("endpoint", "kind")):
+    """since 날짜 이후 group_by별 합계 (비용 큰 순)"""
+    rows = (
+        LLMUsageDaily.objects.filter(date__gte=since)
+        .values(*group_by)
+        .annotate(**{f"sum_{field}": Sum(field) for field in SUM_FIELDS})
+        .order_by("-sum_cost", *group_by)
+    )
+    return [
+        {**{field: row[field] for field in group_by}, **{field: row[f"sum_{field}"] or 0 for field in SUM_FIELDS}}
+        for row in rows
+    ]
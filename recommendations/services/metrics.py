@@ -0,0 +1,255 @@
+# Prometheus 텍스트 형식 지표 (/metrics)
+# - 요청 수/지연 시간(view별), 요청당 DB 쿼리 수, upstream(Google/GPT) 호출 지연·오류, OpenAI 토큰 사용량, 캐시 family별 히트율
+# - 요청 경로에서는 스레드별 dict에만 기록 (lock 없음)
+# - 워커별 누적값을 METRICS_DIR에 파일로 기록하고, /metrics는 모든 워커 파일을 합산 (prometheus_client multiprocess 모드와 같은 방식)
+
+import os
+import threading
+from bisect import bisect_left
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+from . import cache_metrics, latency
+from .worker_store import WorkerStore
+
+REQUEST_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60)   # 초
+UPSTREAM_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2, 4, 8, 15, 30, 60)                  # 초
+
+# 지표 이름 → (type, help)
+METRICS = {
+    "spotal_http_requests_total": ("counter", "HTTP requests by view, method and status"),
+    "spotal_http_request_duration_seconds": ("histogram", "HTTP request latency by view and method"),
+    "spotal_db_queries_total": ("counter", "Database queries executed while handling requests, by view"),
+    "spotal_upstream_request_duration_seconds": ("histogram", "Upstream call latency (Google Maps endpoint, GPT prompt kind)"),
+    "spotal_upstream_errors_total": ("counter", "Failed upstream calls"),
+    "spotal_openai_tokens_total": ("counter", "OpenAI tokens by prompt kind, model and token type"),
+    "spotal_cache_events_total": ("counter", "CacheService events by cache family"),
+    "spotal_cache_hit_ratio": ("gauge", "CacheService (L1 + L2 hits) / lookups by cache family"),
+}
+
+_local = threading.local()
+_thread_values = []   # 모든 스레드의 (counters, histograms) (스레드가 처음 기록할 때만 lock)
+_register_lock = threading.Lock()
+
+# 현재 요청의 DB 쿼리 수 (sync_to_async로 넘어간 ORM 호출도 같은 칸에 더함)
+_request_queries = ContextVar("metrics_request_queries", default=None)
+
+
+def _values():
+    values = getattr(_local, "values", None)
+    if values is None:
+        values = _local.values = ({}, {})
+        with _register_lock:
+            _thread_values.append(values)
+    return values
+
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def inc(name, labels, amount=1):
+    """counter 증가"""
+    counters = _values()[0]
+    key = (name, _label_key(labels))
+    counters[key] = counters.get(key, 0) + amount
+    _store.ensure_flusher()
+
+
+def observe(name, labels, seconds, buckets=REQUEST_BUCKETS):
+    """histogram에 관측값 1개 기록 (버킷별 개수는 누적 전 값, 마지막 칸은 +Inf)"""
+    histograms = _values()[1]
+    key = (name, _label_key(labels))
+    histogram = histograms.get(key)
+    if histogram is None:
+        histogram = histograms[key] = [[0] * (len(buckets) + 1), 0.0, 0]
+    histogram[0][bisect_left(buckets, seconds)] += 1
+    histogram[1] += seconds
+    histogram[2] += 1
+    _store.ensure_flusher()
+
+
+def record_openai_usage(kind, model, usage):
+    """GPT 응답 usage의 prompt/completion 토큰 기록"""
+    for token_type in ("prompt", "completion"):
+        tokens = getattr(usage, f"{token_type}_tokens", None)
+        if tokens:
+            inc("spotal_openai_tokens_total", {"kind": kind, "model": model, "type": token_type}, tokens)
+
+
+# --- 요청 단위 기록 (MetricsMiddleware) ---
+
+def start_request():
+    """요청 시작 - DB 쿼리 수를 셀 칸 생성"""
+    cell = [0]
+    _request_queries.set(cell)
+    return cell
+
+
+def resume_request(cell):
+    """스트리밍 본문을 보내는 동안 DB 쿼리를 같은 칸에 계속 셈"""
+    _request_queries.set(cell)
+
+
+def finish_request(request, response, seconds, cell):
+    match = getattr(request, "resolver_match", None)
+    view = match.view_name if match is not None else "unmatched"
+    inc("spotal_http_requests_total", {"view": view, "method": request.method, "status": str(response.status_code)})
+    observe("spotal_http_request_duration_seconds", {"view": view, "method": request.method}, seconds)
+    if cell[0]:
+        inc("spotal_db_queries_total", {"view": view}, cell[0])
+
+
+def _db_counter(execute, sql, params, many, context):
+    cell = _request_queries.get()
+    if cell is not None:
+        cell[0] += 1
+    return execute(sql, params, many, context)
+
+
+def _install_db_counter(sender, connection, **kwargs):
+    if _db_counter not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_db_counter)
+
+
+def install_db_counter():
+    """이미 열린 연결과 이후에 열리는 모든 DB 연결에 쿼리 카운터 추가"""
+    connection_created.connect(_install_db_counter, dispatch_uid="metrics_db_counter")
+    for connection in connections.all(initialized_only=True):
+        _install_db_counter(None, connection)
+
+
+# --- 워커 파일 기록/합산 ---
+
+def _upstream_histograms():
+    """latency 모듈의 작업별 히스토그램 → UPSTREAM_BUCKETS 기준 histogram (버킷 상한 기준으로 배정)"""
+    result = []
+    for operation, histogram in latency.merged().items():
+        upstream, _, name = operation.partition(":")
+        labels = {"upstream": upstream, "operation": name} if name else {"upstream": "app", "operation": upstream}
+        counts = [0] * (len(UPSTREAM_BUCKETS) + 1)
+        for index, count in enumerate(histogram.counts):
+            if count:
+                counts[bisect_left(UPSTREAM_BUCKETS, latency.bucket_upper_ms(index) / 1000)] += count
+        result.append(["spotal_upstream_request_duration_seconds", labels, counts, histogram.total_ms / 1000, histogram.count])
+        if histogram.errors:
+            result.append(["spotal_upstream_errors_total", labels, histogram.errors])
+    return result
+
+
+def snapshot():
+    """이 프로세스의 누적값 → {"counters": [[이름, labels, 값]], "histograms": [[이름, labels, 버킷별 개수, 합, 개수]]}"""
+    with _register_lock:
+        thread_values = list(_thread_values)
+
+    counters, histograms = {}, {}
+    for thread_counters, thread_histograms in thread_values:
+        for key, value in dict(thread_counters).items():
+            counters[key] = counters.get(key, 0) + value
+        for key, (buckets, total, count) in dict(thread_histograms).items():
+            merged = histograms.setdefault(key, [[0] * len(buckets), 0.0, 0])
+            merged[0] = [a + b for a, b in zip(merged[0], buckets)]
+            merged[1] += total
+            merged[2] += count
+
+    result = {
+        "counters": [[name, dict(labels), value] for (name, labels), value in counters.items()],
+        "histograms": [[name, dict(labels), *values] for (name, labels), values in histograms.items()],
+    }
+    for item in _upstream_histograms():
+        (result["histograms"] if len(item) == 5 else result["counters"]).append(item)
+
+    if not result["counters"] and not result["histograms"]:
+        return None
+    return result
+
+
+def metrics_dir():
+    return str(getattr(settings, "METRICS_DIR", os.path.join(settings.BASE_DIR, "cache", "prometheus")))
+
+
+_store = WorkerStore(
+    "metrics",
+    directory_fn=metrics_dir,
+    interval_fn=lambda: getattr(settings, "METRICS_FLUSH_INTERVAL", 10),
+    snapshot_fn=snapshot,
+)
+
+
+def _merge(workers):
+    counters, histograms = {}, {}
+    for worker in workers:
+        data = worker.get("data", {})
+        for name, labels, value in data.get("counters", []):
+            key = (name, _label_key(labels))
+            counters[key] = counters.get(key, 0) + value
+        for name, labels, buckets, total, count in data.get("histograms", []):
+            key = (name, _label_key(labels))
+            merged = histograms.get(key)
+            if merged is None or len(merged[0]) != len(buckets):
+                histograms[key] = [list(buckets), total, count]
+            else:
+                merged[0] = [a + b for a, b in zip(merged[0], buckets)]
+                merged[1] += total
+                merged[2] += count
+    return counters, histograms
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels, **extra):
+    pairs = list(labels) + list(extra.items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs) + "}"
+
+
+def _format_le(bound):
+    return f"{bound:g}"
+
+
+def render():
+    """모든 워커 합산 → Prometheus text exposition format (0.0.4)"""
+    counters, histograms = _merge(_store.collect(flush_first=True))
+
+    cache = cache_metrics.aggregate()
+    for family, counts in cache.items():
+        for event in cache_metrics.EVENTS:
+            counters[("spotal_cache_events_total", _label_key({"family": family, "event": event}))] = counts.get(event, 0)
+    gauges = {
+        ("spotal_cache_hit_ratio", _label_key({"family": family})): counts["hit_ratio"]
+        for family, counts in cache.items() if counts.get("hit_ratio") is not None
+    }
+
+    lines = []
+    for name, (metric_type, help_text) in METRICS.items():
+        if metric_type == "histogram":
+            samples = sorted((key, value) for key, value in histograms.items() if key[0] == name)
+        else:
+            source = gauges if metric_type == "gauge" else counters
+            samples = sorted((key, value) for key, value in source.items() if key[0] == name)
+        if not samples:
+            continue
+
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        for (_, labels), value in samples:
+            if metric_type != "histogram":
+                lines.append(f"{name}{_format_labels(labels)} {value}")
+                continue
+
+            buckets, total, count = value
+            bounds = UPSTREAM_BUCKETS if name == "spotal_upstream_request_duration_seconds" else REQUEST_BUCKETS
+            cumulative = 0
+            for bound, bucket in zip(bounds, buckets):
+                cumulative += bucket
+                lines.append(f"{name}_bucket{_format_labels(labels, le=_format_le(bound))} {cumulative}")
+            lines.append(f'{name}_bucket{_format_labels(labels, le="+Inf")} {count}')
+            lines.append(f"{name}_sum{_format_labels(labels)} {total}")
+            lines.append(f"{name}_count{_format_labels(labels)} {count}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,104 @@
+# 추천 결과 DB 저장
+
+from django.db import transaction
+from community.models import Emotion, Location
+from ..models import Place, AISummary
+from ..serializers import PlaceSerializer
+from . import tracing
+from .utils import extract_neighborhood
+
+
+def _emotions_by_name(names):
+    """감정 이름 → Emotion (없는 감정은 한 번에 생성, 쿼리 최대 3번)"""
+    emotions = {e.name: e for e in Emotion.objects.filter(name__in=names)}
+    missing = [name for name in names if name not in emotions]
+    if missing:
+        Emotion.objects.bulk_create([Emotion(name=name) for name in missing], ignore_conflicts=True)
+        emotions.update((e.name, e) for e in Emotion.objects.filter(name__in=missing))
+    return emotions
+
+
+def _locations_by_name(names):
+    """동네 이름 → Location (같은 이름이 여러 개면 먼저 만든 것, 없는 동네는 한 번에 생성)"""
+    locations = {}
+    for location in Location.objects.filter(name__in=names).order_by("-location_id"):
+        locations[location.name] = location
+    missing = [name for name in names if name not in locations]
+    if missing:
+        Location.objects.bulk_create([Location(name=name) for name in missing])
+        for location in Location.objects.filter(name__in=missing).order_by("-location_id"):
+            locations[location.name] = location
+    return locations
+
+
+def save_recommended_places(items, base_emotions):
+    """
+    보강된 후보(enrich_candidate 결과)들을 Place/AISummary로 저장하고 직렬화 데이터 반환
+    - base_emotions: 확장된 입력 감정 Emotion 객체들
+    - 후보 수와 관계없이 한 트랜잭션 안에서 일정한 횟수의 쿼리로 저장
+    """
+    # 같은 가게가 두 번 들어오면 마지막 값 사용 (응답은 입력 순서 유지)
+    by_place_id = {item["place_id"]: item for item in items}
+    if not by_place_id:
+        return []
+
+    base_emotions = list(base_emotions)
+    neighborhoods = {pid: extract_neighborhood(item["address_ko"]) for pid, item in by_place_id.items()}
+
+    with tracing.span("db:save_recommended_places", places=len(by_place_id)), transaction.atomic():
+        # 1. Emotion / Location 매핑 (이름별로 한 번에 조회/생성)
+        emotions = _emotions_by_name({tag for item in by_place_id.values() for tag in item["tags"]})
+        locations = _locations_by_name(set(neighborhoods.values()))
+
+        # 2. Place upsert (google_place_id 기준)
+        existing = set(
+            Place.objects.filter(google_place_id__in=by_place_id).values_list("google_place_id", flat=True)
+        )
+        Place.objects.bulk_create(
+            [
+                Place(
+                    google_place_id=pid,
+                    name=item["name"],
+                    address=item["address"],
+                    photo_reference=item["photo_reference"],   # details에서 가져온 값 저장
+                    place_types=item.get("types") or [],      # 사용자 저장 이력 기반 랭킹(업태 선호)에 사용
+                    location=locations[neighborhoods[pid]],
+                )
+                for pid, item in by_place_id.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["google_place_id"],
+            update_fields=["name", "address", "photo_reference", "place_types", "location", "modified_date"],
+        )
+        places = {p.google_place_id: p for p in Place.objects.filter(google_place_id__in=by_place_id)}
+
+        # 3. 감정 연결 교체 (place.emotions.set과 같은 결과를 through 테이블에 일괄 반영)
+        Through = Place.emotions.through
+        Through.objects.filter(place__in=places.values()).delete()
+        through_rows = []
+        for pid, item in by_place_id.items():
+            emotion_ids = {e.pk for e in base_emotions} | {emotions[tag].pk for tag in item["tags"]}
+            through_rows.extend(Through(place_id=places[pid].pk, emotion_id=eid) for eid in emotion_ids)
+        Through.objects.bulk_create(through_rows)
+
+        # 4. 새로 만든 가게에만 AISummary 생성
+        AISummary.objects.bulk_create([
+            AISummary(shop=places[pid], summary=item["summary"])
+            for pid, item in by_place_id.items() if pid not in existing
+        ])
+
+    # 5. 직렬화 (감정/동네/최신 요약은 prefetch plan으로 미리 가져오기)
+    serialized = {
+        place.google_place_id: PlaceSerializer(place).data
+        for place in PlaceSerializer.setup_eager_loading(Place.objects.filter(google_place_id__in=by_place_id))
+    }
+    return [serialized[pid] for pid in dict.fromkeys(item["place_id"] for item in items)]
+
+
+def get_saved_google_place_ids(user_id, rec):
+    """유저가 감정보관함에 저장한 가게들의 google_place_id 집합"""
+    return set(
+        Place.objects.filter(
+            saved_records__user_id=user_id, saved_records__rec=rec
+        ).values_list("google_place_id", flat=True)
+    )
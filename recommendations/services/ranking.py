@@ -0,0 +1,179 @@
+# 후보 가게 점수 계산 / 재정렬 (NumPy 벡터 연산)
+# - 후보 n개 × 특성 f개 행렬을 만든 뒤 가중치 벡터와 곱해서 한 번에 점수 계산
+# - DB가 필요한 특성(기존 Place 감정, 사용자 저장 이력)은 load_context()에서 쿼리 3번으로 미리 조회
+# - 가중치는 settings.RANKING_WEIGHTS로 덮어쓸 수 있음
+
+import math
+from typing import NamedTuple
+
+import numpy as np
+from django.conf import settings
+
+from ..models import Place, SavedPlace
+
+FEATURES = ("rating", "reviews", "name_match", "emotion_overlap", "distance", "profile")
+
+DEFAULT_WEIGHTS = {
+    "rating": 1.0,            # 평점 / 5
+    "reviews": 0.5,           # log(리뷰 수) (REVIEW_COUNT_SCALE개면 1)
+    "name_match": 0.4,        # 가게명에 감정 단어 포함
+    "emotion_overlap": 1.0,   # 기존 Place 감정 중 요청 감정 비율
+    "distance": 0.5,          # 기준 위치와의 거리 (가까울수록 1)
+    "profile": 0.5,           # 사용자가 저장한 가게들의 감정/업태 분포와 유사도
+}
+
+REVIEW_COUNT_SCALE = 1000
+DISTANCE_SCALE_KM = 1.0
+EARTH_RADIUS_KM = 6371.0
+
+
+class RankingContext(NamedTuple):
+    """점수 계산에 필요한 DB 조회 결과"""
+    place_emotions: dict    # google_place_id -> 감정 이름 set (이미 추천된 적 있는 가게만)
+    profile: dict           # 감정/업태 이름 -> 사용자 저장 가게에서의 빈도
+
+
+def get_weights(overrides=None):
+    weights = {**DEFAULT_WEIGHTS, **getattr(settings, "RANKING_WEIGHTS", {}), **(overrides or {})}
+    return np.array([weights[name] for name in FEATURES], dtype=np.float64)
+
+
+def load_context(place_ids, user_id=None):
+    """후보 place_id들의 기존 감정 + 사용자 저장 이력 분포 조회 (쿼리 최대 3번)"""
+    place_emotions = {}
+    rows = Place.emotions.through.objects.filter(
+        place__google_place_id__in=[pid for pid in place_ids if pid]
+    ).values_list("place__google_place_id", "emotion__name")
+    for place_id, emotion_name in rows:
+        place_emotions.setdefault(place_id, set()).add(emotion_name)
+
+    profile = {}
+    if user_id:
+        saved = SavedPlace.objects.filter(user_id=user_id)
+        # 감정은 저장 기록 × 가게 감정 행마다, 업태는 저장한 가게마다 한 번씩 (감정 조인 행 수에 끌려가지 않도록 따로 조회)
+        for emotion_name in saved.values_list("shop__emotions__name", flat=True):
+            if emotion_name:
+                profile[emotion_name] = profile.get(emotion_name, 0) + 1
+        for _, place_types in saved.values_list("shop_id", "shop__place_types").order_by().distinct():
+            for place_type in place_types or []:
+                profile[place_type] = profile.get(place_type, 0) + 1
+
+    return RankingContext(place_emotions, profile)
+
+
+def _haversine_km(lat, lng, origin):
+    lat1, lng1 = np.radians(origin[0]), np.radians(origin[1])
+    lat2, lng2 = np.radians(lat), np.radians(lng)
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+def candidates_origin(candidates):
+    """
+    후보 좌표의 중앙값 (lat, lng) - 호출부가 기준 위치를 모를 때의 대체값 (좌표 있는 후보가 없으면 None)
+    - 후보는 요청 주소로 검색한 주변 가게들이라 중앙값이 요청 동네의 중심에 가깝고, 멀리 떨어진 후보 몇 개에 덜 끌려감
+    """
+    coords = []
+    for c in candidates:
+        loc = (c.get("geometry") or {}).get("location") or {}
+        if loc.get("lat") is not None and loc.get("lng") is not None:
+            coords.append((loc["lat"], loc["lng"]))
+    if not coords:
+        return None
+    lat, lng = np.median(np.asarray(coords, dtype=np.float64), axis=0)
+    return float(lat), float(lng)
+
+
+def build_features(candidates, emotion_names, context=None, origin=None):
+    """후보 dict 리스트 → (n × len(FEATURES)) 특성 행렬 (값은 0~1)"""
+    n = len(candidates)
+    features = np.zeros((n, len(FEATURES)), dtype=np.float64)
+    if n == 0:
+        return features
+    context = context or RankingContext({}, {})
+    emotion_set = set(emotion_names or [])
+    vocab = {term: i for i, term in enumerate(emotion_set | set(context.profile))}
+
+    # 후보 dict 순회는 1번만 하고 나머지는 배열 연산
+    ratings, review_counts, name_match, coords = [], [], [], []   # coords: (lat, lng), 좌표 없으면 None
+    rows, cols = [], []   # 감정/업태 one-hot 행렬의 1 위치
+    for row, c in enumerate(candidates):
+        name = c.get("name") or ""
+        ratings.append(c.get("rating") or 0)
+        review_counts.append(c.get("user_ratings_total") or 0)
+        name_match.append(any(e in name for e in emotion_set) if emotion_set else False)
+        if origin is not None:
+            loc = (c.get("geometry") or {}).get("location") or {}
+            coords.append((loc.get("lat"), loc.get("lng")))
+        if vocab:
+            for term in (*context.place_emotions.get(c.get("place_id"), ()), *(c.get("types") or ())):
+                col = vocab.get(term)
+                if col is not None:
+                    rows.append(row)
+                    cols.append(col)
+
+    features[:, 0] = np.asarray(ratings, dtype=np.float64) / 5
+    features[:, 1] = np.minimum(1.0, np.log1p(np.asarray(review_counts, dtype=np.float64)) / math.log1p(REVIEW_COUNT_SCALE))
+    features[:, 2] = name_match
+
+    # 감정/업태 one-hot 행렬 → 요청 감정, 사용자 프로필과 행렬곱
+    if vocab:
+        tags = np.zeros((n, len(vocab)), dtype=np.float64)
+        tags[rows, cols] = 1.0
+
+        if emotion_set:
+            query = np.zeros(len(vocab))
+            query[[vocab[e] for e in emotion_set]] = 1.0
+            features[:, 3] = tags @ query / len(emotion_set)
+
+        if context.profile:
+            profile = np.zeros(len(vocab))
+            for term, count in context.profile.items():
+                profile[vocab[term]] = count
+            denom = np.linalg.norm(tags, axis=1) * np.linalg.norm(profile)
+            features[:, 5] = np.divide(tags @ profile, denom, out=np.zeros(n), where=denom > 0)
+
+    if origin is not None:
+        coords = np.array(coords, dtype=np.float64)  # 좌표 없는 후보는 nan → 거리 특성 0
+        known = ~np.isnan(coords).any(axis=1)
+        if known.any():
+            distance = _haversine_km(coords[known, 0], coords[known, 1], origin)
+            features[known, 4] = np.exp(-distance / DISTANCE_SCALE_KM)
+
+    return features
+
+
+def score(features, weights=None):
+    """특성 행렬 → 점수 벡터 (weights: FEATURES 순서의 배열, 기본은 get_weights())"""
+    return features @ (get_weights() if weights is None else weights)
+
+
+def rank_candidates(candidates, emotion_names, context=None, origin=None, weights=None):
+    """
+    후보들을 점수 내림차순으로 정렬해서 반환 (각 dict에 '_score' 추가, 동점이면 입력 순서)
+    - weights: 특성 이름 → 가중치 dict (일부만 넘기면 나머지는 기본값)
+    """
+    if not candidates:
+        return []
+    scores = score(build_features(candidates, emotion_names, context, origin), get_weights(weights))
+    order = np.argsort(-scores, kind="stable")
+    return [{**candidates[i], "_score": round(float(scores[i]), 4)} for i in order]
+
+
+def rank_batch(requests, weights=None):
+    """
+    여러 요청의 후보를 한 번에 정렬 [(candidates, emotion_names, context, origin), ...] → 요청별 정렬 결과
+    - 특성 행렬을 이어 붙여 점수는 행렬곱 1번으로 계산
+    """
+    blocks = [build_features(*request) for request in requests]
+    if not blocks:
+        return []
+    scores = score(np.vstack(blocks), get_weights(weights))
+
+    ranked, start = [], 0
+    for (candidates, *_), block in zip(requests, blocks):
+        part = scores[start:start + len(block)]
+        start += len(block)
+        order = np.argsort(-part, kind="stable")
+        ranked.append([{**candidates[i], "_score": round(float(part[i]), 4)} for i in order])
+    return ranked
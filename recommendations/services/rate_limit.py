@@ -0,0 +1,46 @@
+# 외부 API 호출량 제한 (Google Maps 초당 요청 수, OpenAI 분당 토큰 수)
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    스레드/코루틴 공용 token bucket
+    - reserve()는 토큰을 미리 예약하고 기다려야 할 시간(초)을 반환 → 동기는 sleep, 비동기는 asyncio.sleep
+    - 실제 사용량을 나중에 알게 되면 adjust()로 차이만큼 보정
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, amount=1):
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= amount
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def adjust(self, amount):
+        """amount만큼 추가 사용(+) 또는 반환(-)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self.capacity, self._tokens - amount)
+
+    def acquire(self, amount=1):
+        wait = self.reserve(amount)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, amount=1):
+        wait = self.reserve(amount)
+        if wait > 0:
+            await asyncio.sleep(wait)
@@ -0,0 +1,54 @@
+# 추천 결과 스트리밍 응답 (SSE / NDJSON)
+# - 가게 하나가 완성될 때마다 이벤트 1개 전송 → 첫 결과까지 걸리는 시간이 후보 1개 처리 시간 수준
+# - ASGI(uvicorn 등)에서 비동기 뷰로 사용 (WSGI에서는 응답이 한 번에 모여서 나감)
+
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+
+SSE_CONTENT_TYPE = "text/event-stream"
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+
+def stream_format(request):
+    """?stream=ndjson 또는 Accept: application/x-ndjson 이면 NDJSON, 그 외에는 SSE"""
+    if request.GET.get("stream") == "ndjson" or NDJSON_CONTENT_TYPE in request.headers.get("Accept", ""):
+        return "ndjson"
+    return "sse"
+
+
+def encode_event(fmt, event, data, event_id=None):
+    """
+    이벤트 1개 직렬화
+    - SSE: "id: 0\\nevent: place\\ndata: {...}\\n\\n"
+    - NDJSON: {"event": "place", "id": 0, "data": {...}} 한 줄
+    """
+    if fmt == "ndjson":
+        line = {"event": event, "data": data}
+        if event_id is not None:
+            line["id"] = event_id
+        return json.dumps(line, ensure_ascii=False, cls=DjangoJSONEncoder) + "\n"
+
+    payload = json.dumps(data, ensure_ascii=False, cls=DjangoJSONEncoder)
+    head = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{head}event: {event}\ndata: {payload}\n\n"
+
+
+def streaming_response(request, events):
+    """
+    (event, data, event_id) 비동기 이터레이터 → StreamingHttpResponse
+    - 클라이언트가 연결을 끊으면 이터레이터가 닫히면서 진행 중인 작업도 취소됨
+    """
+    fmt = stream_format(request)
+
+    async def body():
+        async for event, data, event_id in events:
+            yield encode_event(fmt, event, data, event_id)
+
+    response = StreamingHttpResponse(
+        body(), content_type=NDJSON_CONTENT_TYPE if fmt == "ndjson" else SSE_CONTENT_TYPE
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # nginx 프록시 버퍼링 끄기 (이벤트 즉시 전달)
+    return response
@@ -0,0 +1,242 @@
+# 요청 단위 트레이싱 (view → 캐시 → Google → GPT → DB 구간별 소요 시간)
+# - TracingMiddleware가 샘플링된 요청에만 root span을 만들고, 하위 구간은 contextvar로 현재 span을 이어받음
+#   (sync_to_async / asyncio task / copy_context로 넘긴 스레드풀 작업까지 전파)
+# - 샘플링되지 않은 요청은 span()이 contextvar 조회 1번 후 no-op 반환, TRACING_SAMPLE_RATE=0이면 미들웨어 자체를 끔
+# - 요청이 끝나면 타임라인을 JSON 한 줄로 기록 (TRACING_FILE이 있으면 파일, 없으면 spotal.trace 로거)
+
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger("spotal.trace")
+
+_current = ContextVar("tracing_span", default=None)
+_file_lock = threading.Lock()
+
+SQL_PREVIEW_LENGTH = 120
+
+
+def sample_rate():
+    return getattr(settings, "TRACING_SAMPLE_RATE", 0.0)
+
+
+class _NoopSpan:
+    """샘플링되지 않은 요청에서 쓰는 빈 span"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def tag(self, key, value):
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+class Trace:
+    """요청 1개의 span 모음"""
+
+    __slots__ = ("trace_id", "started", "spans")
+
+    def __init__(self):
+        self.trace_id = uuid.uuid4().hex[:16]
+        self.started = time.perf_counter()
+        self.spans = []   # 끝난 span (여러 스레드에서 append)
+
+
+class Span:
+    __slots__ = ("trace", "name", "parent", "attrs", "start", "duration", "error", "_token")
+
+    def __init__(self, trace, name, parent=None, attrs=None):
+        self.trace = trace
+        self.name = name
+        self.parent = parent
+        self.attrs = attrs or {}
+        self.start = None
+        self.duration = None
+        self.error = False
+        self._token = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.duration = time.perf_counter() - self.start
+        self.error = exc_type is not None
+        self.trace.spans.append(self)
+        try:
+            _current.reset(self._token)
+        except ValueError:
+            # 비동기 제너레이터처럼 다른 context에서 닫히는 경우
+            _current.set(self.parent)
+        return False
+
+    def tag(self, key, value):
+        self.attrs[key] = value
+
+
+def span(name, **attrs):
+    """
+    현재 요청의 하위 구간 span (with 문으로 사용)
+    - 트레이싱 중이 아니면 no-op span 반환
+    """
+    parent = _current.get()
+    if parent is None:
+        return _NOOP
+    return Span(parent.trace, name, parent, attrs)
+
+
+def start_trace(request):
+    """샘플링 대상이면 root span 생성 (X-Trace-Sample: 1 헤더는 항상 샘플링), 아니면 None"""
+    rate = sample_rate()
+    if rate <= 0:
+        return None
+    if request.headers.get("X-Trace-Sample") != "1" and random.random() >= rate:
+        return None
+    return Span(Trace(), "view", attrs={"method": request.method, "path": request.path})
+
+
+def _label(root, request, response):
+    match = getattr(request, "resolver_match", None)
+    if match is not None:
+        root.name = f"view:{match.view_name}"
+    root.tag("status", response.status_code)
+
+
+def _record(root):
+    try:
+        _write(timeline(root))
+    except Exception as e:
+        logger.error(f"트레이스 기록 실패: {e}")
+
+
+def finish_trace(root, request, response):
+    """root span 종료 후: 타임라인 기록 + Server-Timing 헤더"""
+    _label(root, request, response)
+    _record(root)
+
+    if getattr(settings, "TRACING_SERVER_TIMING", True):
+        response["Server-Timing"] = server_timing(root)
+
+
+def start_stream(root, request, response):
+    """
+    스트리밍 응답의 헤더를 보낼 때 (본문은 get_response가 반환된 뒤에 서버가 읽음)
+    - Server-Timing은 헤더까지의 구간만, 타임라인은 본문을 다 보낸 뒤 finish_stream에서 기록
+    → 본문을 읽는 동안 현재 span으로 둘 "stream" span (root 아래, with 문으로 사용)
+    """
+    _label(root, request, response)
+    if getattr(settings, "TRACING_SERVER_TIMING", True):
+        response["Server-Timing"] = server_timing(root)
+    return Span(root.trace, "stream", root)
+
+
+def finish_stream(root):
+    """스트리밍 본문까지 다 보낸 뒤: root 시간을 본문 끝까지 늘려서 타임라인 기록"""
+    root.duration = time.perf_counter() - root.start
+    _record(root)
+
+
+def timeline(root):
+    """root span 기준 구간 목록 (시작 순서, ms 단위, depth는 root=0)"""
+    trace = root.trace
+    spans = sorted(trace.spans, key=lambda s: s.start)
+    depths = {}
+
+    def depth(s):
+        if s.parent is None:
+            return 0
+        if s not in depths:
+            depths[s] = depth(s.parent) + 1
+        return depths[s]
+
+    return {
+        "trace_id": trace.trace_id,
+        "name": root.name,
+        "duration_ms": round(root.duration * 1000, 1),
+        **root.attrs,
+        "spans": [
+            {
+                "name": s.name,
+                "depth": depth(s),
+                "start_ms": round((s.start - trace.started) * 1000, 1),
+                "duration_ms": round(s.duration * 1000, 1),
+                **({"error": True} if s.error else {}),
+                **s.attrs,
+            }
+            for s in spans if s is not root
+        ],
+    }
+
+
+def _metric_name(name):
+    return "".join(c if c.isalnum() or c in "-_" else "-" for c in name)
+
+
+def server_timing(root, limit=None):
+    """
+    Server-Timing 헤더 값 - 전체 시간 + 종류별(gpt:summary, google:place/details, db ...) 합계 상위 N개
+    예: total;dur=1520.3, gpt-summary;dur=1210.0;desc="3", db;dur=40.2;desc="12"
+    """
+    limit = limit or getattr(settings, "TRACING_SERVER_TIMING_LIMIT", 5)
+    totals = {}
+    for s in root.trace.spans:
+        if s is root:
+            continue
+        duration, count = totals.get(s.name, (0.0, 0))
+        totals[s.name] = (duration + s.duration, count + 1)
+
+    top = sorted(totals.items(), key=lambda item: item[1][0], reverse=True)[:limit]
+    parts = [f"total;dur={root.duration * 1000:.1f}"]
+    parts.extend(
+        f'{_metric_name(name)};dur={duration * 1000:.1f};desc="{count}"'
+        for name, (duration, count) in top
+    )
+    return ", ".join(parts)
+
+
+def _write(data):
+    line = json.dumps(data, ensure_ascii=False, default=str)
+    path = getattr(settings, "TRACING_FILE", "")
+    if not path:
+        logger.info(line)
+        return
+    with _file_lock, open(path, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+
+# --- ORM 쿼리 span (트레이싱 중인 요청에서만) ---
+
+def _db_wrapper(execute, sql, params, many, context):
+    parent = _current.get()
+    if parent is None:
+        return execute(sql, params, many, context)
+    with Span(parent.trace, "db", parent, {"sql": sql[:SQL_PREVIEW_LENGTH]}):
+        return execute(sql, params, many, context)
+
+
+def _install_db_wrapper(sender, connection, **kwargs):
+    if _db_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_db_wrapper)
+
+
+def install_db_tracing():
+    """이미 열린 연결과 이후에 열리는 모든 DB 연결에 쿼리 span 추가"""
+    connection_created.connect(_install_db_wrapper, dispatch_uid="tracing_db_wrapper")
+    for connection in connections.all(initialized_only=True):
+        _install_db_wrapper(None, connection)
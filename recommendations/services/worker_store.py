@@ -0,0 +1,111 @@
+# 워커 프로세스별 누적 통계를 공유 디렉터리에 파일로 기록/합산 (gunicorn/uvicorn 멀티 워커용)
+# - 워커마다 <host>-<pid>.json 하나를 주기적으로 덮어씀 (임시 파일 → rename으로 원자적 교체)
+# - 값은 프로세스 시작 이후 누적값이라, 종료된 워커의 기록도 지우기 전까지 합산에 포함
+
+import atexit
+import glob
+import json
+import logging
+import os
+import socket
+import tempfile
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def worker_id():
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class WorkerStore:
+    """
+    snapshot_fn()이 반환하는 이 프로세스의 누적값을 directory_fn() 디렉터리에 기록
+    - 기록 스레드는 처음 ensure_flusher()를 부를 때 시작 (fork된 자식 프로세스에서는 다시 시작)
+    """
+
+    def __init__(self, name, directory_fn, interval_fn, snapshot_fn):
+        self.name = name
+        self.directory_fn = directory_fn
+        self.interval_fn = interval_fn
+        self.snapshot_fn = snapshot_fn
+        self.started = time.time()
+        self._flusher_pid = None
+        self._lock = threading.Lock()
+
+    def ensure_flusher(self):
+        if self._flusher_pid != os.getpid():
+            self._start_flusher()
+
+    def _start_flusher(self):
+        with self._lock:
+            pid = os.getpid()
+            if self._flusher_pid == pid:
+                return
+            if self._flusher_pid is None:
+                atexit.register(self._flush_at_exit)
+            self._flusher_pid = pid
+        threading.Thread(target=self._flush_loop, args=(pid,), name=self.name, daemon=True).start()
+
+    def _flush_loop(self, pid):
+        while os.getpid() == pid:
+            time.sleep(self.interval_fn())
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"{self.name} 기록 실패: {e}")
+
+    def _flush_at_exit(self):
+        try:
+            self.flush()
+        except Exception:
+            pass
+
+    def flush(self):
+        """이 프로세스의 누적값을 워커 파일에 기록 (기록할 값이 없으면 생략)"""
+        data = self.snapshot_fn()
+        if not data:
+            return
+
+        directory = self.directory_fn()
+        os.makedirs(directory, exist_ok=True)
+        record = {"worker": worker_id(), "started": self.started, "updated": time.time(), "data": data}
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(record, f)
+            os.replace(tmp_path, os.path.join(directory, f"{record['worker']}.json"))
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+    def collect(self, flush_first=False):
+        """디렉터리의 모든 워커 기록 (flush_first면 이 프로세스 값을 먼저 기록, 읽을 수 없는 파일은 건너뜀)"""
+        if flush_first:
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"{self.name} 기록 실패: {e}")
+
+        workers = []
+        for path in sorted(glob.glob(os.path.join(self.directory_fn(), "*.json"))):
+            try:
+                with open(path) as f:
+                    workers.append(json.load(f))
+            except (OSError, ValueError) as e:
+                logger.warning(f"{self.name} 파일 읽기 실패 ({path}): {e}")
+        return workers
+
+    def prune(self, max_age):
+        """max_age초 넘게 갱신되지 않은 워커 기록(종료된 워커) 삭제 → 삭제한 파일 수"""
+        removed = 0
+        cutoff = time.time() - max_age
+        for path in glob.glob(os.path.join(self.directory_fn(), "*.json")):
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.unlink(path)
+                    removed += 1
+            except OSError:
+                pass
+        return removed
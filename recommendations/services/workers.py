@@ -0,0 +1,37 @@
+# 외부 API 호출용 프로세스 전역 스레드풀 (후보 보강, 가게 카드 일괄 생성이 함께 사용)
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+
+from django.conf import settings
+from django.db import close_old_connections
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """프로세스 전역 스레드풀 (워커 수 상한으로 외부 API 동시 호출량 제한)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, "RECOMMENDATION_ENRICH_WORKERS", 16),
+                    thread_name_prefix="enrich",
+                )
+    return _executor
+
+
+def _run_in_worker(fn, *args):
+    """스레드풀 작업 실행 후 해당 스레드의 DB 연결 정리 (GPT 응답 저장소 조회/기록)"""
+    try:
+        return fn(*args)
+    finally:
+        close_old_connections()
+
+
+def submit(fn, *args):
+    """fn(*args)를 스레드풀에 제출 → Future (요청 context(트레이싱 span, 사용량 endpoint 등)를 작업 스레드로 전달)"""
+    return get_executor().submit(copy_context().run, _run_in_worker, fn, *args)
@@ -1,12 +1,9 @@
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
-from django.conf import settings
 from django.db.models import Count
-from openai import OpenAI
 
 from .models import SavedPlace
-
-client = OpenAI(api_key=settings.OPENAI_API_KEY)
+from .services.gpt_client import chat, GPTBudgetExceededError
 
 
 def generate_user_detail(user):
@@ -64,18 +61,15 @@ def generate_user_detail(user):
 
 
     try:
-        completion = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7,
-            max_tokens=80
-        )
-        detail_text = completion.choices[0].message.content.strip()
+        detail_text = chat(prompt, kind="user_detail", temperature=0.7, max_tokens=80)
 
         # 안전장치: 만약 '공간', '장소', '가게' 같은 단어로 끝나면 fallback 적용
         if detail_text.endswith(("공간", "장소", "가게")):
             detail_text = "따뜻함을 좋아하는 감성탐험가"
             
+    except GPTBudgetExceededError:
+        # 하루 예산 초과 → 기존 detail 유지 (다음 저장 때 다시 생성)
+        return
     except Exception as e:
         detail_text = f"(AI 생성 실패: {str(e)})"
 
@@ -1,3 +1,539 @@
-from django.test import TestCase
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+import requests
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connection
+from django.test import AsyncClient, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from community.models import Emotion, Location
+from users.models import User
+from .models import AISummary, LLMResponse, LLMUsageDaily, Place, SavedPlace
+from .serializers import PlaceSerializer, SavedPlaceSerializer
+from .services import cache_backends, google_client, google_service, gpt_client, latency, llm_store, llm_usage, metrics, ranking, tracing
+from .services.cache_backends import SQLiteCache
+from .services.cache_service import CacheService, _Entry
+from .services.persistence import save_recommended_places
+
+
+@override_settings(OPENAI_DAILY_BUDGET=0.0001, OPENAI_BUDGET_REFRESH_INTERVAL=0)
+class RecommendationBudgetExceededTests(TransactionTestCase):
+    """OpenAI 하루 예산을 넘은 뒤에도 추천 API는 기본값 카드로 응답 (후보 보강 스레드에서도 장부가 보이도록 TransactionTestCase)"""
+
+    def setUp(self):
+        Emotion.objects.get_or_create(name="편안함")
+        LLMUsageDaily.objects.create(
+            date=llm_usage.today(), endpoint="background", kind="summary", model="gpt-4o-mini", calls=1, cost=1.0
+        )
+        # 오늘 사용액을 한 번 읽어 둠 (카드 생성 스레드의 갱신이 SQLite lock으로 실패해도 이 값으로 예산 확인)
+        llm_usage.spent_today()
+        # 다른 테스트/실행의 캐시 항목과 겹치지 않도록 가게마다 고유한 이름
+        suffix = uuid.uuid4().hex[:8]
+        self.candidates = [
+            {"place_id": f"test-{suffix}-{i}", "name": f"테스트식당{suffix}{i}", "address": "서울특별시 용산구 이태원동"}
+            for i in range(3)
+        ]
+        self.details = {
+            c["place_id"]: {
+                "name": c["name"],
+                "formatted_address": "서울특별시 용산구 이태원동 1",
+                "types": ["restaurant", "food"],
+                "reviews": [{"text": f"{c['name']} 국밥이 맛있고 사장님이 친절해요"}],
+            }
+            for c in self.candidates
+        }
+
+    def _post(self):
+        with mock.patch("recommendations.views.get_similar_places", return_value=self.candidates), \
+                mock.patch("recommendations.services.enrichment_service.get_place_details",
+                           side_effect=lambda place_id, name=None: self.details[place_id]), \
+                mock.patch("recommendations.services.gpt_client.client.chat.completions.create") as create:
+            response = APIClient().post(
+                "/api/places/",
+                {"name": "옛날식당", "address": "서울특별시 용산구 이태원동", "emotion_tags": ["편안함"]},
+                format="json",
+            )
+        create.assert_not_called()
+        return response
+
+    def test_returns_default_cards(self):
+        response = self._post()
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.data), 3)
+        for place in response.data:
+            self.assertEqual(place["ai_summary"], "요약 준비중입니다")
+
+    def test_degraded_cards_are_not_cached(self):
+        self._post()
+
+        for c in self.candidates:
+            review_texts = [r["text"] for r in self.details[c["place_id"]]["reviews"]]
+            self.assertIsNone(CacheService.cache_gpt_place_card(c["name"], review_texts, ["restaurant", "food"]))
+        self.assertTrue(LLMUsageDaily.objects.filter(rejected__gt=0).exists())
+
+
+class RankingOriginTests(TestCase):
+    """기준 위치를 넘기지 않은 추천도 거리 특성이 반영되는지 (후보 좌표 중앙값)"""
+
+    def _candidate(self, place_id, lat, lng):
+        return {
+            "place_id": place_id, "name": place_id, "types": ["restaurant"], "rating": 4.0,
+            "user_ratings_total": 100, "geometry": {"location": {"lat": lat, "lng": lng}},
+        }
+
+    def test_candidates_origin_is_median(self):
+        candidates = [
+            self._candidate("a", 37.534, 126.994),
+            self._candidate("b", 37.535, 126.995),
+            self._candidate("c", 37.536, 126.996),
+            self._candidate("far", 37.600, 127.100),
+            {"place_id": "no-geometry", "name": "no-geometry"},
+        ]
+        lat, lng = ranking.candidates_origin(candidates)
+        self.assertAlmostEqual(lat, 37.5355)
+        self.assertAlmostEqual(lng, 126.9955)
+        self.assertIsNone(ranking.candidates_origin([{"place_id": "x"}]))
+
+    def test_rank_without_origin_prefers_nearby_candidates(self):
+        candidates = [
+            self._candidate("far", 37.600, 127.100),
+            self._candidate("a", 37.534, 126.994),
+            self._candidate("b", 37.535, 126.995),
+        ]
+        ranked = google_service._rank(candidates, ["편안함"], None, None, 3)
+        self.assertEqual(ranked[-1]["place_id"], "far")
+
+
+class RankingProfileTests(TestCase):
+    """저장한 가게 업태가 Place에 기록되고, 사용자 프로필에서 가게마다 한 번씩 세어지는지"""
+
+    def _item(self, place_id, types):
+        return {
+            "place_id": place_id, "name": place_id, "address": "서울 용산구 청파동 1", "address_ko": "서울 용산구 청파동 1",
+            "photo_reference": "", "summary": "요약", "tags": ["행복", "설렘", "편안"], "types": types,
+        }
+
+    def test_profile_counts_types_once_per_shop(self):
+        user = User.objects.create_user(email=f"{uuid.uuid4().hex}@test.com", password="pw", nickname="tester")
+        save_recommended_places([self._item("cafe-a", ["cafe"]), self._item("cafe-b", ["cafe", "bakery"])], [])
+        self.assertEqual(Place.objects.get(google_place_id="cafe-b").place_types, ["cafe", "bakery"])
+
+        for place in Place.objects.filter(google_place_id__in=["cafe-a", "cafe-b"]):
+            SavedPlace.objects.create(user=user, shop=place, rec=1)
+        with self.assertNumQueries(3):
+            profile = ranking.load_context(["cafe-a"], user_id=user.pk).profile
+
+        # 가게마다 감정 3개 → 감정은 가게 수만큼, 업태는 감정 조인 행 수와 관계없이 가게 수만큼
+        self.assertEqual(profile["행복"], 2)
+        self.assertEqual(profile["cafe"], 2)
+        self.assertEqual(profile["bakery"], 1)
+
+
+class RecommendationRequestValidationTests(SimpleTestCase):
+    """동기/비동기/스트리밍 추천 API가 같은 요청 검증을 쓰는지"""
+
+    urls = ["/api/places/", "/api/places/async/", "/api/places/stream/"]
+
+    def test_missing_fields(self):
+        for url in self.urls:
+            with self.subTest(url=url):
+                response = self.client.post(url, {"name": "옛날식당"}, content_type="application/json")
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json(), {"error": "name, address, emotion_tags는 필수 입력값입니다."})
+
+    def test_async_views_reject_bad_json_and_get(self):
+        for url in self.urls[1:]:
+            with self.subTest(url=url):
+                self.assertEqual(self.client.post(url, "{", content_type="application/json").status_code, 400)
+                self.assertEqual(self.client.get(url).status_code, 405)
+
+
+class _ThreadRecordingCache:
+    """L2 캐시 호출이 어느 스레드에서 실행됐는지 기록하는 래퍼"""
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.threads = set()
+
+    def __getattr__(self, name):
+        method = getattr(self.cache, name)
+
+        def call(*args, **kwargs):
+            self.threads.add(threading.get_ident())
+            return method(*args, **kwargs)
+        return call
+
+
+class CacheServiceAsyncL2Tests(SimpleTestCase):
+    """aget_or_compute가 L2(SQLite 등) 조회/저장/lock을 이벤트 루프 밖에서 실행하는지"""
+
+    def test_l2_access_runs_off_the_event_loop(self):
+        l2 = _ThreadRecordingCache(LocMemCache(f"l2-test-{uuid.uuid4().hex}", {}))
+        cache_data = {"prompt": uuid.uuid4().hex, "model": "test"}
+
+        async def compute():
+            return "응답"
+
+        async def run():
+            # 첫 호출은 miss → L2 lock/저장, 두 번째는 L1을 비운 뒤 L2 히트
+            first = await CacheService.aget_or_compute("gpt_api", cache_data, compute)
+            CacheService._l1().delete(CacheService._generate_cache_key("gpt_api", cache_data))
+            second = await CacheService.aget_or_compute("gpt_api", cache_data, compute)
+            return threading.get_ident(), first, second
+
+        with mock.patch.object(CacheService, "_l2", return_value=l2):
+            loop_thread, first, second = asyncio.run(run())
+
+        self.assertEqual((first, second), ("응답", "응답"))
+        self.assertTrue(l2.threads)
+        self.assertNotIn(loop_thread, l2.threads)
+
+
+class StreamingMiddlewareTests(SimpleTestCase):
+    """스트리밍 응답 본문(get_response 반환 뒤에 읽힘) 안의 작업도 요청 단위 기록에 포함되는지"""
+
+    async def _stream(self, similar_places):
+        with mock.patch("recommendations.views.aexpand_emotions",
+                        return_value=[SimpleNamespace(name="편안함")]), \
+                mock.patch("recommendations.views.aget_similar_places", side_effect=similar_places):
+            response = await AsyncClient().post(
+                "/api/places/stream/?stream=ndjson",
+                {"name": "옛날식당", "address": "서울특별시 용산구 이태원동", "emotion_tags": ["편안함"]},
+                content_type="application/json",
+            )
+            lines = [line async for line in response.streaming_content]
+        self.assertEqual(json.loads(lines[-1])["event"], "done")
+        return response
+
+    async def test_llm_usage_endpoint_inside_stream(self):
+        endpoints = []
+
+        async def similar_places(*args, **kwargs):
+            endpoints.append(llm_usage.current_endpoint())
+            return []
+
+        await self._stream(similar_places)
+        self.assertEqual(endpoints, ["recommendations:recommendation-stream"])
+        self.assertEqual(llm_usage.current_endpoint(), llm_usage.BACKGROUND_ENDPOINT)
+
+    @override_settings(TRACING_SAMPLE_RATE=1.0, TRACING_FILE="")
+    async def test_trace_covers_stream_body(self):
+        async def similar_places(*args, **kwargs):
+            with tracing.span("google:place/textsearch"):
+                await asyncio.sleep(0.05)
+            return []
+
+        with self.assertLogs("spotal.trace", "INFO") as logs:
+            response = await self._stream(similar_places)
+
+        trace = json.loads(logs.records[-1].getMessage())
+        names = [s["name"] for s in trace["spans"]]
+        self.assertEqual(trace["name"], "view:recommendations:recommendation-stream")
+        self.assertIn("stream", names)
+        self.assertIn("google:place/textsearch", names)
+        self.assertGreaterEqual(trace["duration_ms"], 50)
+        self.assertIn("Server-Timing", response.headers)
+
+    async def test_metrics_cover_stream_body(self):
+        async def similar_places(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return []
+
+        with mock.patch.object(metrics, "finish_request", wraps=metrics.finish_request) as finish:
+            await self._stream(similar_places)
+
+        (request, response, seconds, cell), _ = finish.call_args
+        self.assertEqual(request.resolver_match.view_name, "recommendations:recommendation-stream")
+        self.assertGreaterEqual(seconds, 0.05)
+
+
+class GPTConcurrencyLimitTests(SimpleTestCase):
+    """동기/비동기 GPT 호출이 프로세스 전역 동시 호출 슬롯 하나를 함께 쓰는지"""
+
+    def test_async_calls_wait_for_sync_slots(self):
+        held = 0
+        while gpt_client._semaphore.acquire(blocking=False):
+            held += 1
+        try:
+            async def acquire():
+                return await gpt_client._aacquire_slot()
+
+            with mock.patch.object(gpt_client, "QUEUE_TIMEOUT", 0.1):
+                self.assertFalse(asyncio.run(acquire()))
+
+            # 동기 호출이 슬롯을 반납하면 대기 중인 비동기 호출이 가져감
+            threading.Timer(0.05, gpt_client._semaphore.release).start()
+            with mock.patch.object(gpt_client, "QUEUE_TIMEOUT", 1):
+                self.assertTrue(asyncio.run(acquire()))
+        finally:
+            for _ in range(held):
+                gpt_client._semaphore.release()
+
+
+@override_settings(LLM_STORE_HIT_FLUSH_INTERVAL=3600)
+class LLMStoreTests(TestCase):
+    """temperature 0 응답만 저장/재사용, 재사용 횟수는 모았다가 한 번에 반영"""
+
+    def setUp(self):
+        llm_store.flush_hits()
+        self.prompt = f"가게 요약 {uuid.uuid4().hex}"
+        response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=" 따뜻한 국밥집 "))],
+            usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+        )
+        patcher = mock.patch.object(gpt_client.client.chat.completions, "create", return_value=response)
+        self.create = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_deterministic_response_is_reused(self):
+        self.assertEqual(gpt_client.chat(self.prompt, kind="summary", temperature=0), "따뜻한 국밥집")
+        # 들여쓰기/공백만 다른 프롬프트도 같은 지문, 재사용은 조회 + 사용량 장부 UPDATE뿐 (hit_count UPDATE 없음)
+        with self.assertNumQueries(2):
+            self.assertEqual(gpt_client.chat(f"  {self.prompt}  ", kind="summary", temperature=0), "따뜻한 국밥집")
+        self.assertEqual(self.create.call_count, 1)
+
+    def test_non_deterministic_response_is_not_stored(self):
+        gpt_client.chat(self.prompt, kind="summary", temperature=0.7)
+        gpt_client.chat(self.prompt, kind="summary", temperature=0.7)
+        self.assertEqual(self.create.call_count, 2)
+        self.assertFalse(LLMResponse.objects.filter(prompt=self.prompt).exists())
+
+    def test_hits_are_flushed_in_one_update(self):
+        gpt_client.chat(self.prompt, kind="summary", temperature=0)
+        for _ in range(3):
+            llm_store.lookup("gpt-4o-mini", self.prompt, {"temperature": 0})
+        stored = LLMResponse.objects.get(prompt=self.prompt)
+        self.assertEqual(stored.hit_count, 0)
+
+        with self.assertNumQueries(3):    # SAVEPOINT + UPDATE + RELEASE
+            llm_store.flush_hits()
+        stored.refresh_from_db()
+        self.assertEqual(stored.hit_count, 3)
+
+
+class SQLiteCacheTests(SimpleTestCase):
+    """공유 캐시(SQLite 파일) 백엔드 - TTL 만료, MAX_ENTRIES 정리, add 원자성"""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "cache.sqlite3")
+        self.cache = SQLiteCache(self.path, {"OPTIONS": {"MAX_ENTRIES": 10, "CULL_FREQUENCY": 2}})
+        self.now = time.time()
+        patcher = mock.patch.object(cache_backends, "time", SimpleNamespace(time=lambda: self.now))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_expired_entry_is_a_miss(self):
+        self.cache.set("key", "value", timeout=60)
+        self.assertEqual(self.cache.get("key"), "value")
+
+        self.now += 61
+        self.assertFalse(self.cache.has_key("key"))
+        self.assertIsNone(self.cache.get("key"))
+        self.assertTrue(self.cache.add("key", "new", timeout=60))
+
+    def test_cull_removes_least_recently_used(self):
+        for i in range(11):
+            self.now += 1
+            self.cache.set(f"key{i}", i)
+        self.now += 1
+        self.cache.get("key0")    # 가장 오래된 항목을 최근에 사용
+
+        self.now += 1
+        self.cache.set("key11", 11)    # 11개 > MAX_ENTRIES → 오래 안 쓴 순서로 11 // 2개 정리
+        self.assertEqual(self.cache.get("key0"), 0)
+        self.assertEqual([self.cache.get(f"key{i}") for i in range(1, 6)], [None] * 5)
+        self.assertEqual(self.cache.get("key11"), 11)
+
+    def test_concurrent_add_stores_once(self):
+        barrier = threading.Barrier(8)
+        results = []
+
+        def add(i):
+            # 스레드마다 별도 SQLite 연결
+            barrier.wait()
+            results.append(self.cache.add("lock", i, timeout=60))
+
+        threads = [threading.Thread(target=add, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results.count(True), 1)
+
+
+@override_settings(CACHE_SERVICE_L2_ALIAS=None)
+class CacheServiceStaleWhileRevalidateTests(SimpleTestCase):
+    """soft TTL이 지난 값은 바로 반환하고, 갱신은 키마다 한 번만 백그라운드에서"""
+
+    def test_stale_value_is_served_while_refreshing(self):
+        cache_data = {"prompt": uuid.uuid4().hex}
+        cache_key = CacheService._generate_cache_key("gpt_api", cache_data)
+        CacheService._l1().set(cache_key, _Entry("이전 응답", 0), 300)
+
+        release = threading.Event()
+        compute = mock.Mock(side_effect=lambda: release.wait(5) and "새 응답")
+
+        self.assertEqual(CacheService.get_or_compute("gpt_api", cache_data, compute), "이전 응답")
+        self.assertEqual(CacheService.get_or_compute("gpt_api", cache_data, compute), "이전 응답")
+        release.set()
+
+        for _ in range(50):
+            if CacheService._fresh_result(cache_key) == "새 응답":
+                break
+            time.sleep(0.02)
+        self.assertEqual(CacheService.get_or_compute("gpt_api", cache_data, compute), "새 응답")
+        self.assertEqual(compute.call_count, 1)
+
+    def test_async_stale_value_is_served_while_refreshing(self):
+        cache_data = {"prompt": uuid.uuid4().hex}
+        cache_key = CacheService._generate_cache_key("gpt_api", cache_data)
+        CacheService._l1().set(cache_key, _Entry("이전 응답", 0), 300)
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "새 응답"
+
+        async def run():
+            first = await CacheService.aget_or_compute("gpt_api", cache_data, compute)
+            await asyncio.sleep(0.05)
+            return first, await CacheService.aget_or_compute("gpt_api", cache_data, compute)
+
+        self.assertEqual(asyncio.run(run()), ("이전 응답", "새 응답"))
+        self.assertEqual(len(calls), 1)
+
+
+class BulkPersistenceTests(TestCase):
+    """추천 결과 일괄 저장 - 후보 수와 관계없이 쿼리 수 일정, 재저장 시 감정 연결 교체"""
+
+    def _item(self, place_id, tags):
+        return {
+            "place_id": place_id, "name": f"가게 {place_id}", "address": "서울 용산구 청파동 1",
+            "address_ko": "서울 용산구 청파동 1", "photo_reference": "", "summary": "요약", "tags": tags, "types": [],
+        }
+
+    def _count_queries(self, items, base_emotions):
+        with CaptureQueriesContext(connection) as queries:
+            save_recommended_places(items, base_emotions)
+        return len(queries)
+
+    def test_query_count_does_not_grow_with_places(self):
+        base = [Emotion.objects.create(name="기본")]
+        # 감정/동네를 처음 만드는 쿼리는 한 번뿐이므로 미리 저장해두고 비교
+        save_recommended_places([self._item("warmup", ["행복"])], base)
+        few = self._count_queries([self._item(f"few-{i}", ["행복"]) for i in range(2)], base)
+        many = self._count_queries([self._item(f"many-{i}", ["행복"]) for i in range(6)], base)
+        self.assertEqual(few, many)
+
+    def test_resave_replaces_emotions(self):
+        base = [Emotion.objects.create(name="기본")]
+        save_recommended_places([self._item("place", ["행복", "설렘"])], base)
+        data = save_recommended_places([self._item("place", ["편안"])], base)
+
+        place = Place.objects.get(google_place_id="place")
+        self.assertEqual(set(place.emotions.values_list("name", flat=True)), {"기본", "편안"})
+        self.assertEqual(set(data[0]["emotions"]), {"기본", "편안"})
+        self.assertEqual(AISummary.objects.filter(shop=place).count(), 1)
+
+
+class SerializerQueryCountTests(TestCase):
+    """목록 시리얼라이저 prefetch plan - 가게/저장 수와 관계없이 쿼리 2번"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="serializer@test.com", password="pw", nickname="tester")
+        location = Location.objects.create(name="청파동")
+        emotions = [Emotion.objects.create(name=name) for name in ("행복", "설렘")]
+        for i in range(3):
+            place = Place.objects.create(name=f"가게{i}", address="주소", location=location)
+            place.emotions.set(emotions)
+            AISummary.objects.create(shop=place, summary=f"요약{i}")
+            SavedPlace.objects.create(user=self.user, shop=place)
+
+    def test_place_list(self):
+        with self.assertNumQueries(2):
+            data = PlaceSerializer(PlaceSerializer.setup_eager_loading(Place.objects.order_by("shop_id")), many=True).data
+        self.assertEqual([place["ai_summary"] for place in data], ["요약0", "요약1", "요약2"])
+        self.assertEqual(data[0]["emotions"], ["행복", "설렘"])
+
+    def test_saved_place_list(self):
+        queryset = SavedPlaceSerializer.setup_eager_loading(SavedPlace.objects.filter(user=self.user).order_by("saved_id"))
+        with self.assertNumQueries(2):
+            data = SavedPlaceSerializer(queryset, many=True).data
+        self.assertEqual([saved["summary"] for saved in data], ["요약0", "요약1", "요약2"])
+        self.assertEqual(data[0]["location"], "청파동")
+
+
+class LatencyHistogramTests(SimpleTestCase):
+    """고정 버킷 히스토그램 백분위 - 버킷 상한으로 보고 (실제 값보다 최대 10% 크게, 최댓값은 넘지 않음)"""
+
+    def test_percentiles_within_bucket_error(self):
+        histogram = latency.LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.record(ms)
+
+        for q, expected in ((50, 500), (95, 950), (99, 990)):
+            with self.subTest(q=q):
+                value = histogram.percentile(q)
+                self.assertGreaterEqual(value, expected)
+                self.assertLessEqual(value, expected * latency.GROWTH)
+        self.assertEqual(histogram.percentile(100), 1000)
+
+    def test_empty_and_out_of_range(self):
+        histogram = latency.LatencyHistogram()
+        self.assertIsNone(histogram.percentile(50))
+        self.assertIsNone(histogram.summary()["p99_ms"])
+
+        histogram.record(0.2)
+        histogram.record(latency.MAX_MS * 2, error=True)
+        self.assertEqual(histogram.percentile(50), latency.MIN_MS)    # MIN_MS 미만은 0번 버킷 (상한 MIN_MS)
+        self.assertGreaterEqual(histogram.percentile(99), latency.MAX_MS)    # MAX_MS 이상은 마지막 버킷
+        self.assertEqual(histogram.summary()["error_rate"], 0.5)
+
+    def test_merge_across_threads(self):
+        operation = f"test:{uuid.uuid4().hex}"
+        threads = [threading.Thread(target=latency.record, args=(operation, 0.1)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        latency.record(operation, 0.3)
+
+        summary = latency.summary()[operation]
+        self.assertEqual(summary["count"], 5)
+        self.assertEqual(summary["max_ms"], 300.0)
+
+
+class GoogleClientErrorTests(SimpleTestCase):
+    """HTML 오류 페이지(4xx)는 JSON 파싱 오류가 아니라 HTTPError로, 재시도 없이"""
+
+    def _response(self, status_code, body):
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = body.encode()
+        response.url = google_client._url("place/details")
+        return response
+
+    def test_non_json_client_error_raises_http_error(self):
+        response = self._response(403, "<html>Forbidden</html>")
+        with mock.patch.object(google_client.get_session(), "get", return_value=response) as get:
+            with self.assertRaises(requests.HTTPError):
+                google_client.get_json("place/details", {"place_id": "x"})
+        self.assertEqual(get.call_count, 1)
+
+    def test_ok_response_is_parsed(self):
+        response = self._response(200, '{"status": "OK", "result": {}}')
+        with mock.patch.object(google_client.get_session(), "get", return_value=response):
+            self.assertEqual(google_client.get_json("place/details", {"place_id": "x"})["status"], "OK")
@@ -6,6 +6,8 @@ app_name = 'recommendations'
 urlpatterns = [
     # 추천 가게 (POST: 추천 생성 & 응답)
     path("", views.RecommendationView.as_view(), name="recommendation"),
+    path("async/", views.recommendation_async, name="recommendation-async"), # ASGI 비동기 버전
+    path("stream/", views.recommendation_stream, name="recommendation-stream"), # 스트리밍 버전 (SSE/NDJSON)
 
     # 가게 상세 조회
     path("<int:shop_id>/", views.PlaceDetailView.as_view(), name="place-detail"),
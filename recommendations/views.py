@@ -1,3 +1,6 @@
+import json
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
 from django.shortcuts import render
 from rest_framework import status, generics, permissions
 from rest_framework.permissions import AllowAny
@@ -6,125 +9,91 @@ from django.conf import settings
 from .models import Place, SavedPlace, AISummary
 from .serializers import *
 from rest_framework.views import APIView
-from search.service.summary_card import generate_summary_card, generate_emotion_tags
-from search.service.address import translate_to_korean
-from .services.google_service import get_similar_places, get_place_details, get_photo_url
-from .services.utils import extract_neighborhood
-from .services.emotion_service import expand_emotions_with_gpt   
+from .services.google_service import get_similar_places, aget_similar_places, get_photo_url
+from .services.enrichment_service import (
+    enrich_candidates_batched, aenrich_candidates_batched, aiter_enriched, aenrich_candidate_carded,
+)
+from .services.persistence import save_recommended_places, get_saved_google_place_ids
+from .services.emotion_service import expand_emotions, aexpand_emotions
+from .services.streaming import streaming_response
 
 
 # Create your views here.
 
+def _recommendation_params(data, error_response):
+    """
+    추천 요청 본문 검증 (동기/비동기/스트리밍 뷰 공통)
+    → (name, address, emotion_tags, user_id, allowed_types) 또는 error_response(메시지, 상태코드)로 만든 오류 응답
+    """
+    name = data.get("name")
+    address = data.get("address")
+    emotion_tags = data.get("emotion_tags", [])
+    user_id = data.get("user_id", None)  # user_id 필드 optional
+
+    # --- 필수 입력값 체크 ---
+    if not name or not address or not emotion_tags:
+        return error_response("name, address, emotion_tags는 필수 입력값입니다.", 400)
+
+    # --- 업태 구분 (카테고리) ---
+    category_str = data.get("category", "")
+    allowed_types = ["cafe"] if "cafe" in category_str.lower() else ["restaurant", "food"]
+
+    return name, address, emotion_tags, user_id, allowed_types
+
+
+def _json_error(message, status_code):
+    return JsonResponse({"error": message}, status=status_code, json_dumps_params={"ensure_ascii": False})
+
+
+def _json_recommendation_params(request):
+    """ASGI 뷰용: POST JSON 본문 파싱 + 검증 → _recommendation_params와 같은 튜플 또는 JsonResponse"""
+    if request.method != "POST":
+        return _json_error("POST 요청만 지원합니다.", 405)
+
+    try:
+        data = json.loads(request.body or b"{}")
+    except json.JSONDecodeError:
+        return _json_error("JSON 형식이 올바르지 않습니다.", 400)
+
+    return _recommendation_params(data, _json_error)
+
+
 # 추천가게 생성 
 class RecommendationView(APIView):
     """추천 가게 생성 & 응답 API"""
     permission_classes = [AllowAny]
 
     def post(self, request):
-        name = request.data.get("name")
-        address = request.data.get("address")
-        emotion_tags = request.data.get("emotion_tags", [])
-        user_id = request.data.get("user_id", None)  # user_id 필드 optional
-
-        # --- 필수 입력값 체크 ---
-        if not name or not address or not emotion_tags:
-            return Response(
-                {"error": "name, address, emotion_tags는 필수 입력값입니다."},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-        # --- 업태 구분 (카테고리) ---
-        category_str = request.data.get("category", "")
-        if "cafe" in category_str.lower():
-            allowed_types = ["cafe"]
-        else:
-            allowed_types = ["restaurant", "food"]
+        params = _recommendation_params(request.data, lambda message, code: Response({"error": message}, status=code))
+        if isinstance(params, Response):
+            return params
+        name, address, emotion_tags, user_id, allowed_types = params
 
         try:
-            # 1. GPT 기반 감정 확장
-            emotions = expand_emotions_with_gpt(emotion_tags)   # -> Emotion 객체 QuerySet
+            # 1. 감정 확장 (유사도 행렬, 없으면 GPT)
+            emotions = expand_emotions(emotion_tags)   # -> Emotion 객체 QuerySet (유사도 행렬, 없으면 GPT)
             emotion_names = [e.name for e in emotions]          # → 문자열 리스트로 변환
 
             # 2. 구글맵에서 유사 가게 검색
             candidate_places = get_similar_places(
                 address,
                 emotion_names,
-                allowed_types=allowed_types
+                allowed_types=allowed_types,
+                user_id=user_id
             )[:8]
 
-            # user_id가 있으면 감정보관함 제외 필터링
-            saved_shop_ids = []
+            # user_id가 있으면 감정보관함 제외 필터링 (보강 전에 미리 제외)
             if user_id:
-                saved_shop_ids = SavedPlace.objects.filter(
-                    user_id=user_id, rec=1
-                ).values_list("shop_id", flat=True)
-
-            response_data = []
-
-            # 3. 후보 가게 상세 처리 (최적화: 상위 5개만 처리)
-            processed_count = 0
-            for c in candidate_places:
-                if processed_count >= 5:  # 상위 5개만 처리하여 시간 단축
-                    break
-                    
-                place_id = c.get("place_id")
-                place_name = c.get("name")
-
-                details = get_place_details(place_id, place_name)
-                reviews = [r["text"] for r in details.get("reviews", [])]
-                uptaenms = details.get("types", [])
-
-                # 주소/이름 한국어 정규화
-                name_ko = translate_to_korean(details.get("name")) if details.get("name") else None
-                address_ko = translate_to_korean(details.get("formatted_address")) if details.get("formatted_address") else None
-
-                photo_ref = ""
-                if details.get("photos"):
-                    photo_ref = details["photos"][0].get("photo_reference", "")
-
-                # GPT 요약 + 감정태그 생성
-                if reviews:  
-                    summary = generate_summary_card(details, reviews, uptaenms) or "요약 준비중입니다"
-                else:
-                    neighborhood = extract_neighborhood(address_ko or c.get("address"))
-                    summary = f"{place_name}은 {neighborhood}에 위치한 가게입니다"
-
-                tags = generate_emotion_tags(details, reviews, uptaenms) or []
-
-                # Emotion 모델 매핑 (입력 감정 + 자동 생성 감정)
-                emotion_objs = list(emotions)  # GPT 확장된 감정
-                for tag_name in tags:
-                    obj, _ = Emotion.objects.get_or_create(name=tag_name)
-                    emotion_objs.append(obj)
-
-                # Location 매핑
-                neighborhood_name = extract_neighborhood(address_ko)
-                location_obj, _ = Location.objects.get_or_create(name=neighborhood_name)
-
-
-                place, created = Place.objects.update_or_create(
-                    google_place_id=place_id,
-                    defaults={
-                        "name": name_ko or place_name,
-                        "address": address_ko or c.get("address"),
-                        "photo_reference": photo_ref,   # details에서 가져온 값 저장
-                        "location": location_obj,
-                    }
-                )
-
-                place.emotions.set(emotion_objs)
-
-                # 새로 만든 경우에만 AISummary 생성
-                if created:
-                    AISummary.objects.create(shop=place, summary=summary)
-
-                # 감정보관함에 이미 저장된 경우 skip
-                if user_id and place.shop_id in saved_shop_ids:
-                    continue
-
-                # 직렬화 데이터 추가
-                response_data.append(PlaceSerializer(place).data)
-                processed_count += 1
+                saved_google_ids = get_saved_google_place_ids(user_id, rec=1)
+                candidate_places = [
+                    c for c in candidate_places if c.get("place_id") not in saved_google_ids
+                ]
+
+            # 3. 후보 가게 상세 처리 (병렬 보강 + GPT 일괄 요약, 상위 5개만)
+            enriched = enrich_candidates_batched(candidate_places, limit=5)
+
+            # 4. DB 저장 + 직렬화
+            response_data = save_recommended_places(enriched, emotions)
 
             return Response(response_data, status=status.HTTP_201_CREATED)
 
@@ -135,12 +104,89 @@ class RecommendationView(APIView):
             )
 
 
+async def recommendation_async(request):
+    """추천 가게 생성 & 응답 API (ASGI 비동기 버전, 요청/응답 형식은 RecommendationView와 동일)"""
+    params = _json_recommendation_params(request)
+    if isinstance(params, JsonResponse):
+        return params
+    name, address, emotion_tags, user_id, allowed_types = params
+
+    try:
+        emotions = await aexpand_emotions(emotion_tags)
+        emotion_names = [e.name for e in emotions]
+
+        candidate_places = (await aget_similar_places(
+            address, emotion_names, allowed_types=allowed_types, user_id=user_id
+        ))[:8]
+
+        if user_id:
+            saved_google_ids = await sync_to_async(get_saved_google_place_ids)(user_id, rec=1)
+            candidate_places = [
+                c for c in candidate_places if c.get("place_id") not in saved_google_ids
+            ]
+
+        enriched = await aenrich_candidates_batched(candidate_places, limit=5)
+        response_data = await sync_to_async(save_recommended_places)(enriched, emotions)
+
+        return JsonResponse(response_data, status=201, safe=False, json_dumps_params={"ensure_ascii": False})
+
+    except Exception as e:
+        return JsonResponse(
+            {"error": f"추천 생성 중 오류 발생: {str(e)}"},
+            status=500,
+            json_dumps_params={"ensure_ascii": False}
+        )
+
+
+async def recommendation_stream(request):
+    """
+    추천 가게 생성 스트리밍 API (SSE 기본, ?stream=ndjson 또는 Accept: application/x-ndjson 이면 NDJSON)
+    - 가게가 보강·저장되는 대로 place 이벤트 전송 (data는 PlaceSerializer 형태, id는 추천 순위)
+    - 마지막에 done 이벤트(전송한 가게 수), 도중 실패 시 error 이벤트
+    """
+    params = _json_recommendation_params(request)
+    if isinstance(params, JsonResponse):
+        return params
+    name, address, emotion_tags, user_id, allowed_types = params
+
+    async def events():
+        try:
+            emotions = await aexpand_emotions(emotion_tags)
+            emotion_names = [e.name for e in emotions]
+
+            candidate_places = (await aget_similar_places(
+                address, emotion_names, allowed_types=allowed_types, user_id=user_id
+            ))[:8]
+
+            if user_id:
+                saved_google_ids = await sync_to_async(get_saved_google_place_ids)(user_id, rec=1)
+                candidate_places = [
+                    c for c in candidate_places if c.get("place_id") not in saved_google_ids
+                ]
+
+            # 후보별로 GPT 카드까지 완성되는 순서대로 저장 + 전송 (상위 5개)
+            # - save_recommended_places를 가게 1개씩 호출 → 일괄 저장(쿼리 수 고정)을 포기하는 대신
+            #   첫 가게를 나머지 보강을 기다리지 않고 바로 전송 (첫 바이트까지의 시간 우선)
+            sent = 0
+            async for rank, item in aiter_enriched(candidate_places, enrich_fn=aenrich_candidate_carded, limit=5):
+                for place in await sync_to_async(save_recommended_places)([item], emotions):
+                    yield "place", place, rank
+                    sent += 1
+
+            yield "done", {"count": sent}, None
+
+        except Exception as e:
+            yield "error", {"error": f"추천 생성 중 오류 발생: {str(e)}"}, None
+
+    return streaming_response(request, events())
+
+
 # --------------- Place (추천가게) ----------------
 
 
 
 class PlaceDetailView(generics.RetrieveAPIView):
-    queryset = Place.objects.all()
+    queryset = PlaceSerializer.setup_eager_loading(Place.objects.all())
     serializer_class = PlaceSerializer
     lookup_field = "shop_id"
     permission_classes = [permissions.AllowAny]
@@ -177,9 +223,10 @@ class SavedPlaceListView(generics.ListAPIView):
     # user별 필터링해서 목록 보여줌. 
     def get_queryset(self):
         user_id = self.request.query_params.get("user")  # 쿼리 파라미터로 받기
+        queryset = SavedPlaceSerializer.setup_eager_loading(SavedPlace.objects.all())
         if user_id:
-            return SavedPlace.objects.filter(user_id=user_id).order_by("-created_date")
-        return SavedPlace.objects.all().order_by("-created_date")
+            queryset = queryset.filter(user_id=user_id)
+        return queryset.order_by("-created_date")
         
 
 
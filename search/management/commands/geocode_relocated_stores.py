@@ -0,0 +1,42 @@
+import json
+import os
+import pandas as pd
+from django.core.management.base import BaseCommand
+from recommendations.services.google_client import get_json
+from search.service.relocated_index import CSV_PATH, GEOCODE_PATH, load_geocodes, previous_address_column
+from search.service.search import geocode_params, parse_geocode
+
+
+class Command(BaseCommand):
+    help = 'Geocode previous addresses of relocated stores once and save them next to the CSV'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='이미 좌표가 있는 주소도 다시 지오코딩')
+
+    def handle(self, *args, **options):
+        df = pd.read_csv(CSV_PATH)
+        addresses = sorted({str(a).strip() for a in df[previous_address_column(df)].dropna()})
+
+        geocodes = {} if options['force'] else load_geocodes()
+
+        added, failed = 0, []
+        for address in addresses:
+            if address in geocodes:
+                continue
+            geo_res = get_json("geocode", geocode_params(address))
+            lat, lng = parse_geocode(geo_res)
+            if lat is None:
+                failed.append(address)
+                continue
+            geocodes[address] = {'lat': lat, 'lng': lng}
+            added += 1
+
+        # 임시 파일에 쓴 뒤 교체 → 서버가 읽는 도중 깨진 파일을 보지 않도록
+        tmp_path = f"{GEOCODE_PATH}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(geocodes, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, GEOCODE_PATH)
+
+        for address in failed:
+            self.stdout.write(self.style.WARNING(f'지오코딩 실패: {address}'))
+        self.stdout.write(self.style.SUCCESS(f'이전 전 주소 좌표 {added}개 추가 (전체 {len(geocodes)}개)'))
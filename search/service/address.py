@@ -1,13 +1,9 @@
-from openai import OpenAI
-from django.conf import settings
+from recommendations.services.gpt_client import chat, achat, GPTBudgetExceededError
+from .address_normalizer import to_korean
 
-client = OpenAI(api_key=settings.OPENAI_API_KEY)
 
-def translate_to_korean(text: str) -> str:
-    if not text:
-        return None
-
-    prompt = f"""
+def _translate_prompt(text):
+    return f"""
     다음 입력을 한국어 주소/가게명으로 정리해 주세요.
     규칙:
     1. 입력이 이미 한국어라면 절대 수정하지 말고 그대로 출력하세요.
@@ -31,15 +27,43 @@ def translate_to_korean(text: str) -> str:
     출력:
     """
 
-    response = client.chat.completions.create(
-        model="gpt-3.5-turbo",
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0
-    )
-    return response.choices[0].message.content.strip()
+
+def translate_to_korean(text: str) -> str:
+    if not text:
+        return None
+
+    # 규칙으로 처리 가능한 입력(한글, 사전에 있는 영문 주소/가게명)은 GPT 호출 없이 변환
+    normalized = to_korean(text)
+    if normalized is not None:
+        return normalized
+
+    # temperature 0 → 같은 입력은 저장된 변환 결과 재사용, 하루 예산 초과면 원문 그대로
+    try:
+        return chat(_translate_prompt(text), model="gpt-3.5-turbo", kind="translate", temperature=0)
+    except GPTBudgetExceededError:
+        return text
+
+
+async def atranslate_to_korean(text: str) -> str:
+    """translate_to_korean의 비동기 버전"""
+    if not text:
+        return None
+
+    normalized = to_korean(text)
+    if normalized is not None:
+        return normalized
+
+    try:
+        return await achat(_translate_prompt(text), model="gpt-3.5-turbo", kind="translate", temperature=0)
+    except GPTBudgetExceededError:
+        return text
+
 
 def normalize_korean_address(address: str) -> str:
     """주소를 한국어로 정규화하는 함수 (translate_to_korean)"""
     return translate_to_korean(address)
 
 
+async def anormalize_korean_address(address: str) -> str:
+    """normalize_korean_address의 비동기 버전"""
+    return await atranslate_to_korean(address)
@@ -0,0 +1,182 @@
+# 규칙 기반 한국어 주소/가게명 정규화 (GPT 호출 없이 처리 가능한 입력만 담당)
+# - 한글 입력(쉼표 없는)은 그대로 통과
+# - 영문/역순 주소는 시·도 → 시·군·구 → 동 → 도로명 → 번지 순서로 재배열
+# - 사전에 없는 단어가 있으면 None → 호출한 쪽에서 GPT로 처리
+
+import json
+import os
+import re
+from functools import lru_cache
+
+from django.conf import settings
+
+DICTIONARY_PATH = os.path.join(settings.BASE_DIR, "data", "address_dictionary.json")
+
+HANGUL_RE = re.compile(r"[가-힣]")
+LATIN_RE = re.compile(r"[A-Za-z]")
+
+# 영문 행정구역/도로 접미사 → 한글
+SUFFIXES = {
+    "daero": "대로", "ro": "로", "gil": "길",
+    "do": "도", "si": "시", "gun": "군", "gu": "구",
+    "dong": "동", "eup": "읍", "myeon": "면", "ri": "리", "ga": "가",
+}
+# 앞 단어에 붙여 쓰는 영문 단어 (예: Yongsan District → 용산구, Itaewon Station → 이태원역)
+ATTACHED_WORDS = {"district": "구", "city": "시", "province": "도", "station": "역", "floor": "층"}
+
+# 주소 구성요소 순서
+REGION, CITY, DISTRICT, DONG, ROAD, NUMBER, DETAIL = range(7)
+
+
+@lru_cache(maxsize=1)
+def _dictionary():
+    with open(DICTIONARY_PATH, encoding="utf-8") as f:
+        data = json.load(f)
+    data["countries"] = set(data["countries"])
+    return data
+
+
+def _is_hangul_only(text):
+    return bool(HANGUL_RE.search(text)) and not LATIN_RE.search(text)
+
+
+def _transliterate(token, as_address):
+    """영문 토큰 1개 → 한글 (사전/규칙으로 못 바꾸면 None), 숫자·한글 토큰은 그대로"""
+    if not LATIN_RE.search(token):
+        return token
+
+    dictionary = _dictionary()
+    lower = token.lower()
+
+    # 층수: 2F → 2층, B1 → 지하1층, 2nd → 2 (뒤의 floor와 합쳐짐)
+    m = re.fullmatch(r"(\d+)f", lower)
+    if m:
+        return f"{m.group(1)}층"
+    m = re.fullmatch(r"b(\d+)f?", lower)
+    if m:
+        return f"지하{m.group(1)}층"
+    m = re.fullmatch(r"(\d+)(st|nd|rd|th)", lower)
+    if m:
+        return m.group(1)
+
+    # 지명-접미사: Hangang-daero, Yongsan-gu, 84-gil, 27ga-gil, 2-ga
+    if "-" in lower:
+        root, _, suffix = lower.rpartition("-")
+        if suffix not in SUFFIXES:
+            return None
+        m = re.fullmatch(r"(\d+)(ga)?", root)
+        if m:
+            root_ko = m.group(1) + ("가" if m.group(2) else "")
+        else:
+            root_ko = dictionary["roots"].get(root)
+        return root_ko + SUFFIXES[suffix] if root_ko else None
+
+    # 주소에서 단독 지역명(Seoul 등)은 광역 단위 정식 명칭으로
+    if as_address and lower in dictionary["regions"]:
+        return dictionary["regions"][lower]
+    return dictionary["roots"].get(lower) or dictionary["words"].get(lower)
+
+
+def _tokens(text, as_address):
+    """쉼표/공백 기준 토큰을 한글로 변환 (국가명·우편번호 제거, 붙여 쓰는 단어 결합)"""
+    dictionary = _dictionary()
+    countries = dictionary["countries"]
+
+    # 여러 단어로 된 국가명 먼저 제거
+    components = [c.strip() for c in text.split(",")]
+    components = [c for c in components if c and c.lower() not in countries]
+
+    result = []
+    for component in components:
+        for raw in component.split():
+            lower = raw.lower()
+            if lower in ATTACHED_WORDS:
+                if not result:
+                    return None
+                result[-1] = result[-1] + ATTACHED_WORDS[lower]
+                continue
+            if re.fullmatch(r"\d{5}", raw):  # 우편번호
+                continue
+
+            token = _transliterate(raw, as_address)
+            if token is None:
+                return None
+
+            # 84길 / 27가길 / 2가 는 앞 도로명·동 이름에 붙여 씀 (한강대로84길, 한강로2가)
+            if result and re.fullmatch(r"\d+(가)?길|\d+가", token) and not re.fullmatch(r"[\d-]+", result[-1]):
+                result[-1] = result[-1] + token
+            else:
+                result.append(token)
+    return result
+
+
+def _classify(token):
+    if re.fullmatch(r"\d+(-\d+)?(번지)?", token):
+        return NUMBER
+    if re.search(r"(특별시|광역시|특별자치시|특별자치도)$", token) or (token.endswith("도") and len(token) <= 4):
+        return REGION
+    if token.endswith("시") and len(token) <= 4:
+        return CITY
+    if re.search(r"[가-힣](구|군)$", token):
+        return DISTRICT
+    if re.search(r"(대로|로|길)(\d+(가)?길)?$", token):
+        return ROAD
+    if re.search(r"[가-힣](동|읍|면|리)$|\d가$|촌$", token):
+        return DONG
+    return DETAIL
+
+
+def normalize_address(text):
+    """
+    주소를 한국식 순서(시/구/동/도로명/번지)로 정리
+    - 해석할 수 없는 입력(사전에 없는 영문, 구/동/도로명이 없는 문자열)이면 None
+    """
+    if not text:
+        return None
+
+    tokens = _tokens(text, as_address=True)
+    if not tokens:
+        return None
+
+    parts = {tier: [] for tier in range(7)}
+    for token in tokens:
+        parts[_classify(token)].append(token)
+
+    if not (parts[DISTRICT] or parts[DONG] or parts[ROAD]):
+        return None
+
+    ordered = parts[REGION] + parts[CITY] + parts[DISTRICT]
+    if parts[ROAD]:
+        # 도로명주소: 도로명 + 건물번호 (+ 참고항목으로 동)
+        ordered += parts[ROAD] + parts[NUMBER] + parts[DETAIL]
+        if parts[DONG]:
+            ordered.append(f"({', '.join(parts[DONG])})")
+    else:
+        # 지번주소: 동 + 번지
+        ordered += parts[DONG] + parts[NUMBER] + parts[DETAIL]
+
+    return " ".join(ordered)
+
+
+def transliterate_name(text):
+    """영문이 섞인 가게명을 사전으로 한글 표기 (모르는 단어가 있으면 None)"""
+    if not text:
+        return None
+
+    tokens = _tokens(text.replace(",", " "), as_address=False)
+    if not tokens:
+        return None
+    return " ".join(tokens)
+
+
+def to_korean(text):
+    """
+    translate_to_korean의 규칙 기반 버전
+    - 한글만 있으면 그대로 반환 (쉼표로 나뉜 역순 주소만 재배열)
+    - 영문이 섞여 있으면 주소 → 가게명 순서로 시도, 둘 다 실패하면 None (GPT 필요)
+    """
+    if not text:
+        return None
+    if _is_hangul_only(text):
+        return (normalize_address(text) or text) if "," in text else text
+    return normalize_address(text) or transliterate_name(text)
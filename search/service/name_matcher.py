@@ -0,0 +1,139 @@
+# 자모 단위 가게명 유사도 매칭
+# - 음절을 초성/중성/종성으로 분해해서 비교 → 음절 안의 오타(돈가스/돈까스)도 높은 점수
+# - 초성만 입력한 검색어(ㅂㄱㅂㅇ)는 후보의 초성열과 비교
+# - 후보가 많으면 자모 n-gram 겹침으로 먼저 추린 뒤 rapidfuzz cdist로 한 번에 점수 계산
+# - 자모열은 음절보다 길고 자모 종류가 적어서 partial_ratio가 쉽게 높게 나옴 (떡볶이 ↔ 버거보이 80점)
+#   → 임계값은 음절 기준보다 높게 잡고, 음절 n-gram을 충분히 공유하는 후보만 점수 계산(min_coverage)
+
+import re
+
+import hgtk
+import numpy as np
+from rapidfuzz import fuzz, process
+
+NGRAM_SIZE = 2
+SHORTLIST_SIZE = 200      # 후보가 이보다 많으면 n-gram 겹침 상위만 점수 계산
+DEFAULT_THRESHOLD = 85    # 자모 점수 기준 (남산돈까스 ↔ 만족돈까스 83점, 만족돈가스 ↔ 만족돈까스 92점)
+MIN_COVERAGE = 0.3        # 음절 n-gram 공유 비율 하한 (공유 수 / 검색어·후보 중 짧은 쪽 n-gram 수)
+
+CHOSEONG_RE = re.compile(r"[ㄱ-ㅎ]+")
+_STRIP_RE = re.compile(r"[\s\-_.,·'\"()]+")
+
+
+def _clean(text):
+    return _STRIP_RE.sub("", str(text or "")).lower()
+
+
+def _is_syllable(ch):
+    return "가" <= ch <= "힣"
+
+
+def decompose(text):
+    """공백/기호 제거 후 한글 음절을 자모로 분해 (한글이 아닌 문자는 그대로)"""
+    out = []
+    for ch in _clean(text):
+        if _is_syllable(ch):
+            out.extend(j for j in hgtk.letter.decompose(ch) if j)
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def choseong(text):
+    """한글 음절의 초성만 추출 (한글이 아닌 문자는 그대로)"""
+    return "".join(hgtk.letter.decompose(ch)[0] if _is_syllable(ch) else ch for ch in _clean(text))
+
+
+def is_choseong_query(text):
+    return bool(CHOSEONG_RE.fullmatch(_clean(text)))
+
+
+def _ngrams(text):
+    if len(text) < NGRAM_SIZE:
+        return [text] if text else []
+    return [text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)]
+
+
+def coverage(query, name):
+    """음절 n-gram 공유 비율 (초성 검색어는 비교할 음절이 없으므로 1)"""
+    if is_choseong_query(query):
+        return 1.0
+    query_grams, name_grams = set(_ngrams(_clean(query))), set(_ngrams(_clean(name)))
+    if not query_grams or not name_grams:
+        return 0.0
+    return len(query_grams & name_grams) / min(len(query_grams), len(name_grams))
+
+
+class NameMatcher:
+    """
+    후보 가게명 목록에 대한 자모 유사도 계산기 (생성 후 읽기 전용)
+    - scores(): 후보 전체에 대한 0~100 점수 배열 (입력 순서와 동일)
+    - best(): 최고 점수 후보의 (index, score), threshold 미만이면 (None, score)
+    """
+
+    def __init__(self, names):
+        self.names = list(names)
+        self._jamo = [decompose(name) for name in self.names]
+        self._choseong = [choseong(name) for name in self.names]
+
+        postings = {}
+        for idx, jamo in enumerate(self._jamo):
+            for gram in set(_ngrams(jamo)):
+                postings.setdefault(gram, []).append(idx)
+        self._postings = {gram: np.asarray(ids, dtype=np.int32) for gram, ids in postings.items()}
+
+    def __len__(self):
+        return len(self.names)
+
+    def _shortlist(self, query_jamo):
+        """자모 n-gram을 많이 공유하는 후보 index (후보가 적으면 전체)"""
+        if len(self.names) <= SHORTLIST_SIZE:
+            return np.arange(len(self.names))
+
+        hits = [self._postings[g] for g in set(_ngrams(query_jamo)) if g in self._postings]
+        if not hits:
+            return np.empty(0, dtype=np.int32)
+        overlap = np.bincount(np.concatenate(hits), minlength=len(self.names))
+        candidates = np.flatnonzero(overlap)
+        if len(candidates) > SHORTLIST_SIZE:
+            top = np.argpartition(overlap[candidates], -SHORTLIST_SIZE)[-SHORTLIST_SIZE:]
+            candidates = np.sort(candidates[top])
+        return candidates
+
+    def scores(self, query, partial=False, min_coverage=0.0):
+        """
+        검색어와 후보 전체의 유사도 (0~100)
+        - partial=True: 짧은 쪽이 긴 쪽의 일부와 얼마나 맞는지 (fuzz.partial_ratio)
+        - partial=False: 전체 문자열 유사도 (fuzz.ratio)
+        - min_coverage: 음절 n-gram 공유 비율이 이보다 낮은 후보는 0점
+        """
+        result = np.zeros(len(self.names), dtype=np.float32)
+        if not self.names:
+            return result
+
+        if is_choseong_query(query):
+            query_key, targets = _clean(query), self._choseong
+            candidates = np.arange(len(self.names))
+        else:
+            query_key, targets = decompose(query), self._jamo
+            candidates = self._shortlist(query_key)
+
+        if min_coverage > 0:
+            candidates = np.asarray(
+                [i for i in candidates if coverage(query, self.names[i]) >= min_coverage], dtype=np.int64
+            )
+        if not query_key or len(candidates) == 0:
+            return result
+
+        scorer = fuzz.partial_ratio if partial else fuzz.ratio
+        matrix = process.cdist([query_key], [targets[i] for i in candidates], scorer=scorer, dtype=np.float32)
+        result[candidates] = matrix[0]
+        return result
+
+    def best(self, query, partial=False, threshold=0, min_coverage=0.0):
+        scores = self.scores(query, partial=partial, min_coverage=min_coverage)
+        if not len(scores):
+            return None, 0.0
+        idx = int(np.argmax(scores))  # 동점이면 앞쪽(입력 순서) 후보
+        score = float(scores[idx])
+        return (idx, score) if score >= threshold else (None, score)
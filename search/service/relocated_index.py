@@ -0,0 +1,185 @@
+# 이전 가게 CSV 조회용 인덱스 (한 번 만들어서 읽기 전용으로 공유, CSV가 바뀌면 다시 생성)
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import NamedTuple, Optional
+
+import pandas as pd
+from django.conf import settings
+from .name_matcher import NameMatcher
+
+logger = logging.getLogger(__name__)
+
+CSV_PATH = os.path.join(settings.BASE_DIR, "data", "용산구이전가게.csv")
+# geocode_relocated_stores 명령으로 만든 이전 전 주소 좌표 ({주소: {"lat": .., "lng": ..}})
+GEOCODE_PATH = os.path.join(settings.BASE_DIR, "data", "용산구이전가게_geocode.json")
+
+NGRAM_SIZE = 2
+FUZZY_THRESHOLD = 85         # 자모 점수 기준 (name_matcher.DEFAULT_THRESHOLD)
+FUZZY_MIN_QUERY_LENGTH = 3   # 이보다 짧은 검색어(곱창, 설빙 등 일반 명사)는 퍼지 검색하지 않음
+FUZZY_MIN_COVERAGE = 0.3     # 공유 n-gram 수 / 둘 중 짧은 쪽 n-gram 수가 이 값 이상인 가게만 점수 계산
+MTIME_CHECK_INTERVAL = 5    # CSV 변경 여부 확인 간격 (초)
+
+
+class RelocatedStore(NamedTuple):
+    name: str
+    name_norm: str
+    previous_address: str
+    previous_lat: Optional[float] = None
+    previous_lng: Optional[float] = None
+
+
+def normalize_name(name):
+    """공백 제거 + 소문자 (CSV/검색어 공통 정규화)"""
+    return str(name).replace(" ", "").lower()
+
+
+def load_geocodes(path=GEOCODE_PATH):
+    """사전 지오코딩 결과 (파일이 없으면 빈 dict)"""
+    if not os.path.exists(path):
+        logger.warning(f"이전 전 주소 좌표 파일 없음: {path} (python manage.py geocode_relocated_stores 필요, 좌표 없이 응답)")
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def previous_address_column(df):
+    # 실제 CSV 컬럼명 확인
+    return "이전 전 상세 주소" if "이전 전 상세 주소" in df.columns else "이전 전 주소"
+
+
+def _ngrams(text):
+    if len(text) < NGRAM_SIZE:
+        return {text} if text else set()
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+class RelocatedStoreIndex:
+    """
+    가게명 → 이전 전 주소 조회 인덱스
+    - 생성 후 변경하지 않으므로 여러 스레드에서 락 없이 조회 가능
+    - 부분 문자열 검색: 검색어 n-gram의 posting list 교집합 → 실제 포함 여부 확인
+    - 퍼지 검색: n-gram을 충분히 공유하는 가게만 자모 단위 매칭 (NameMatcher)
+    """
+
+    def __init__(self, stores):
+        self.stores = tuple(stores)
+        postings = defaultdict(set)
+        for idx, store in enumerate(self.stores):
+            for gram in _ngrams(store.name_norm):
+                postings[gram].add(idx)
+        self._postings = {gram: frozenset(ids) for gram, ids in postings.items()}
+        self._gram_counts = tuple(len(_ngrams(store.name_norm)) for store in self.stores)
+        self._matcher = NameMatcher(store.name_norm for store in self.stores)
+
+    @classmethod
+    def from_csv(cls, path=CSV_PATH, geocode_path=GEOCODE_PATH):
+        df = pd.read_csv(path)
+        col_name = previous_address_column(df)
+        geocodes = load_geocodes(geocode_path)
+
+        stores, missing = [], []
+        for name, previous_address in zip(df["상호명"], df[col_name]):
+            if pd.isna(name) or pd.isna(previous_address):
+                continue
+            previous_address = str(previous_address).strip()
+            coords = geocodes.get(previous_address) or {}
+            if not coords:
+                missing.append(previous_address)
+            stores.append(RelocatedStore(
+                name=str(name),
+                name_norm=normalize_name(name),
+                previous_address=previous_address,
+                previous_lat=coords.get("lat"),
+                previous_lng=coords.get("lng"),
+            ))
+        if geocodes and missing:
+            logger.warning(f"이전 전 주소 좌표 없음 {len(missing)}개 (geocode_relocated_stores 다시 실행 필요): {missing[:5]}")
+        return cls(stores)
+
+    def __len__(self):
+        return len(self.stores)
+
+    def _substring_matches(self, query):
+        grams = _ngrams(query)
+        postings = [self._postings.get(gram, frozenset()) for gram in grams]
+        if len(query) < NGRAM_SIZE:
+            # 한 글자 검색어는 해당 글자를 포함하는 모든 n-gram의 합집합에서 확인
+            candidates = set().union(*(ids for gram, ids in self._postings.items() if query in gram))
+        else:
+            candidates = frozenset.intersection(*postings) if postings else frozenset()
+        return sorted(idx for idx in candidates if query in self.stores[idx].name_norm)
+
+    def _covered(self, query):
+        """검색어 n-gram을 FUZZY_MIN_COVERAGE 이상 공유하는 가게 index (검색어/가게명 중 짧은 쪽 기준)"""
+        grams = _ngrams(query)
+        shared = defaultdict(int)
+        for gram in grams:
+            for idx in self._postings.get(gram, ()):
+                shared[idx] += 1
+        return [
+            idx for idx, count in shared.items()
+            if count / min(len(grams), self._gram_counts[idx]) >= FUZZY_MIN_COVERAGE
+        ]
+
+    def _fuzzy_match(self, query):
+        if len(query) < FUZZY_MIN_QUERY_LENGTH:
+            return None
+        covered = self._covered(query)
+        if not covered:
+            return None
+
+        scores = self._matcher.scores(query, partial=True)
+        idx = max(covered, key=lambda i: (scores[i], -i))  # 동점이면 앞쪽 가게
+        score = float(scores[idx])
+        if score < FUZZY_THRESHOLD:
+            idx = None
+        logger.debug(f"CSV 매칭 시도: {self.stores[idx].name_norm if idx is not None else None}, 유사도={score:.0f}")
+        return idx
+
+    def find(self, place_name):
+        """가게명으로 이전 가게 찾기 (부분 문자열 → 퍼지 순서, 없으면 None)"""
+        query = normalize_name(place_name or "")
+        if not query:
+            return None
+
+        matches = self._substring_matches(query)
+        if matches:
+            return self.stores[matches[0]]
+
+        idx = self._fuzzy_match(query)
+        return self.stores[idx] if idx is not None else None
+
+
+_index = None
+_index_mtime = None
+_index_checked = 0.0
+_index_lock = threading.Lock()
+
+
+def _source_mtime():
+    mtime = os.stat(CSV_PATH).st_mtime_ns
+    if os.path.exists(GEOCODE_PATH):
+        mtime = (mtime, os.stat(GEOCODE_PATH).st_mtime_ns)
+    return mtime
+
+
+def get_index():
+    """현재 인덱스 반환 (CSV/좌표 파일 수정 시각이 바뀌었으면 새로 만들어 교체)"""
+    global _index, _index_mtime, _index_checked
+
+    now = time.monotonic()
+    if _index is not None and now - _index_checked < MTIME_CHECK_INTERVAL:
+        return _index
+
+    with _index_lock:
+        mtime = _source_mtime()
+        if _index is None or mtime != _index_mtime:
+            _index = RelocatedStoreIndex.from_csv(CSV_PATH)
+            _index_mtime = mtime
+        _index_checked = now
+    return _index
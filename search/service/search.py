@@ -1,24 +1,25 @@
+import logging
+
 from django.conf import settings
-import requests
-import pandas as pd
-import os
-from rapidfuzz import fuzz
+from recommendations.services.google_client import get_json, aget_json
+from .relocated_index import get_index as get_relocated_index
+from .name_matcher import NameMatcher, DEFAULT_THRESHOLD, MIN_COVERAGE
 
-CSV_PATH = os.path.join(settings.BASE_DIR, "data", "용산구이전가게.csv")
-history_df = pd.read_csv(CSV_PATH)
+logger = logging.getLogger(__name__)
 
 # Google API Helper
-def get_place_id(query, lat, lng, threshold=60):
-    url = "https://maps.googleapis.com/maps/api/place/textsearch/json"
-    params = {
+def _place_id_params(query, lat, lng):
+    return {
         "query": query,
         "location": f"{lat},{lng}",
         "rankby": "distance",
         "language": "ko",
         "key": settings.GOOGLE_API_KEY
     }
-    res = requests.get(url, params=params).json()
-    candidates = res.get("results", [])
+
+
+def _pick_place(candidates, query, threshold):
+    """Text Search 후보 중 검색어와 가장 잘 맞는 가게 선택 → (place_id, name)"""
     if not candidates:
         return None, None
 
@@ -30,78 +31,70 @@ def get_place_id(query, lat, lng, threshold=60):
     # 2. 가장 가까운 후보
     nearest = candidates[0]
     place_name = nearest["name"]
-    
 
-    # 3. 유사도 검사
-    similarity = fuzz.partial_ratio(query.lower(), place_name.lower())
-    print(f"[DEBUG] 검색어={query}, 구글결과={place_name}, 유사도={similarity}")
+    # 3. 유사도 검사 (자모 단위 비교 → 음절 안의 오타도 허용, 음절 n-gram을 거의 공유하지 않는 후보는 0점)
+    matcher = NameMatcher([c["name"] for c in candidates])
+    similarity = float(matcher.scores(query, partial=True, min_coverage=MIN_COVERAGE)[0])
+    logger.debug(f"검색어={query}, 구글결과={place_name}, 유사도={similarity:.0f}")
 
     if similarity < threshold:
-        best_match = max(
-            candidates,
-            key=lambda c: fuzz.ratio(query.lower(), c["name"].lower()),
-        )
-        best_name = best_match["name"]
-        best_score = fuzz.ratio(query.lower(), best_name.lower())
-        print(f"[DEBUG] Fallback 선택={best_name}, 유사도={best_score}")
-
-        if best_score >= threshold:
-            return best_match["place_id"], best_name
-        else:
+        best_idx, best_score = matcher.best(query, threshold=threshold, min_coverage=MIN_COVERAGE)
+        logger.debug(f"Fallback 선택={candidates[best_idx]['name'] if best_idx is not None else None}, 유사도={best_score:.0f}")
+
+        if best_idx is None:
             return None, None
+        return candidates[best_idx]["place_id"], candidates[best_idx]["name"]
 
     return nearest["place_id"], place_name
 
 
-def get_place_details(place_id, place_name=None):
-    previous_address, previous_lat, previous_lng = None, None, None
-
-    if place_name:
-        # 문자열 정규화
-        normalized_name = place_name.replace(" ", "").lower()
-        history_df["상호명_norm"] = history_df["상호명"].str.replace(" ", "").str.lower()
-
-        # 부분 문자열 매칭
-        match = history_df[history_df["상호명_norm"].str.contains(normalized_name, na=False) |
-                           history_df["상호명_norm"].str.contains(normalized_name, na=False)]
-
-        # RapidFuzz fallback
-        if match.empty:
-            from rapidfuzz import process
-            choices = history_df["상호명_norm"].tolist()
-            best_match = process.extractOne(normalized_name, choices, scorer=fuzz.partial_ratio)
-            if best_match:
-                best_name, score, idx = best_match
-                print(f"[DEBUG] CSV 매칭 시도: {best_name}, 유사도={score}")
-                if score >= 80:
-                    match = history_df.iloc[[idx]]
-
-        print("검색 키워드:", place_name, "→ 정규화:", normalized_name)
-
-        if not match.empty:
-            # ✅ 여기서 실제 CSV 컬럼명 확인
-            col_name = "이전 전 상세 주소" if "이전 전 상세 주소" in match.columns else "이전 전 주소"
-            previous_address = match.iloc[0][col_name]
-
-            # 위경도 변환
-            geo_url = "https://maps.googleapis.com/maps/api/geocode/json"
-            geo_params = {"address": previous_address, "language": "ko", "key": settings.GOOGLE_API_KEY}
-            geo_res = requests.get(geo_url, params=geo_params).json()
-            if geo_res.get("status") == "OK" and geo_res.get("results"):
-                loc = geo_res["results"][0]["geometry"]["location"]
-                previous_lat, previous_lng = loc["lat"], loc["lng"]
+def get_place_id(query, lat, lng, threshold=DEFAULT_THRESHOLD):
+    res = get_json("place/textsearch", _place_id_params(query, lat, lng))
+    return _pick_place(res.get("results", []), query, threshold)
 
-    # Google place details
-    url = "https://maps.googleapis.com/maps/api/place/details/json"
-    params = {
+
+async def aget_place_id(query, lat, lng, threshold=DEFAULT_THRESHOLD):
+    """get_place_id의 비동기 버전"""
+    res = await aget_json("place/textsearch", _place_id_params(query, lat, lng))
+    return _pick_place(res.get("results", []), query, threshold)
+
+
+def _find_previous_address(place_name):
+    """
+    이전 가게 CSV 인덱스에서 가게명으로 이전 전 주소/좌표 찾기 → (주소, 위도, 경도)
+    - 좌표는 geocode_relocated_stores 명령으로 미리 계산된 값 (요청 중 지오코딩하지 않음)
+    """
+    if not place_name:
+        return None, None, None
+
+    store = get_relocated_index().find(place_name)
+    logger.debug(f"검색 키워드: {place_name} → 이전 가게: {store.name if store else None}")
+    if not store:
+        return None, None, None
+    return store.previous_address, store.previous_lat, store.previous_lng
+
+
+def geocode_params(address):
+    return {"address": address, "language": "ko", "key": settings.GOOGLE_API_KEY}
+
+
+def parse_geocode(geo_res):
+    if geo_res.get("status") == "OK" and geo_res.get("results"):
+        loc = geo_res["results"][0]["geometry"]["location"]
+        return loc["lat"], loc["lng"]
+    return None, None
+
+
+def _details_params(place_id):
+    return {
         "place_id": place_id,
         "fields": "name,formatted_address,geometry,rating,types,photos,business_status,reviews",
         "language": "ko",
         "key": settings.GOOGLE_API_KEY
     }
-    res = requests.get(url, params=params).json()
-    result = res.get("result", {})
 
+
+def _finalize_details(result, previous_address, previous_lat, previous_lng):
     # 상태 매핑
     if previous_address:
         status = "이전함"
@@ -118,12 +111,29 @@ def get_place_details(place_id, place_name=None):
     result["previous_lng"] = previous_lng
     result["business_status"] = status
 
-    print("찾은 이전주소:", previous_address)
-    print("이전 전 주소 위도와 경도", previous_lat, previous_lng)
+    logger.debug(f"찾은 이전주소: {previous_address} (위도 {previous_lat}, 경도 {previous_lng})")
 
     return result
 
 
+def get_place_details(place_id, place_name=None):
+    previous_address, previous_lat, previous_lng = _find_previous_address(place_name)
+
+    # Google place details
+    res = get_json("place/details", _details_params(place_id))
+    result = res.get("result", {})
+
+    return _finalize_details(result, previous_address, previous_lat, previous_lng)
+
+
+async def aget_place_details(place_id, place_name=None):
+    """get_place_details의 비동기 버전"""
+    previous_address, previous_lat, previous_lng = _find_previous_address(place_name)
+
+    res = await aget_json("place/details", _details_params(place_id))
+    return _finalize_details(res.get("result", {}), previous_address, previous_lat, previous_lng)
+
+
 
 def get_photo_url(photo_ref, maxwidth=400):
     return f"https://maps.googleapis.com/maps/api/place/photo?maxwidth={maxwidth}&photoreference={photo_ref}&key={settings.GOOGLE_API_KEY}"
@@ -1,18 +1,23 @@
-from openai import OpenAI
-from django.conf import settings
+import asyncio
+import json
+import logging
 import re
 import sys
 import os
+import time
+from concurrent.futures import wait
+from django.conf import settings
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from recommendations.services.cache_service import CacheService
+from recommendations.services.gpt_client import chat, achat, GPTBudgetExceededError
+from recommendations.services.workers import submit
 
-def extract_keywords(reviews):
-    if not reviews:
-        return []
+logger = logging.getLogger(__name__)
 
+def _keywords_prompt(reviews):
     text = "\n".join(reviews[:10])  # 리뷰 최대 10개만 사용
 
-    prompt = f"""
+    return f"""
     다음 리뷰에서 대표 음식, 음료, 서비스 관련 키워드 1~3개만 뽑아줘.
     조건:
     - 반드시 명사만 출력 (메뉴 이름, 음식, 음료, 서비스 특징)
@@ -25,13 +30,8 @@ def extract_keywords(reviews):
     {text}
     """
 
-    response = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0,
-    )
-    raw = response.choices[0].message.content.strip()
 
+def _parse_keywords(raw):
     # 쉼표 기준 분리 + 불필요한 공백 제거
     candidates = [kw.strip() for kw in raw.split(",") if kw.strip()]
 
@@ -39,18 +39,29 @@ def extract_keywords(reviews):
     keywords = [re.sub(r"[^가-힣A-Za-z ]", "", kw) for kw in candidates]
 
     # 너무 짧은 단어 (1글자) 제거 + 중복 제거
-    keywords = list(dict.fromkeys([kw for kw in keywords if len(kw) > 1]))
+    return list(dict.fromkeys([kw for kw in keywords if len(kw) > 1]))
 
-    return keywords
 
+def extract_keywords(reviews):
+    if not reviews:
+        return []
 
-client = OpenAI(api_key=settings.OPENAI_API_KEY)
-def generate_summary_card(details, reviews, uptaenms):
-    # 캐시 키 생성용 데이터 준비
-    place_name = details.get("name", "")
+    raw = chat(_keywords_prompt(reviews), kind="keywords", temperature=0)
+    return _parse_keywords(raw)
+
+
+async def aextract_keywords(reviews):
+    """extract_keywords의 비동기 버전"""
+    if not reviews:
+        return []
+
+    raw = await achat(_keywords_prompt(reviews), kind="keywords", temperature=0)
+    return _parse_keywords(raw)
+
+
+def _normalize_reviews(reviews):
+    """리뷰 타입이 str 리스트라면 dict 리스트로 고치고, 캐시 키용 텍스트 리스트도 함께 반환"""
     review_texts = []
-    
-    # 리뷰 타입이 str 리스트라면 dict 리스트로 고치도록 
     if reviews and isinstance(reviews, list):
         normalized_reviews = []
         for r in reviews:
@@ -61,16 +72,22 @@ def generate_summary_card(details, reviews, uptaenms):
                 normalized_reviews.append(r)
                 review_texts.append(r.get("text", ""))
         reviews = normalized_reviews
+    return reviews, review_texts
 
-    # 캐시에서 먼저 조회
-    cached_summary = CacheService.cache_gpt_summary(place_name, review_texts, uptaenms)
-    if cached_summary:
-        return cached_summary
 
+def _has_no_reviews(reviews):
     # 리뷰가 없거나 모두 공백인 경우
-    if not reviews or all(not r.get("text", "").strip() for r in reviews):
+    return not reviews or all(not r.get("text", "").strip() for r in reviews)
+
+
+def _is_generic_place(uptaenms):
+    # point_of_interest, establishment만 있으면 요약카드 생성하지 않음
+    uptaenms_list = uptaenms if isinstance(uptaenms, list) else [str(uptaenms)]
+    return set(uptaenms_list).issubset({"point_of_interest", "establishment"})
+
 
-        prompt = f"""
+def _no_review_summary_prompt(details, uptaenms):
+    return f"""
         '{details.get("name")}' 은/는 어떤 곳인지 설명해 주세요.
         업태 구분명({', '.join(uptaenms)}) / '{details.get("rating")}'과 '{details.get("formatted_address")}'을 참고할 수 있습니다.
         조건:
@@ -84,29 +101,9 @@ def generate_summary_card(details, reviews, uptaenms):
         - "환승이 편리하고 주변 상권 접근성이 좋은 교통 요지 입니다"
         """
 
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.5  # 약간의 창의성 허용
-        )
-        summary = response.choices[0].message.content.strip()
-        summary = re.sub(r'^"(.*)"$', r'\1', summary)  # 양쪽 큰따옴표 제거
-
-        # 결과를 캐시에 저장
-        CacheService.set_gpt_summary(place_name, review_texts, uptaenms, summary)
-
-        return summary
-   
-   # reviews를 dict 리스트로 수정
-    review_texts = [r.get("text", "") for r in reviews]
-    keywords = extract_keywords(review_texts)
-    uptaenms_list = uptaenms if isinstance(uptaenms, list) else [str(uptaenms)]
-
-    # point_of_interest, establishment만 있으면 요약카드 생성하지 않음
-    if set(uptaenms_list).issubset({"point_of_interest", "establishment"}):
-        return ""
 
-    prompt = f"""
+def _review_summary_prompt(details, reviews, keywords):
+    return f"""
     아래는 '{details.get("name")}' 의 구글맵 리뷰입니다:
 
 
@@ -130,18 +127,89 @@ def generate_summary_card(details, reviews, uptaenms):
     - "환승이 편리하고 주변 상권 접근성이 좋은 교통 요지 입니다"
     """
 
-    response = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0  # 사실 기반 요약
+
+def _clean_summary(summary):
+    return re.sub(r'^"(.*)"$', r'\1', summary)  # 양쪽 큰따옴표 제거
+
+
+def _budgeted(compute, default):
+    """compute() → (값, False), 하루 예산 초과면 (default, True)"""
+    try:
+        return compute(), False
+    except GPTBudgetExceededError as e:
+        logger.warning(f"{e}, 기본값 사용")
+        return default, True
+
+
+async def _abudgeted(coro, default):
+    """_budgeted의 비동기 버전 (코루틴을 받음)"""
+    try:
+        return await coro, False
+    except GPTBudgetExceededError as e:
+        logger.warning(f"{e}, 기본값 사용")
+        return default, True
+
+
+def _summary_cache_data(place_name, review_texts, types):
+    return {'place_name': place_name, 'reviews': review_texts, 'types': types}
+
+
+def _summary_card(details, reviews, uptaenms):
+    """generate_summary_card 본체 (하루 예산 초과 시 GPTBudgetExceededError 그대로 전달)"""
+    # 캐시 키 생성용 데이터 준비
+    place_name = details.get("name", "")
+    reviews, review_texts = _normalize_reviews(reviews)
+
+    def summarize():
+        if _has_no_reviews(reviews):
+            summary = chat(_no_review_summary_prompt(details, uptaenms), kind="summary", temperature=0.5)  # 약간의 창의성 허용
+        else:
+            # 키워드 추출(GPT 호출) 전에 먼저 걸러냄 (빈 문자열은 캐시에 저장되지 않음)
+            if _is_generic_place(uptaenms):
+                return ""
+
+            keywords = extract_keywords(review_texts)
+            summary = chat(_review_summary_prompt(details, reviews, keywords), kind="summary", temperature=0)  # 사실 기반 요약
+
+        return _clean_summary(summary)
+
+    # 캐시 조회 → 없으면 생성 (같은 가게 동시 요청은 GPT 1회 호출로 합침)
+    return CacheService.get_or_compute(
+        'gpt_summary', _summary_cache_data(place_name, review_texts, uptaenms), summarize
     )
 
-    summary = response.choices[0].message.content.strip()
-    summary = re.sub(r'^"(.*)"$', r'\1', summary)  # 양쪽 큰따옴표 제거
 
-    # 결과를 캐시에 저장
-    CacheService.set_gpt_summary(place_name, review_texts, uptaenms, summary)
+def generate_summary_card(details, reviews, uptaenms):
+    # 하루 예산 초과면 요약 없이 진행 (캐시에 저장하지 않으므로 예산이 풀리면 다시 생성)
+    summary, _ = _budgeted(lambda: _summary_card(details, reviews, uptaenms), None)
+    return summary
+
+
+async def _asummary_card(details, reviews, uptaenms):
+    """_summary_card의 비동기 버전"""
+    place_name = details.get("name", "")
+    reviews, review_texts = _normalize_reviews(reviews)
+
+    async def summarize():
+        if _has_no_reviews(reviews):
+            summary = await achat(_no_review_summary_prompt(details, uptaenms), kind="summary", temperature=0.5)
+        else:
+            if _is_generic_place(uptaenms):
+                return ""
+
+            keywords = await aextract_keywords(review_texts)
+            summary = await achat(_review_summary_prompt(details, reviews, keywords), kind="summary", temperature=0)
+
+        return _clean_summary(summary)
+
+    return await CacheService.aget_or_compute(
+        'gpt_summary', _summary_cache_data(place_name, review_texts, uptaenms), summarize
+    )
+
 
+async def agenerate_summary_card(details, reviews, uptaenms):
+    """generate_summary_card의 비동기 버전"""
+    summary, _ = await _abudgeted(_asummary_card(details, reviews, uptaenms), None)
     return summary
 
 
@@ -150,45 +218,12 @@ def generate_summary_card(details, reviews, uptaenms):
 ALLOWED_TAGS = ["정겨움", "편안함", "조용함", "활기참", "소박함", "세심함", "정성스러움", "깔끔함", "친절함", "고즈넉함",
                 "현대적임", "전통적임", "독특함", "화려함", "낭만적임", "가족적임", "전문적임","아늑함","편리함","트렌디함"]
 
-def generate_emotion_tags(place_name, reviews, types):
-    """리뷰를 기반으로 감정 태그 생성 (캐싱 적용)"""
-    
-    # 캐시 키 생성용 데이터 준비
-    review_texts = []
-    
-    # reviews 타입이 str이었다면 dict로. 
-    if reviews and isinstance(reviews, list):
-        normalized_reviews = []
-        for r in reviews:
-            if isinstance(r, str):
-                normalized_reviews.append({"text": r})
-                review_texts.append(r)
-            elif isinstance(r, dict):
-                normalized_reviews.append(r)
-                review_texts.append(r.get("text", ""))
-        reviews = normalized_reviews
-    
-    # 캐시에서 먼저 조회
-    cached_tags = CacheService.cache_gpt_emotion_tags(place_name, review_texts, types)
-    if cached_tags:
-        return cached_tags
-    
-    # 리뷰가 없으면 업태별 기본 감정 태그 반환
-    if not reviews or len(reviews) == 0:
-        print(f"[DEBUG] 리뷰가 없음, 업태별 기본 감정 태그 사용")
-        default_tags = get_default_emotion_tags_by_types(types)
-        # 기본 태그도 캐시에 저장
-        CacheService.set_gpt_emotion_tags(place_name, review_texts, types, default_tags)
-        return default_tags
-    
-    # 리뷰가 있으면 GPT로 감정 태그 생성
-    try:
-        client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        
-        # 리뷰 텍스트들을 하나로 합치기
-        review_text = "\n".join([review.get('text', '') for review in reviews[:5]])
-        
-        prompt = f"""
+
+def _emotion_tags_prompt(place_name, reviews, types):
+    # 리뷰 텍스트들을 하나로 합치기
+    review_text = "\n".join([review.get('text', '') for review in reviews[:5]])
+
+    return f"""
         다음 가게의 리뷰를 읽고, 이 가게에서 느낄 수 있는 감정을 나타내는 한국어 단어 2개를 추출해주세요.
         
         가게명: {place_name}
@@ -198,33 +233,89 @@ def generate_emotion_tags(place_name, reviews, types):
         
         감정 태그는 쉼표로 구분해서 답변해주세요. 예: 친절함, 아늑함
         """
-        
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=50,
-            temperature=0.7
-        )
-        
-        emotion_text = response.choices[0].message.content.strip()
-        
-        # 응답을 감정 태그 리스트로 변환
-        emotion_candidates = [tag.strip() for tag in emotion_text.split(',')]
 
-        # 최종 감정 태그 (최대 2개)
-        final_emotions = emotion_candidates[:2]
-        
-        # 결과를 캐시에 저장
-        CacheService.set_gpt_emotion_tags(place_name, review_texts, types, final_emotions)
-       
-        return final_emotions
-        
-    except Exception as e:
-        print(f"[DEBUG] GPT API 호출 중 오류: {e}")
-        # GPT 실패 시에도 업태별 기본 감정 태그 반환
-        default_tags = get_default_emotion_tags_by_types(types)
-        CacheService.set_gpt_emotion_tags(place_name, review_texts, types, default_tags)
-        return default_tags
+
+def _parse_emotion_tags(emotion_text):
+    # 응답을 감정 태그 리스트로 변환
+    emotion_candidates = [tag.strip() for tag in emotion_text.split(',')]
+
+    # 최종 감정 태그 (최대 2개)
+    return emotion_candidates[:2]
+
+
+def _emotion_tags(place_name, reviews, types):
+    """generate_emotion_tags 본체 (하루 예산 초과 시 GPTBudgetExceededError 그대로 전달)"""
+    reviews, review_texts = _normalize_reviews(reviews)
+
+    def tag():
+        # 리뷰가 없으면 업태별 기본 감정 태그 반환 (기본 태그도 캐시에 저장)
+        if not reviews:
+            logger.debug("리뷰가 없음, 업태별 기본 감정 태그 사용")
+            return get_default_emotion_tags_by_types(types)
+
+        # 리뷰가 있으면 GPT로 감정 태그 생성
+        try:
+            emotion_text = chat(
+                _emotion_tags_prompt(place_name, reviews, types),
+                model="gpt-3.5-turbo",
+                kind="emotion_tags",
+                max_tokens=50,
+                temperature=0.7
+            )
+            return _parse_emotion_tags(emotion_text)
+
+        except GPTBudgetExceededError:
+            # 예산 초과로 쓴 기본 태그는 캐시에 저장하지 않음
+            raise
+        except Exception as e:
+            logger.warning(f"GPT API 호출 중 오류: {e}")
+            # GPT 실패 시에도 업태별 기본 감정 태그 반환
+            return get_default_emotion_tags_by_types(types)
+
+    return CacheService.get_or_compute(
+        'gpt_emotion_tags', _summary_cache_data(place_name, review_texts, types), tag
+    )
+
+
+def generate_emotion_tags(place_name, reviews, types):
+    """리뷰를 기반으로 감정 태그 생성 (캐싱 + 동시 요청 합치기, 하루 예산 초과면 업태별 기본 감정 태그)"""
+    tags, _ = _budgeted(lambda: _emotion_tags(place_name, reviews, types), get_default_emotion_tags_by_types(types))
+    return tags
+
+
+async def _aemotion_tags(place_name, reviews, types):
+    """_emotion_tags의 비동기 버전"""
+    reviews, review_texts = _normalize_reviews(reviews)
+
+    async def tag():
+        if not reviews:
+            return get_default_emotion_tags_by_types(types)
+
+        try:
+            emotion_text = await achat(
+                _emotion_tags_prompt(place_name, reviews, types),
+                model="gpt-3.5-turbo",
+                kind="emotion_tags",
+                max_tokens=50,
+                temperature=0.7
+            )
+            return _parse_emotion_tags(emotion_text)
+
+        except GPTBudgetExceededError:
+            raise
+        except Exception as e:
+            logger.warning(f"GPT API 호출 중 오류: {e}")
+            return get_default_emotion_tags_by_types(types)
+
+    return await CacheService.aget_or_compute(
+        'gpt_emotion_tags', _summary_cache_data(place_name, review_texts, types), tag
+    )
+
+
+async def agenerate_emotion_tags(place_name, reviews, types):
+    """generate_emotion_tags의 비동기 버전"""
+    tags, _ = await _abudgeted(_aemotion_tags(place_name, reviews, types), get_default_emotion_tags_by_types(types))
+    return tags
 
 
 def get_default_emotion_tags_by_types(types):
@@ -270,9 +361,384 @@ def get_default_emotion_tags_by_types(types):
     for place_type in types:
         if place_type in type_emotion_map:
             emotion_tags = type_emotion_map[place_type]
-            print(f"[DEBUG] 업태 '{place_type}'에 맞는 기본 감정 태그: {emotion_tags}")
+            logger.debug(f"업태 '{place_type}'에 맞는 기본 감정 태그: {emotion_tags}")
             return emotion_tags
     
     # 기본값
-    print(f"[DEBUG] 매칭되는 업태가 없음, 기본값 '정겨움' 반환")
+    logger.debug("매칭되는 업태가 없음, 기본값 '정겨움' 반환")
     return ['정겨움']
+
+
+
+# 여러 가게 카드(요약 + 키워드 + 감정태그) 일괄 생성
+# - 리뷰가 있는 가게들을 묶어 JSON 응답 1번으로 처리 (가게당 GPT 3회 → 묶음당 1회)
+# - 응답에 빠졌거나 형식이 틀린 가게는 기존 가게별 함수로 생성
+
+PLACE_CARD_BATCH_SIZE = getattr(settings, "GPT_PLACE_CARD_BATCH_SIZE", 5)
+PLACE_CARD_MAX_TAGS = 2
+
+
+def _place_cards_prompt(places):
+    blocks = []
+    for idx, (details, reviews, types, review_texts) in enumerate(places):
+        review_text = "\n".join(f"  - {text}" for text in review_texts[:5])
+        blocks.append(f"""[{idx}] {details.get("name", "")}
+업태: {', '.join(types)}
+리뷰:
+{review_text}""")
+    places_text = "\n\n".join(blocks)
+
+    return f"""
+    아래 가게들의 구글맵 리뷰를 읽고, 가게마다 요약/키워드/감정태그를 만들어줘.
+
+    {places_text}
+
+    summary 조건:
+    - 반드시 1문장, 간결하게 작성
+    - keywords 중 최소 1개는 반드시 포함하고, 대표 메뉴에 대해 언급할 것
+    - 없는 사실은 절대 추가하지 마
+    - "맛있는 음식", "다양한 음식", "좋은 분위기" 같은 추상적 표현 금지
+    - 업태는 참고만 하고, "음식점, 카페, 역", "가게" 같은 단어는 쓰지 마
+    - 문장은 '~~한 곳이에요', '~~로 사랑받는 곳이에요', '~~을 즐길 수 있는 곳이에요'로 끝낼 것
+
+    keywords 조건:
+    - 리뷰에 나온 대표 음식, 음료, 서비스 특징 명사 1~3개 (예: 삼겹살, 아메리카노, 친절함)
+    - '음식', '맛', '분위기' 같은 추상적/일반적 단어는 제외
+
+    emotion_tags 조건:
+    - 이 가게에서 느낄 수 있는 감정 {PLACE_CARD_MAX_TAGS}개, 반드시 다음 중에서만 고를 것: {', '.join(ALLOWED_TAGS)}
+
+    JSON으로만 답변:
+    {{"places": [{{"id": 0, "summary": "...", "keywords": ["..."], "emotion_tags": ["...", "..."]}}]}}
+    """
+
+
+def _validate_place_card(item):
+    """GPT가 만든 가게 카드 1개 검증 (요약이 없거나 허용된 감정태그가 없으면 None)"""
+    summary = item.get("summary")
+    if not isinstance(summary, str) or not summary.strip():
+        return None
+
+    tags = [str(tag).strip() for tag in item.get("emotion_tags") or []]
+    tags = [tag for tag in dict.fromkeys(tags) if tag in ALLOWED_TAGS][:PLACE_CARD_MAX_TAGS]
+    if not tags:
+        return None
+
+    keywords = item.get("keywords") or []
+    if isinstance(keywords, str):
+        keywords = [keywords]
+    return {
+        "summary": _clean_summary(summary.strip()),
+        "keywords": _parse_keywords(", ".join(str(kw) for kw in keywords)),
+        "emotion_tags": tags,
+    }
+
+
+def _parse_place_cards(raw, count):
+    """JSON 응답 → {입력 index: 카드} (파싱 실패/범위 밖 id는 제외)"""
+    try:
+        data = json.loads(raw)
+    except ValueError:
+        logger.warning(f"가게 카드 JSON 파싱 실패: {raw[:200]}")
+        return {}
+
+    items = data.get("places") if isinstance(data, dict) else None
+    cards = {}
+    for item in items if isinstance(items, list) else []:
+        if not isinstance(item, dict):
+            continue
+        idx = item.get("id")
+        if not isinstance(idx, int) or not 0 <= idx < count or idx in cards:
+            continue
+        card = _validate_place_card(item)
+        if card:
+            cards[idx] = card
+    return cards
+
+
+def _place_cards_params(count):
+    return {
+        "temperature": 0,
+        "max_tokens": 200 * count + 100,
+        "response_format": {"type": "json_object"},
+    }
+
+
+def _card_cache_args(details, reviews, types):
+    """(캐시 키 인자, 배치 입력) - 배치 대상이 아니면 배치 입력은 None"""
+    place_name = details.get("name", "")
+    reviews, review_texts = _normalize_reviews(reviews)
+    batchable = not _has_no_reviews(reviews) and not _is_generic_place(types)
+    return (place_name, review_texts, types), (details, reviews, types, review_texts) if batchable else None
+
+
+class _DegradedCard(Exception):
+    """하루 예산 초과로 기본값을 채운 카드 - get_or_compute가 캐시에 저장하지 않도록 예외로 꺼냄"""
+
+    def __init__(self, card):
+        super().__init__("하루 예산 초과로 기본값을 채운 가게 카드")
+        self.card = card
+
+
+def _place_card_fallback(details, reviews, types):
+    """
+    가게별 함수로 카드 생성 (배치 응답에 빠진 가게, 리뷰 없는/일반 장소) → (카드, 기본값 사용 여부)
+    - 하루 예산 초과로 GPT를 못 부른 항목은 요약 None, 키워드 [], 업태별 기본 감정 태그
+    - 기본값을 쓴 카드는 gpt_place_card 캐시에 저장하지 않음 (예산이 풀리면 다시 생성)
+    """
+    normalized, review_texts = _normalize_reviews(reviews)
+    summary, no_summary = _budgeted(lambda: _summary_card(details, reviews, types), None)
+    keywords, no_keywords = _budgeted(
+        lambda: extract_keywords(review_texts) if not _has_no_reviews(normalized) else [], []
+    )
+    tags, no_tags = _budgeted(
+        lambda: _emotion_tags(details.get("name", ""), reviews, types), get_default_emotion_tags_by_types(types)
+    )
+    card = {"summary": summary, "keywords": keywords, "emotion_tags": tags}
+    return card, no_summary or no_keywords or no_tags
+
+
+async def _aplace_card_fallback(details, reviews, types):
+    """_place_card_fallback의 비동기 버전"""
+    normalized, review_texts = _normalize_reviews(reviews)
+
+    async def keywords():
+        return await aextract_keywords(review_texts) if not _has_no_reviews(normalized) else []
+
+    (summary, no_summary), (keywords, no_keywords), (tags, no_tags) = await asyncio.gather(
+        _abudgeted(_asummary_card(details, reviews, types), None),
+        _abudgeted(keywords(), []),
+        _abudgeted(_aemotion_tags(details.get("name", ""), reviews, types), get_default_emotion_tags_by_types(types)),
+    )
+    card = {"summary": summary, "keywords": keywords, "emotion_tags": tags}
+    return card, no_summary or no_keywords or no_tags
+
+
+def _batch_chunks(pending):
+    for start in range(0, len(pending), PLACE_CARD_BATCH_SIZE):
+        yield pending[start:start + PLACE_CARD_BATCH_SIZE]
+
+
+def _default_card(types):
+    """deadline 안에 만들지 못한 가게 카드 (업태별 기본 감정 태그, 캐시에 저장하지 않음)"""
+    return {"summary": None, "keywords": [], "emotion_tags": get_default_emotion_tags_by_types(types)}
+
+
+def _remaining(end_time):
+    return None if end_time is None else max(0.0, end_time - time.monotonic())
+
+
+def _run_all(calls, end_time):
+    """
+    (fn, *args) 목록을 스레드풀에서 동시에 실행 → 같은 순서의 결과 (실패했거나 end_time까지 못 끝낸 작업은 None)
+    - 못 끝낸 작업은 기다리지 않음 (이미 시작한 호출은 백그라운드에서 마무리되어 캐시에 저장)
+    """
+    if not calls or _remaining(end_time) == 0:
+        return [None] * len(calls)
+    futures = [submit(fn, *args) for fn, *args in calls]
+    wait(futures, timeout=_remaining(end_time))
+
+    results = []
+    for future in futures:
+        if not future.done():
+            future.cancel()
+            results.append(None)
+            continue
+        try:
+            results.append(future.result())
+        except Exception as e:
+            logger.error(f"가게 카드 생성 실패: {e}")
+            results.append(None)
+    return results
+
+
+async def _arun_all(coros, end_time):
+    """_run_all의 비동기 버전 (못 끝낸 작업은 취소)"""
+    if not coros or _remaining(end_time) == 0:
+        for coro in coros:
+            coro.close()
+        return [None] * len(coros)
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    await asyncio.wait(tasks, timeout=_remaining(end_time))
+
+    results = []
+    for task in tasks:
+        if not task.done():
+            task.cancel()
+            results.append(None)
+        elif task.cancelled() or task.exception() is not None:
+            if not task.cancelled():
+                logger.error(f"가게 카드 생성 실패: {task.exception()}")
+            results.append(None)
+        else:
+            results.append(task.result())
+    return results
+
+
+def _place_cards_chunk(chunk):
+    """묶음 1개를 GPT 1회로 생성 → {묶음 안 위치: 카드} (실패하면 빈 dict, 만든 카드는 캐시에 저장)"""
+    try:
+        raw = chat(_place_cards_prompt([item[2] for item in chunk]), kind="place_cards", **_place_cards_params(len(chunk)))
+        parsed = _parse_place_cards(raw, len(chunk))
+    except Exception as e:
+        logger.warning(f"가게 카드 일괄 생성 실패, 가게별 생성으로 대체: {e}")
+        return {}
+
+    for pos, (_, cache_args, _) in enumerate(chunk):
+        if pos in parsed:
+            CacheService.set_gpt_place_card(*cache_args, parsed[pos])
+    return parsed
+
+
+async def _aplace_cards_chunk(chunk):
+    """_place_cards_chunk의 비동기 버전"""
+    try:
+        raw = await achat(_place_cards_prompt([item[2] for item in chunk]), kind="place_cards", **_place_cards_params(len(chunk)))
+        parsed = _parse_place_cards(raw, len(chunk))
+    except Exception as e:
+        logger.warning(f"가게 카드 일괄 생성 실패, 가게별 생성으로 대체: {e}")
+        return {}
+
+    for pos, (_, cache_args, _) in enumerate(chunk):
+        if pos in parsed:
+            await CacheService.aset_gpt_place_card(*cache_args, parsed[pos])
+    return parsed
+
+
+def _stored_fallback(place, cache_args):
+    """
+    _place_card_fallback → 카드 (배치 응답에서 빠진 가게는 결과를 카드로 저장해서 다음 요청에 다시 묶지 않음)
+    - cache_args: 배치 대상이 아니었으면 None
+    """
+    card, degraded = _place_card_fallback(*place)
+    if cache_args is not None and not degraded:
+        CacheService.set_gpt_place_card(*cache_args, card)
+    return card
+
+
+async def _astored_fallback(place, cache_args):
+    """_stored_fallback의 비동기 버전"""
+    card, degraded = await _aplace_card_fallback(*place)
+    if cache_args is not None and not degraded:
+        await CacheService.aset_gpt_place_card(*cache_args, card)
+    return card
+
+
+def _fill_cards(cards, chunks, parsed_chunks):
+    """묶음별 결과를 카드 목록에 채움 → 아직 카드가 없는 가게 index"""
+    for chunk, parsed in zip(chunks, parsed_chunks):
+        for pos, (idx, _, _) in enumerate(chunk):
+            if parsed and pos in parsed:
+                cards[idx] = parsed[pos]
+    return [idx for idx, card in enumerate(cards) if card is None]
+
+
+def _fill_fallbacks(places, cards, missing, fallbacks, deadline):
+    for idx, card in zip(missing, fallbacks):
+        cards[idx] = card or _default_card(places[idx][2])
+    timed_out = sum(card is None for card in fallbacks)
+    if timed_out:
+        logger.warning(f"가게 카드 생성 deadline 초과({deadline}초): {timed_out}개 기본값 사용")
+    return cards
+
+
+def generate_place_cards(places, deadline=None):
+    """
+    여러 가게의 {summary, keywords, emotion_tags}를 한 번에 생성
+    - places: (details, reviews, types) 리스트 → 같은 순서의 카드 리스트
+    - 캐시된 가게는 건너뛰고, 나머지는 PLACE_CARD_BATCH_SIZE개씩 GPT 1회로 처리
+    - 묶음별 호출, 응답에서 빠진 가게의 가게별 생성은 각각 스레드풀에서 동시에 진행
+    - deadline(초): 넘기면 기다리지 않고 못 만든 가게는 기본값 카드 (None이면 끝날 때까지 대기)
+    """
+    end_time = None if deadline is None else time.monotonic() + deadline
+    cards = [None] * len(places)
+    pending = []   # (index, 캐시 키 인자, 배치 입력)
+
+    for idx, (details, reviews, types) in enumerate(places):
+        cache_args, batch_input = _card_cache_args(details, reviews, types)
+        cached = CacheService.cache_gpt_place_card(*cache_args) if batch_input else None
+        if cached:
+            cards[idx] = cached
+        elif batch_input:
+            pending.append((idx, cache_args, batch_input))
+
+    chunks = list(_batch_chunks(pending))
+    missing = _fill_cards(cards, chunks, _run_all([(_place_cards_chunk, chunk) for chunk in chunks], end_time))
+
+    # 배치 대상이 아니었거나 응답에서 빠진 가게
+    pending_args = {idx: cache_args for idx, cache_args, _ in pending}
+    fallbacks = _run_all([(_stored_fallback, places[idx], pending_args.get(idx)) for idx in missing], end_time)
+    return _fill_fallbacks(places, cards, missing, fallbacks, deadline)
+
+
+async def agenerate_place_cards(places, deadline=None):
+    """generate_place_cards의 비동기 버전 (묶음별 GPT 호출/가게별 대체 생성을 동시에 진행, deadline 넘긴 작업은 취소)"""
+    end_time = None if deadline is None else time.monotonic() + deadline
+    cards = [None] * len(places)
+    pending = []
+
+    for idx, (details, reviews, types) in enumerate(places):
+        cache_args, batch_input = _card_cache_args(details, reviews, types)
+        cached = await CacheService.acache_gpt_place_card(*cache_args) if batch_input else None
+        if cached:
+            cards[idx] = cached
+        elif batch_input:
+            pending.append((idx, cache_args, batch_input))
+
+    chunks = list(_batch_chunks(pending))
+    missing = _fill_cards(cards, chunks, await _arun_all([_aplace_cards_chunk(chunk) for chunk in chunks], end_time))
+
+    pending_args = {idx: cache_args for idx, cache_args, _ in pending}
+    fallbacks = await _arun_all([_astored_fallback(places[idx], pending_args.get(idx)) for idx in missing], end_time)
+    return _fill_fallbacks(places, cards, missing, fallbacks, deadline)
+
+
+def generate_place_card(details, reviews, types):
+    """
+    가게 1곳의 {summary, keywords, emotion_tags}를 GPT 1회(JSON 응답)로 생성
+    - 세 결과를 한 묶음으로 캐싱 (generate_place_cards와 같은 캐시 항목)
+    - 리뷰가 없거나 일반 장소, 응답 형식이 틀린 경우는 기존 가게별 함수로 생성
+    """
+    cache_args, batch_input = _card_cache_args(details, reviews, types)
+
+    def compute():
+        if batch_input:
+            try:
+                raw = chat(_place_cards_prompt([batch_input]), kind="place_card", **_place_cards_params(1))
+                card = _parse_place_cards(raw, 1).get(0)
+                if card:
+                    return card
+            except Exception as e:
+                logger.warning(f"가게 카드 생성 실패, 가게별 생성으로 대체: {e}")
+        card, degraded = _place_card_fallback(details, reviews, types)
+        if degraded:
+            raise _DegradedCard(card)
+        return card
+
+    try:
+        return CacheService.get_or_compute('gpt_place_card', _summary_cache_data(*cache_args), compute)
+    except _DegradedCard as e:
+        return e.card
+
+async def agenerate_place_card(details, reviews, types):
+    """generate_place_card의 비동기 버전"""
+    cache_args, batch_input = _card_cache_args(details, reviews, types)
+
+    async def compute():
+        if batch_input:
+            try:
+                raw = await achat(_place_cards_prompt([batch_input]), kind="place_card", **_place_cards_params(1))
+                card = _parse_place_cards(raw, 1).get(0)
+                if card:
+                    return card
+            except Exception as e:
+                logger.warning(f"가게 카드 생성 실패, 가게별 생성으로 대체: {e}")
+        card, degraded = await _aplace_card_fallback(details, reviews, types)
+        if degraded:
+            raise _DegradedCard(card)
+        return card
+
+    try:
+        return await CacheService.aget_or_compute('gpt_place_card', _summary_cache_data(*cache_args), compute)
+    except _DegradedCard as e:
+        return e.card
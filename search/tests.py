@@ -1,3 +1,156 @@
-from django.test import TestCase
+import asyncio
+import time
+import uuid
+from unittest import mock
 
-# Create your tests here.
+from django.test import SimpleTestCase
+
+from recommendations.services.gpt_client import GPTBackpressureError
+from .service import summary_card
+from .service.address_normalizer import normalize_address, to_korean, transliterate_name
+
+from .service.name_matcher import DEFAULT_THRESHOLD
+from .service.relocated_index import RelocatedStoreIndex
+from .service.search import _pick_place
+
+
+class RelocatedFuzzyMatchTests(SimpleTestCase):
+    """이전 가게 CSV 퍼지 매칭 - 자모 partial_ratio가 높게 나오는 엉뚱한 쌍은 매칭되지 않아야 함"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.index = RelocatedStoreIndex.from_csv()
+
+    def _matched_name(self, query):
+        store = self.index.find(query)
+        return store.name_norm if store is not None else None
+
+    def test_unrelated_names_do_not_match(self):
+        for query in ["떡볶이", "엽기떡볶이", "신전떡볶이", "국대떡볶이", "설빙", "곱창", "남산돈까스"]:
+            with self.subTest(query=query):
+                self.assertIsNone(self._matched_name(query))
+
+    def test_missing_geocode_file_is_logged(self):
+        with self.assertLogs("search.service.relocated_index", "WARNING") as logs:
+            index = RelocatedStoreIndex.from_csv(geocode_path="/nonexistent/geocode.json")
+        self.assertIn("geocode_relocated_stores", logs.output[0])
+        self.assertTrue(all(store.previous_lat is None for store in index.stores))
+
+    def test_typos_still_match(self):
+        cases = {
+            "만족돈가스": "만족돈까스",
+            "북천수제돈까스": "북천수제돈가스",
+            "르쏠레이": "르솔레이",
+            "오레노라맨": "오레노라멘",
+        }
+        for query, expected in cases.items():
+            with self.subTest(query=query):
+                matched = self._matched_name(query)
+                self.assertEqual(matched, expected)
+
+
+class PickPlaceTests(SimpleTestCase):
+    """Text Search 후보 중 가게 고르기 - 기본 임계값과 음절 n-gram 공유 조건"""
+
+    def _candidates(self, *names):
+        return [{"name": name, "place_id": f"id-{i}"} for i, name in enumerate(names)]
+
+    def test_unrelated_nearest_is_rejected(self):
+        pairs = [("떡볶이", "버거보이"), ("설빙", "설유가"), ("곱창", "소소막창"), ("남산돈까스", "만족돈까스")]
+        for query, name in pairs:
+            with self.subTest(query=query):
+                self.assertEqual(_pick_place(self._candidates(name), query, DEFAULT_THRESHOLD), (None, None))
+
+    def test_typo_matches_nearest(self):
+        self.assertEqual(_pick_place(self._candidates("만족돈까스", "버거보이"), "만족돈가스", DEFAULT_THRESHOLD)[0], "id-0")
+
+    def test_falls_back_to_best_candidate(self):
+        self.assertEqual(_pick_place(self._candidates("버거보이", "만족돈까스"), "만족돈가스", DEFAULT_THRESHOLD)[0], "id-1")
+
+
+class AddressNormalizerTests(SimpleTestCase):
+    """규칙 기반 주소/가게명 한글 변환 - 사전으로 못 바꾸는 입력은 None (GPT로 넘김)"""
+
+    def test_hangul_input_passes_through(self):
+        self.assertEqual(to_korean("서울 용산구 청파동"), "서울 용산구 청파동")
+
+    def test_english_road_address_is_reordered(self):
+        cases = {
+            "2F, 84 Hangang-daero, Yongsan-gu, Seoul, South Korea": "서울특별시 용산구 한강대로 84 2층",
+            "12 Hangang-daero 84-gil, Yongsan-gu, Seoul": "서울특별시 용산구 한강대로84길 12",
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(normalize_address(text), expected)
+
+    def test_english_lot_address_drops_postal_code(self):
+        self.assertEqual(to_korean("Cheongpa-dong 1-2, Yongsan District, Seoul 04310"), "서울특별시 용산구 청파동 1-2")
+
+    def test_place_name_is_transliterated(self):
+        self.assertEqual(to_korean("Starbucks Itaewon Station"), "스타벅스 이태원역")
+
+    def test_unknown_words_need_gpt(self):
+        self.assertIsNone(to_korean("Zzqx Bistro"))
+        self.assertIsNone(transliterate_name("Starbucks Zzqx"))
+        self.assertIsNone(normalize_address("Seoul"))
+
+
+class PlaceCardConcurrencyTests(SimpleTestCase):
+    """가게 카드 일괄 생성 - 묶음 실패 시 가게별 대체 생성을 동시에, deadline을 넘기면 기본값 카드"""
+
+    CALL_SECONDS = 0.2
+
+    def _places(self, count=5):
+        suffix = uuid.uuid4().hex[:8]
+        return [
+            ({"name": f"카드테스트{suffix}{i}"}, [{"text": f"국밥이 맛있고 친절해요 {suffix}{i}"}], ["restaurant"])
+            for i in range(count)
+        ]
+
+    def _chat(self, prompt, kind=None, **params):
+        if kind == "place_cards":
+            raise GPTBackpressureError("동시 호출 한도 초과")
+        time.sleep(self.CALL_SECONDS)
+        return "국밥, 친절함" if kind == "keywords" else "따뜻한 국밥을 즐길 수 있는 곳이에요"
+
+    async def _achat(self, prompt, kind=None, **params):
+        if kind == "place_cards":
+            raise GPTBackpressureError("동시 호출 한도 초과")
+        await asyncio.sleep(self.CALL_SECONDS)
+        return "국밥, 친절함" if kind == "keywords" else "따뜻한 국밥을 즐길 수 있는 곳이에요"
+
+    def test_failed_batch_falls_back_concurrently(self):
+        places = self._places()
+        with mock.patch.object(summary_card, "chat", side_effect=self._chat):
+            started = time.monotonic()
+            cards = summary_card.generate_place_cards(places)
+            elapsed = time.monotonic() - started
+
+        self.assertEqual(len(cards), len(places))
+        self.assertTrue(all(card["summary"] for card in cards))
+        # 가게 5곳 × 가게별 호출을 순서대로 하면 2초 이상
+        self.assertLess(elapsed, self.CALL_SECONDS * 5)
+
+    def test_deadline_returns_default_cards(self):
+        places = self._places(2)
+        with mock.patch.object(summary_card, "chat", side_effect=self._chat):
+            started = time.monotonic()
+            cards = summary_card.generate_place_cards(places, deadline=0.05)
+            elapsed = time.monotonic() - started
+
+        self.assertLess(elapsed, self.CALL_SECONDS)
+        for card, (_, _, types) in zip(cards, places):
+            self.assertEqual(card, {
+                "summary": None, "keywords": [], "emotion_tags": summary_card.get_default_emotion_tags_by_types(types),
+            })
+
+    def test_async_deadline_returns_default_cards(self):
+        places = self._places(2)
+        with mock.patch.object(summary_card, "achat", side_effect=self._achat):
+            started = time.monotonic()
+            cards = asyncio.run(summary_card.agenerate_place_cards(places, deadline=0.05))
+            elapsed = time.monotonic() - started
+
+        self.assertLess(elapsed, self.CALL_SECONDS)
+        self.assertTrue(all(card["summary"] is None for card in cards))
@@ -5,4 +5,5 @@ app_name = 'search'
 
 urlpatterns = [
     path('store/',views.store_card, name='search_store'),    
+    path('store/async/', views.store_card_async, name='search_store_async'),  # ASGI 비동기 버전
 ]
\ No newline at end of file
@@ -1,6 +1,9 @@
+import asyncio
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
-from .service.summary_card import generate_summary_card, generate_emotion_tags
+from .service.summary_card import generate_place_card, agenerate_place_card
 from .serializers import SearchShopSerializer
 from community.models import Emotion
 from .service.search import *
@@ -9,47 +12,29 @@ from rest_framework.permissions import AllowAny
 from .service.address import *
 
 
-@api_view(['GET'])
-@permission_classes([AllowAny]) 
-def store_card(request):
-    query = request.GET.get("q")
-    lat = request.GET.get("lat")
-    lng = request.GET.get("lng")
+def _parse_store_query(params):
+    """검색 파라미터 검증 → (query, lat, lng, 에러 메시지)"""
+    query = params.get("q")
+    lat = params.get("lat")
+    lng = params.get("lng")
 
     if not query:
-        return Response({"message": "검색어(q)가 필요합니다."}, status=400)
+        return None, None, None, "검색어(q)가 필요합니다."
     if not lat or not lng:
-        return Response({"message": "위도(lat), 경도(lng)가 필요합니다."}, status=400)
+        return None, None, None, "위도(lat), 경도(lng)가 필요합니다."
 
     # float 변환 (문자열 → 숫자)
     try:
         lat = float(lat)
         lng = float(lng)
     except ValueError:
-        return Response({"message": "위도(lat), 경도(lng)는 숫자여야 합니다."}, status=400)
-
-    # 1. 구글 Place ID 찾기 (위치 기반 + 유사도)
-    place_id, place_name = get_place_id(query, lat, lng, threshold=90)
-    if not place_id:
-        return Response({"message": "구글맵에서 가게를 찾을 수 없습니다."}, status=200)
+        return None, None, None, "위도(lat), 경도(lng)는 숫자여야 합니다."
 
-    # 2. 구글 Place 상세 정보
-    details = get_place_details(place_id, place_name)
-    reviews = [r["text"] for r in details.get("reviews", [])]
-    uptaenms = details.get("types", [])
-    
+    return query, lat, lng, None
 
-    # 영문 → 한국어 변환 처리 (GPT API)
-    name = details.get("name")
-    address = details.get("formatted_address")
-
-    name_ko = translate_to_korean(name) if name else None
-    address_ko = translate_to_korean(address) if address else None
-
-    # 3. GPT 요약 카드 / 감정 태그 생성
-    summary = generate_summary_card(details, reviews,uptaenms)
-    tags = generate_emotion_tags(details, reviews, uptaenms)
 
+def _save_store_card(details, name_ko, address_ko, summary, tags):
+    """검색 결과를 SearchShop으로 저장하고 응답 데이터 구성"""
     # 4. Emotion 모델 매핑
     emotion_ids = []
     for tag_name in (tags or []):
@@ -83,7 +68,7 @@ def store_card(request):
     shop = serializer.save()
 
     # 7. 응답
-    return Response({
+    return {
         "message": "가게 정보 반환 성공",
         "store": serializer.data,
         "latitude": details["geometry"]["location"]["lat"],   # 위도
@@ -91,4 +76,59 @@ def store_card(request):
         "summary_card": summary,
         "google_rating": details.get("rating"),
         "photos": photo_url,
-    }, status=200)
+    }
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def store_card(request):
+    query, lat, lng, error = _parse_store_query(request.GET)
+    if error:
+        return Response({"message": error}, status=400)
+
+    # 1. 구글 Place ID 찾기 (위치 기반 + 유사도)
+    place_id, place_name = get_place_id(query, lat, lng, threshold=90)
+    if not place_id:
+        return Response({"message": "구글맵에서 가게를 찾을 수 없습니다."}, status=200)
+
+    # 2. 구글 Place 상세 정보
+    details = get_place_details(place_id, place_name)
+    reviews = [r["text"] for r in details.get("reviews", [])]
+    uptaenms = details.get("types", [])
+
+
+    # 영문 → 한국어 변환 처리 (GPT API)
+    name = details.get("name")
+    address = details.get("formatted_address")
+
+    name_ko = translate_to_korean(name) if name else None
+    address_ko = translate_to_korean(address) if address else None
+
+    # 3. GPT 요약 카드 / 키워드 / 감정 태그 생성 (GPT 1회)
+    card = generate_place_card(details, reviews, uptaenms)
+
+    return Response(_save_store_card(details, name_ko, address_ko, card["summary"], card["emotion_tags"]), status=200)
+
+
+async def store_card_async(request):
+    """store_card의 비동기(ASGI) 버전 - 번역/가게 카드 GPT 호출을 동시에 진행"""
+    query, lat, lng, error = _parse_store_query(request.GET)
+    if error:
+        return JsonResponse({"message": error}, status=400, json_dumps_params={"ensure_ascii": False})
+
+    place_id, place_name = await aget_place_id(query, lat, lng, threshold=90)
+    if not place_id:
+        return JsonResponse({"message": "구글맵에서 가게를 찾을 수 없습니다."}, status=200, json_dumps_params={"ensure_ascii": False})
+
+    details = await aget_place_details(place_id, place_name)
+    reviews = [r["text"] for r in details.get("reviews", [])]
+    uptaenms = details.get("types", [])
+
+    name_ko, address_ko, card = await asyncio.gather(
+        atranslate_to_korean(details.get("name")),
+        atranslate_to_korean(details.get("formatted_address")),
+        agenerate_place_card(details, reviews, uptaenms),
+    )
+
+    data = await sync_to_async(_save_store_card)(details, name_ko, address_ko, card["summary"], card["emotion_tags"])
+    return JsonResponse(data, status=200, json_dumps_params={"ensure_ascii": False})
@@ -0,0 +1,173 @@
+# 프로젝트 공통 미들웨어
+
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from recommendations.services import llm_usage, metrics, tracing
+
+
+def _on_stream_end(response, start, finish):
+    """
+    스트리밍 응답은 get_response가 반환된 뒤에 서버가 본문을 읽음
+    → 본문을 읽기 시작할 때 start(), 다 읽었거나 연결이 끊겨 닫힐 때 finish(start의 반환값) 호출
+    """
+    content = response.streaming_content
+    if response.is_async:
+        async def wrapped():
+            state = start()
+            try:
+                async for chunk in content:
+                    yield chunk
+            finally:
+                finish(state)
+    else:
+        def wrapped():
+            state = start()
+            try:
+                yield from content
+            finally:
+                finish(state)
+    response.streaming_content = wrapped()
+
+
+class TracingMiddleware:
+    """
+    샘플링된 요청의 구간별 소요 시간 기록 + Server-Timing 헤더 (recommendations/services/tracing.py)
+    - settings.TRACING_SAMPLE_RATE가 0이면 로드되지 않음
+    - 동기/비동기 뷰 모두 지원 (MIDDLEWARE 맨 앞에 두어야 다른 미들웨어 시간까지 포함)
+    - 스트리밍 응답은 본문을 다 보낼 때까지 "stream" span을 열어 두고 그 뒤에 타임라인 기록
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if tracing.sample_rate() <= 0:
+            raise MiddlewareNotUsed
+        tracing.install_db_tracing()
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        root = tracing.start_trace(request)
+        if root is None:
+            return self.get_response(request)
+        with root:
+            response = self.get_response(request)
+        return self._finish(root, request, response)
+
+    async def __acall__(self, request):
+        root = tracing.start_trace(request)
+        if root is None:
+            return await self.get_response(request)
+        with root:
+            response = await self.get_response(request)
+        return self._finish(root, request, response)
+
+    @staticmethod
+    def _finish(root, request, response):
+        if not response.streaming:
+            tracing.finish_trace(root, request, response)
+            return response
+
+        stream = tracing.start_stream(root, request, response)
+
+        def finish(_):
+            stream.__exit__(None, None, None)
+            tracing.finish_stream(root)
+
+        _on_stream_end(response, stream.__enter__, finish)
+        return response
+
+
+class MetricsMiddleware:
+    """
+    view별 요청 수/지연 시간, 요청당 DB 쿼리 수 기록 (recommendations/services/metrics.py, /metrics에서 조회)
+    - settings.METRICS_ENABLED가 False면 로드되지 않음
+    - 스트리밍 응답은 본문을 다 보낸 시점까지의 지연 시간/쿼리 수로 기록
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, "METRICS_ENABLED", True):
+            raise MiddlewareNotUsed
+        metrics.install_db_counter()
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        cell = metrics.start_request()
+        started = time.perf_counter()
+        response = self.get_response(request)
+        return self._finish(request, response, started, cell)
+
+    async def __acall__(self, request):
+        cell = metrics.start_request()
+        started = time.perf_counter()
+        response = await self.get_response(request)
+        return self._finish(request, response, started, cell)
+
+    @staticmethod
+    def _finish(request, response, started, cell):
+        def finish(_=None):
+            metrics.finish_request(request, response, time.perf_counter() - started, cell)
+
+        if response.streaming:
+            _on_stream_end(response, lambda: metrics.resume_request(cell), finish)
+        else:
+            finish()
+        return response
+
+
+class LLMUsageMiddleware:
+    """
+    요청 동안 request를 contextvar에 넣어 GPT 호출을 view별로 장부에 기록 (recommendations/services/llm_usage.py)
+    - sync_to_async / asyncio task / copy_context로 넘긴 스레드풀 작업의 GPT 호출도 같은 view로 기록
+    - 스트리밍 응답은 본문을 다 보낼 때까지 request를 다시 넣어 둠 (본문 안의 GPT 호출도 같은 view로 기록)
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        token = llm_usage.set_request(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            llm_usage.reset_request(token)
+        return self._finish(request, response)
+
+    async def __acall__(self, request):
+        token = llm_usage.set_request(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            llm_usage.reset_request(token)
+        return self._finish(request, response)
+
+    @staticmethod
+    def _finish(request, response):
+        if response.streaming:
+            _on_stream_end(response, lambda: llm_usage.set_request(request), llm_usage.reset_request)
+        return response
@@ -54,6 +54,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'spotal.middleware.MetricsMiddleware',  # /metrics 요청 수/지연 시간 (METRICS_ENABLED=False면 로드되지 않음)
+    'spotal.middleware.TracingMiddleware',  # TRACING_SAMPLE_RATE가 0이면 로드되지 않음
+    'spotal.middleware.LLMUsageMiddleware',  # GPT 토큰/비용 장부에 호출한 view 기록
     'corsheaders.middleware.CorsMiddleware', 
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -192,6 +195,19 @@ REST_FRAMEWORK = {
 # }
 
 OPENAI_API_KEY = env('OPENAI_API_KEY')
+OPENAI_TIMEOUT = env.float('OPENAI_TIMEOUT', default=30)              # 요청 타임아웃 (초)
+OPENAI_MAX_RETRIES = env.int('OPENAI_MAX_RETRIES', default=2)
+OPENAI_MAX_CONCURRENCY = env.int('OPENAI_MAX_CONCURRENCY', default=8)  # 프로세스당 동시 호출 수
+OPENAI_QUEUE_TIMEOUT = env.float('OPENAI_QUEUE_TIMEOUT', default=30)  # 호출 슬롯/토큰 예산 대기 한도 (초)
+OPENAI_TPM_LIMIT = env.int('OPENAI_TPM_LIMIT', default=200000)        # 프로세스당 분당 토큰 예산
+LLM_STORE_HIT_FLUSH_INTERVAL = env.float('LLM_STORE_HIT_FLUSH_INTERVAL', default=30)  # 저장된 GPT 응답 재사용 횟수를 DB에 모아서 반영하는 주기 (초)
+
+# OpenAI 비용 장부/하루 예산 (USD, 0이면 한도 없음) - 넘으면 API를 호출하지 않고 캐시/기본값으로 대체
+OPENAI_PRICES = env.json('OPENAI_PRICES', default={})  # {"모델": [입력, 출력] 100만 토큰당 USD}, 기본 가격표를 덮어씀
+OPENAI_DAILY_BUDGET = env.float('OPENAI_DAILY_BUDGET', default=0)
+OPENAI_DAILY_BUDGET_BY_KIND = env.json('OPENAI_DAILY_BUDGET_BY_KIND', default={})  # {"summary": 5.0, ...} 프롬프트 종류별 한도
+OPENAI_BUDGET_REFRESH_INTERVAL = env.float('OPENAI_BUDGET_REFRESH_INTERVAL', default=10)  # 모든 워커 사용액 합계를 다시 읽는 주기 (초)
+GPT_PLACE_CARD_BATCH_SIZE = env.int('GPT_PLACE_CARD_BATCH_SIZE', default=5)  # GPT 1회에 묶는 가게 수 (요약/키워드/감정태그)
 #PUBLIC_DATA_API_KEY = config('PUBLIC_DATA_API_KEY')
 GOOGLE_API_KEY = env('GOOGLE_API_KEY')
 
@@ -223,6 +239,7 @@ CSRF_TRUSTED_ORIGINS = [
 ALLOWED_HOSTS = ["*"]
 
 # 캐시 설정 (성능 최적화)
+# default(L1): 워커 프로세스 내부 LocMem / shared(L2): 같은 서버의 모든 워커가 공유하는 SQLite 파일
 CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
@@ -232,7 +249,46 @@ CACHES = {
             'MAX_ENTRIES': 1000,
             'CULL_FREQUENCY': 3,
         }
-    }
+    },
+    'shared': {
+        'BACKEND': 'recommendations.services.cache_backends.SQLiteCache',
+        'LOCATION': env('SHARED_CACHE_PATH', default=str(BASE_DIR / 'cache' / 'shared_cache.sqlite3')),
+        'TIMEOUT': 86400,
+        'OPTIONS': {
+            'MAX_ENTRIES': 20000,
+            'CULL_FREQUENCY': 10,  # 가득 차면 오래 안 쓴 항목 10% 정리 (LRU)
+        }
+    },
 }
 
-
+# CacheService 계층 설정 (L2 별칭을 비우면 L1만 사용)
+CACHE_SERVICE_L2_ALIAS = env('CACHE_SERVICE_L2_ALIAS', default='shared') or None
+CACHE_SERVICE_L1_TIMEOUT = 300  # L1 최대 보관 시간 (초)
+CACHE_SERVICE_REFRESH_WORKERS = env.int('CACHE_SERVICE_REFRESH_WORKERS', default=4)  # stale 캐시 백그라운드 갱신 스레드 수
+# 캐시 family별 hit/miss 통계 (워커별 파일을 모아서 python manage.py cache_stats로 조회)
+CACHE_METRICS_DIR = env('CACHE_METRICS_DIR', default=str(BASE_DIR / 'cache' / 'metrics'))
+CACHE_METRICS_FLUSH_INTERVAL = env.float('CACHE_METRICS_FLUSH_INTERVAL', default=10)  # 워커별 기록 주기 (초)
+
+# Prometheus 지표 (/metrics, 워커별 파일을 METRICS_DIR에 모아 합산)
+METRICS_ENABLED = env.bool('METRICS_ENABLED', default=True)
+METRICS_DIR = env('METRICS_DIR', default=str(BASE_DIR / 'cache' / 'prometheus'))
+METRICS_FLUSH_INTERVAL = env.float('METRICS_FLUSH_INTERVAL', default=10)  # 워커별 기록 주기 (초)
+METRICS_TOKEN = env('METRICS_TOKEN', default='')  # 설정하면 /metrics에 Authorization: Bearer <토큰> 필요
+
+# 요청 트레이싱 (view/캐시/Google/GPT/DB 구간별 시간, 샘플링된 요청만 기록 + Server-Timing 헤더)
+TRACING_SAMPLE_RATE = env.float('TRACING_SAMPLE_RATE', default=0.0)  # 0이면 끔, 1이면 모든 요청 (X-Trace-Sample: 1 헤더는 항상 기록)
+TRACING_FILE = env('TRACING_FILE', default='')  # JSON Lines 파일 경로, 비우면 spotal.trace 로거로 출력
+TRACING_SERVER_TIMING = env.bool('TRACING_SERVER_TIMING', default=True)
+TRACING_SERVER_TIMING_LIMIT = env.int('TRACING_SERVER_TIMING_LIMIT', default=5)  # Server-Timing에 넣을 상위 구간 수
+
+
+# 추천 후보 병렬 보강 설정
+RECOMMENDATION_ENRICH_WORKERS = env.int('RECOMMENDATION_ENRICH_WORKERS', default=16)  # 프로세스 전체 스레드풀 크기
+RECOMMENDATION_ENRICH_DEADLINE = env.float('RECOMMENDATION_ENRICH_DEADLINE', default=20)  # 요청당 보강 제한 시간 (초)
+# 후보 가게 점수 가중치 (일부만 지정하면 나머지는 recommendations/services/ranking.py의 DEFAULT_WEIGHTS)
+RANKING_WEIGHTS = env.json('RANKING_WEIGHTS', default={})
+
+# Google Maps API 클라이언트 설정 (호출량 제한은 워커 프로세스별)
+GOOGLE_MAPS_RATE_LIMIT = env.float('GOOGLE_MAPS_RATE_LIMIT', default=50)  # 초당 요청 수
+GOOGLE_MAPS_RATE_BURST = env.int('GOOGLE_MAPS_RATE_BURST', default=50)    # 순간 허용 요청 수
+GOOGLE_MAPS_POOL_SIZE = env.int('GOOGLE_MAPS_POOL_SIZE', default=32)      # keep-alive 커넥션 수
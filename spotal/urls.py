@@ -16,9 +16,11 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
+from .views import metrics_view
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('metrics', metrics_view, name='metrics'),  # Prometheus 지표
     path('community/', include('community.urls')),
     path('api/infer/', include('infer.urls')),
     path('api/places/', include('recommendations.urls')),
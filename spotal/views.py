@@ -0,0 +1,16 @@
+from django.conf import settings
+from django.http import HttpResponse
+
+from recommendations.services import metrics
+
+
+def metrics_view(request):
+    """
+    Prometheus 수집용 지표 (모든 워커 합산, text exposition format)
+    - settings.METRICS_TOKEN이 있으면 Authorization: Bearer <토큰> 필요
+    """
+    token = getattr(settings, "METRICS_TOKEN", "")
+    if token and request.headers.get("Authorization") != f"Bearer {token}":
+        return HttpResponse(status=401)
+
+    return HttpResponse(metrics.render(), content_type="text/plain; version=0.0.4; charset=utf-8")